@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - Tree - Streaming XML to Dictionary Module
+================================================
+
+Provides a streaming conversion of XML documents to dictionaries. The
+document is parsed incrementally with `iterparse`, the elements matching
+a tag or path are converted as soon as they are complete, and processed
+elements are dropped from the tree, so memory stays flat however large
+the document is.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+from typing import IO, Any, Callable, Dict, Iterator, List, Tuple, Union
+from xml.etree.ElementTree import Element, iterparse
+
+# Import | Libraries
+
+# Import | Local Modules
+from .etree_to_dict import etree_to_dict
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _tag_matcher(segment: str) -> Callable[[str], bool]:
+    """
+    Return a test of tags against a path segment, ignoring namespaces.
+    """
+    if segment == "*":
+        return lambda tag: True
+    suffix = "}" + segment
+    return lambda tag: tag == segment or tag.endswith(suffix)
+
+
+def iterparse_to_dict(
+    source: Union[str, IO[bytes]], path: str
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the elements of an XML document matching a path, converted
+    with `etree_to_dict`.
+
+    Elements outside the matches are discarded as soon as they end, and
+    each match is discarded once yielded, so only the open elements and
+    the match being built are held in memory.
+
+    Args:
+        source (Union[str, IO[bytes]]): The path to the XML file, or a
+            binary file object.
+        path (str): A tag, such as "entry", matching elements at any depth,
+            or a slash-separated path from the root, such as "feed/entry".
+            Tags match with or without their "{namespace}" prefix, and "*"
+            matches any tag.
+
+    Yields:
+        Dict[str, Any]: The matching elements, in document order. An
+            element matching inside another match is yielded, and also
+            kept in the enclosing match.
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the document is malformed.
+    """
+    matchers = [
+        _tag_matcher(segment) for segment in path.strip("/").split("/")
+    ]
+    anywhere = matchers[0] if len(matchers) == 1 else None
+    # The open elements, and whether each is a match.
+    stack: List[Tuple[Element, bool]] = []
+    # Number of open matches, which keep their descendants.
+    open_matches = 0
+    for event, element in iterparse(source, events=("start", "end")):
+        if event == "start":
+            if anywhere is not None:
+                is_match = anywhere(element.tag)
+            elif len(stack) + 1 == len(matchers):
+                tags = [parent.tag for parent, _ in stack] + [element.tag]
+                is_match = all(map(lambda m, tag: m(tag), matchers, tags))
+            else:
+                is_match = False
+            stack.append((element, is_match))
+            open_matches += is_match
+            continue
+        if stack.pop()[1]:
+            open_matches -= 1
+            yield etree_to_dict(element)
+        if not open_matches and stack:
+            element.clear()
+            stack[-1][0].remove(element)
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "iterparse_to_dict",
+]
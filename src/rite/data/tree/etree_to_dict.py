@@ -1,65 +1,128 @@
-from collections import defaultdict
-from typing import Any, Dict, Union
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - Tree - ElementTree to Dictionary Module
+==============================================
+
+Provides an iterative conversion of ElementTree elements to dictionaries,
+for trees nested deeper than the interpreter's recursion limit.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+from typing import Any, Dict, Iterator, List, Tuple
 from xml.etree.ElementTree import Element
 
+# Import | Libraries
 
-def etree_to_dict(t: Element) -> Dict[str, Any]:
+# Import | Local Modules
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def element_value(element: Element, children: Dict[str, List[Any]]) -> Any:
     """
-    Convert an XML ElementTree node into a nested Python dictionary.
+    Build the value of an XML element from its converted children.
 
     Args:
-        t (Element): The root XML element to convert.
+        element (Element): The XML element.
+        children (Dict[str, List[Any]]): The values of its children, grouped
+            by tag in document order.
 
     Returns:
-        Dict[str, Any]: A dictionary representation of the XML element.
+        Any: A dictionary of the children, attributes ("@" prefixed) and
+            text ("#text"), the text alone, or None for an empty element.
     """
-    tag_dict: Dict[str, Union[dict, str, None]] = {
-        t.tag: {} if t.attrib else None
-    }
-    children = list(t)
-
+    value: Any = None
     if children:
-        child_dict = defaultdict(list)
-        for child in children:
-            for key, value in etree_to_dict(child).items():
-                child_dict[key].append(value)
-        tag_dict[t.tag] = {
-            key: value[0] if len(value) == 1 else value
-            for key, value in child_dict.items()
+        value = {
+            key: items[0] if len(items) == 1 else items
+            for key, items in children.items()
         }
+    if element.attrib:
+        if value is None:
+            value = {}
+        value.update({f"@{k}": v for k, v in element.attrib.items()})
 
-    if t.attrib:
-        tag_dict.setdefault(t.tag, {})
-        tag_dict[t.tag].update({f"@{k}": v for k, v in t.attrib.items()})
-
-    text = (t.text or "").strip()
+    text = (element.text or "").strip()
     if text:
-        if children or t.attrib:
-            tag_dict[t.tag]["#text"] = text
+        if value is not None:
+            value["#text"] = text
         else:
-            tag_dict[t.tag] = text
+            value = text
+    return value
 
-    return tag_dict
+
+def etree_to_dict(t: Element) -> Dict[str, Any]:
+    """
+    Convert an XML ElementTree node into a nested Python dictionary.
+
+    The tree is walked with an explicit stack, so any depth of nesting is
+    supported.
+
+    Args:
+        t (Element): The root XML element to convert.
+
+    Returns:
+        Dict[str, Any]: A dictionary representation of the XML element.
+    """
+    stack: List[Tuple[Element, Iterator[Element], Dict[str, List[Any]]]] = [
+        (t, iter(t), {})
+    ]
+    while True:
+        element, children, grouped = stack[-1]
+        for child in children:
+            if len(child):
+                stack.append((child, iter(child), {}))
+                break
+            # Leaves are converted without a round trip through the stack.
+            grouped.setdefault(child.tag, []).append(element_value(child, {}))
+        else:
+            stack.pop()
+            value = element_value(element, grouped)
+            if not stack:
+                return {element.tag: value}
+            stack[-1][2].setdefault(element.tag, []).append(value)
 
 
 # =============================================================================
 # Exports
 # =============================================================================
 
-__all__ = [
+__all__: List[str] = [
+    "element_value",
     "etree_to_dict",
 ]
 
+
 # =============================================================================
 # Example Usage
 # =============================================================================
 
+if __name__ == "__main__":
+    from xml.etree.ElementTree import fromstring
 
-from xml.etree.ElementTree import fromstring
-
-xml_str = "<book id='123'><title>Python</title><author>Lars</author></book>"
-root = fromstring(xml_str)
-result = etree_to_dict(root)
+    xml_str = (
+        "<book id='123'><title>Python</title><author>Lars</author></book>"
+    )
+    root = fromstring(xml_str)
+    result = etree_to_dict(root)
 
-print(result)
-# ➜ {'book': {'@id': '123', 'title': 'Python', 'author': 'Lars'}}
+    print(result)
+    # ➜ {'book': {'@id': '123', 'title': 'Python', 'author': 'Lars'}}
@@ -0,0 +1,455 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - Read CSV File Module
+===========================
+
+This module reads CSV files in chunks of rows, returned by column, with
+each column converted to its type. The dialect and header are sniffed
+from a sample of the file, and the column types can be given or inferred
+from the first chunk, or from every row when reading a whole file.
+Columns are lists, or NumPy arrays when NumPy is installed and
+requested.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import contextlib
+import csv
+import io
+import itertools
+import math
+import re
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+# Import | Libraries
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Import | Local Modules
+from ...convert.to_bool import FALSY, TRUTHY, to_bool
+from ...convert.to_number import to_number
+from .file_csv_open import open_csv
+from .format_csv_delim import sniff_dialect
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_CHUNK_SIZE = 65536
+
+DEFAULT_SAMPLE_SIZE = 16384
+
+# The words of to_bool, in lower, title and upper case.
+_BOOLS = {
+    variant: words is TRUTHY
+    for words in (TRUTHY, FALSY)
+    for value in words
+    for variant in (value, value.title(), value.upper())
+}
+
+# Values that to_bool accepts but that are more likely numbers or text.
+_AMBIGUOUS_BOOLS = {"", "0", "1"}
+
+# Plain decimal and float literals, without the NaN, infinity and digit
+# separators that `float` also accepts.
+_DECIMAL = re.compile(r"\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*")
+
+TypeSpec = Union[str, Callable[[str], Any], None]
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def parse_number(value: str) -> Union[int, float, None]:
+    """
+    Parses a number like `to_number`, trying plain integer and float
+    literals first.
+
+    Parameters:
+        value (str): The text of a cell.
+
+    Returns
+    -------
+        Union[int, float, None]: The number, an int for an integer
+        literal, or None if the cell holds none.
+    """
+    number = _parse_decimal(value)
+    return to_number(value) if number is None else number
+
+
+def _parse_decimal(value: str) -> Union[int, float, None]:
+    """
+    Parses a plain integer or float literal, the numbers of inferred
+    columns, or returns None. Integers are kept exact, beyond the 53 bits
+    of a float. `float` is tried before the pattern, as it is faster.
+    """
+    if value.isdecimal():
+        return int(value)
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    if "_" in value:
+        return None
+    if not math.isfinite(number):
+        return number if _DECIMAL.fullmatch(value) else None
+    if "." in value or "e" in value or "E" in value:
+        return number
+    # Signed or padded integers.
+    return int(value)
+
+
+def parse_bool(value: str) -> Optional[bool]:
+    """
+    Parses a boolean like `to_bool`, looking up exact matches first.
+
+    Parameters:
+        value (str): The text of a cell.
+
+    Returns
+    -------
+        Optional[bool]: The boolean, or None if the cell holds none.
+    """
+    result = _BOOLS.get(value)
+    return to_bool(value) if result is None else result
+
+
+CONVERTERS: Dict[str, Optional[Callable[[str], Any]]] = {
+    "str": None,
+    "number": parse_number,
+    "bool": parse_bool,
+}
+
+
+def infer_type(values: Iterable[str]) -> str:
+    """
+    Infers the type of a column from its values. Empty cells are ignored.
+
+    Parameters:
+        values (Iterable[str]): The text of the cells.
+
+    Returns
+    -------
+        str: "bool" if every value is a boolean word, "number" if every
+        value is a plain integer or float literal, "str" otherwise.
+    """
+    values = set(values)
+    # Numbers first: the only numeric boolean words, 0 and 1, are
+    # ambiguous, and the raw text parses as it is.
+    if all(_parse_decimal(v) is not None or not v.strip() for v in values):
+        return "number" if any(map(str.strip, values)) else "str"
+    words = set()
+    for value in values:
+        word = value.strip().lower()
+        if word not in _BOOLS:
+            return "str"
+        words.add(word)
+    words.discard("")
+    if words and not words <= _AMBIGUOUS_BOOLS:
+        return "bool"
+    return "str"
+
+
+# The converters of inferred types, which reject what does not fit.
+_INFERRED: Dict[str, Optional[Callable[[str], Any]]] = {
+    **CONVERTERS,
+    "number": _parse_decimal,
+}
+
+
+def _converter(spec: TypeSpec) -> Optional[Callable[[str], Any]]:
+    """
+    Returns the converter of a type name or callable.
+    """
+    if spec is None or callable(spec):
+        return spec
+    if spec not in CONVERTERS:
+        raise ValueError(f"Unknown column type: {spec}")
+    return CONVERTERS[spec]
+
+
+def _open(
+    file: IO[str], dialect: Any, sample_size: int
+) -> Tuple[Iterator[List[str]], bool]:
+    """
+    Starts a CSV reader, sniffing the dialect and header from a sample.
+    """
+    sample = file.read(sample_size)
+    if sample:
+        sample += file.readline()
+    # The sample is read again, without seeking, so streams work too.
+    lines = itertools.chain(io.StringIO(sample, newline=""), file)
+    has_header = True
+    if dialect is None:
+        dialect, has_header = sniff_dialect(sample)
+    return filter(None, csv.reader(lines, dialect)), has_header
+
+
+def _converters(
+    names: List[str],
+    rows: List[List[str]],
+    types: Union[str, Mapping[str, TypeSpec], None],
+) -> List[Optional[Callable[[str], Any]]]:
+    """
+    Returns the converter of each column, inferring types from rows.
+    """
+    if types is None:
+        return [None] * len(names)
+    if types == "infer":
+        columns = itertools.zip_longest(*rows, fillvalue="")
+        inferred = [_INFERRED[infer_type(column)] for column in columns]
+        return (inferred + [None] * len(names))[: len(names)]
+    if isinstance(types, str):
+        raise ValueError(f"Unknown column types: {types}")
+    return [_converter(types.get(name)) for name in names]
+
+
+def _columns(
+    rows: List[List[str]],
+    converters: List[Optional[Callable[[str], Any]]],
+    use_numpy: bool,
+    widen: bool,
+) -> List[Sequence[Any]]:
+    """
+    Transposes rows to columns and converts them. Short rows are padded
+    with empty cells and extra cells are dropped. To widen, a column with
+    a cell that fails to convert is kept as text, and its converter is
+    dropped for the next chunks.
+    """
+    width = len(converters)
+    columns: List[Sequence[Any]] = list(
+        itertools.zip_longest(*rows, fillvalue="")
+    )[:width]
+    columns += [("",) * len(rows)] * (width - len(columns))
+    for index, convert in enumerate(converters):
+        column = columns[index]
+        values = list(column if convert is None else map(convert, column))
+        if widen and convert is not None and _failed(column, values):
+            converters[index] = convert = None
+            values = list(column)
+        columns[index] = _array(values, convert) if use_numpy else values
+    return columns
+
+
+def _failed(column: Sequence[str], values: List[Any]) -> bool:
+    """
+    Checks if a cell with text converted to None.
+    """
+    if None not in values:
+        return False
+    return any(v is None and t.strip() for t, v in zip(column, values))
+
+
+def _array(column: List[Any], convert: Optional[Callable[[str], Any]]):
+    """
+    Converts a column to a NumPy array: int for integers without missing
+    values, or object beyond 64 bits, float for other numbers, with NaN
+    for missing values, bool for booleans without missing values, and
+    object otherwise.
+    """
+    if convert is parse_number or convert is _parse_decimal:
+        if None in column or any(type(v) is float for v in column):
+            return numpy.array(column, dtype=float)
+        return numpy.array(column)
+    if convert is parse_bool and None not in column:
+        return numpy.array(column, dtype=bool)
+    return numpy.array(column, dtype=object)
+
+
+def _chunks(
+    rows: Iterator[List[str]],
+    names: List[str],
+    chunk_size: int,
+    types: Union[str, Mapping[str, TypeSpec], None],
+    use_numpy: bool,
+) -> Iterator[Dict[str, Sequence[Any]]]:
+    """
+    Groups rows in chunks and converts them to columns.
+    """
+    converters = None
+    widen = types == "infer"
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            return
+        if converters is None:
+            if not names:
+                width = max(map(len, chunk))
+                names = [f"column_{i + 1}" for i in range(width)]
+            converters = _converters(names, chunk, types)
+        yield dict(zip(names, _columns(chunk, converters, use_numpy, widen)))
+
+
+def iter_csv_chunks(
+    path_or_resource: Any,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    types: Union[str, Mapping[str, TypeSpec], None] = None,
+    fieldnames: Optional[Sequence[str]] = None,
+    header: Optional[bool] = True,
+    dialect: Any = None,
+    use_numpy: bool = False,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+) -> Iterator[Dict[str, Sequence[Any]]]:
+    """
+    Reads a CSV file in chunks of rows, by column. Blank lines are
+    skipped, like `csv.DictReader`.
+
+    Parameters:
+        path_or_resource (Any): The path or resource, opened with
+        `open_csv`, or a text file opened with newline="".
+        chunk_size (int): The number of rows per chunk.
+        types (Union[str, Mapping[str, TypeSpec], None]): None to keep
+        every column as text, "infer" to infer the types from the first
+        chunk, or a type by column: "str", "number", "bool" or a callable
+        converting the text of a cell. Other columns are kept as text. An
+        inferred column with a later cell that does not fit its type is
+        kept as text from that chunk on.
+        fieldnames (Optional[Sequence[str]]): The column names, instead of
+        the header row. Without either, columns are named "column_1",
+        "column_2" and so on.
+        header (Optional[bool]): Whether the first row is a header, or None
+        to guess it from the cell types, which can miss the header of an
+        all-text file. A header is assumed when the dialect is given.
+        dialect (Any): A csv dialect or its name, or None to sniff it.
+        use_numpy (bool): Return NumPy arrays instead of lists.
+        sample_size (int): The number of characters to sniff.
+
+    Yields
+    ------
+        Dict[str, Sequence[Any]]: The converted columns of each chunk.
+
+    Raises:
+        ValueError: If a column type is unknown or NumPy is requested but
+        not installed.
+    """
+    if use_numpy and numpy is None:
+        raise ValueError("NumPy output requires numpy")
+    if hasattr(path_or_resource, "read"):
+        opened = contextlib.nullcontext(path_or_resource)
+    else:
+        opened = open_csv(path_or_resource)
+    with opened as file:
+        rows, sniffed = _open(file, dialect, sample_size)
+        if header is None:
+            header = sniffed
+        names = next(rows, []) if header else []
+        if fieldnames is not None:
+            names = list(fieldnames)
+        yield from _chunks(rows, names, chunk_size, types, use_numpy)
+
+
+def read_csv_columns(
+    path_or_resource: Any, **options: Any
+) -> Dict[str, Sequence[Any]]:
+    """
+    Reads a whole CSV file by column. See `iter_csv_chunks`. Inferred
+    types are inferred from every row, so each column has a single type.
+
+    Parameters:
+        path_or_resource (Any): The path or resource, opened with
+        `open_csv`, or a text file opened with newline="".
+        **options (Any): Options of `iter_csv_chunks`.
+
+    Returns
+    -------
+        Dict[str, Sequence[Any]]: The converted columns.
+
+    Raises:
+        ValueError: If a column type is unknown or NumPy is requested but
+        not installed.
+    """
+    if options.get("types") == "infer":
+        use_numpy = options.get("use_numpy", False)
+        if use_numpy and numpy is None:
+            raise ValueError("NumPy output requires numpy")
+        options = {**options, "types": None, "use_numpy": False}
+        columns = read_csv_columns(path_or_resource, **options)
+        for name, column in columns.items():
+            convert = _INFERRED[infer_type(column)]
+            if convert is not None:
+                column = list(map(convert, column))
+            columns[name] = _array(column, convert) if use_numpy else column
+        return columns
+    chunks = list(iter_csv_chunks(path_or_resource, **options))
+    if len(chunks) <= 1:
+        return chunks[0] if chunks else {}
+    columns: Dict[str, Sequence[Any]] = {}
+    for name in chunks[0]:
+        parts = [chunk[name] for chunk in chunks]
+        if isinstance(parts[0], list):
+            columns[name] = list(itertools.chain.from_iterable(parts))
+        else:
+            columns[name] = numpy.concatenate(parts)
+    return columns
+
+
+def iter_csv_records(
+    path_or_resource: Any, **options: Any
+) -> Iterator[Dict[str, Any]]:
+    """
+    Reads the rows of a CSV file as dictionaries of converted values, like
+    a typed `csv.DictReader`. See `iter_csv_chunks`.
+
+    Parameters:
+        path_or_resource (Any): The path or resource, opened with
+        `open_csv`, or a text file opened with newline="".
+        **options (Any): Options of `iter_csv_chunks`.
+
+    Yields
+    ------
+        Dict[str, Any]: The rows.
+    """
+    for chunk in iter_csv_chunks(path_or_resource, **options):
+        names = list(chunk)
+        for row in zip(*chunk.values()):
+            yield dict(zip(names, row))
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "CONVERTERS",
+    "DEFAULT_CHUNK_SIZE",
+    "DEFAULT_SAMPLE_SIZE",
+    "TypeSpec",
+    "infer_type",
+    "iter_csv_chunks",
+    "iter_csv_records",
+    "parse_bool",
+    "parse_number",
+    "read_csv_columns",
+]
@@ -1,7 +1,43 @@
-def detect_delimiter(filename: str) -> str:
+import csv
+from typing import Optional, Tuple, Type
+
+DELIMITERS = ",;\t|"
+
+
+def detect_delimiter(filename: str, sample: Optional[str] = None) -> str:
     """
-    Detect the delimiter used in a CSV file based on its filename.
+    Detect the delimiter used in a CSV file from a sample of its content,
+    or, without a sample or when it is inconclusive, from its filename.
     """
+    if sample:
+        try:
+            return csv.Sniffer().sniff(sample, DELIMITERS).delimiter
+        except csv.Error:
+            pass
     if filename.endswith(".tsv"):
         return "\t"
     return ","
+
+
+def sniff_dialect(
+    sample: str, delimiters: str = DELIMITERS
+) -> Tuple[Type[csv.Dialect], bool]:
+    """
+    Detect the dialect of a CSV file, and whether it has a header row,
+    from a sample of its content. An inconclusive sample gives the Excel
+    dialect with the most frequent of the delimiters.
+    """
+    sniffer = csv.Sniffer()
+    try:
+        dialect = sniffer.sniff(sample, delimiters)
+    except csv.Error:
+        line = sample.split("\n", 1)[0]
+        delimiter = max(delimiters, key=line.count)
+        if delimiter not in line:
+            delimiter = ","
+        dialect = type("sniffed", (csv.excel,), {"delimiter": delimiter})
+    try:
+        has_header = sniffer.has_header(sample)
+    except csv.Error:
+        has_header = True
+    return dialect, has_header
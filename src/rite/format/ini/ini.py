@@ -23,11 +23,21 @@ from __future__ import annotations
 
 # Import | Standard Library
 import configparser
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
 
 # Import | Libraries
 
 # Import | Local Modules
+from .ini_cache import ConfigWatcher, FrozenConfig, load_config
+from .ini_edit import INIDocument, edit_ini_file, update_ini_file
 
 
 # =============================================================================
@@ -45,10 +55,18 @@ class INIHandler(object):
     --------
     load_ini(file_path: str) -> configparser.ConfigParser:
         Loads an INI configuration file.
+    load_config(file_path: str) -> FrozenConfig:
+        Loads a read-only INI configuration through the shared cache.
+    watch_ini(file_path: str, callback: Callable, interval: float = 1.0) -> ConfigWatcher:
+        Reloads an INI configuration whenever the file changes.
     save_ini(config: configparser.ConfigParser, file_path: str):
         Saves a ConfigParser object to an INI file.
     update_ini(config: configparser.ConfigParser, section: str, updates: Dict[str, Any]):
         Updates a section in the ConfigParser object.
+    edit_ini(file_path: str, atomic: bool = True, fsync: str = "none") -> ContextManager[INIDocument]:
+        Edits an INI file in a batch, preserving comments, and writes it once.
+    update_ini_file(file_path: str, updates: Dict[str, Optional[Dict[str, Any]]], atomic: bool = True, fsync: str = "none") -> bool:
+        Applies a batch of edits to an INI file and writes it once.
     get_value(config: configparser.ConfigParser, section: str, key: str, fallback: Optional[Any] = None) -> Any:
         Gets a value from a section in the ConfigParser object.
     add_section(config: configparser.ConfigParser, section: str):
@@ -82,6 +100,46 @@ class INIHandler(object):
         config.read(file_path)
         return config
 
+    @staticmethod
+    def load_config(file_path: str) -> FrozenConfig:
+        """
+        Loads a read-only INI configuration through a process-wide cache.
+        The file is parsed again only when its modification time, size or
+        inode changed, and the values are interpolated once, so
+        `get_value` and `has_key` on the result are dictionary lookups.
+
+        Parameters:
+            file_path (str): Path to the INI file.
+
+        Returns
+        -------
+            FrozenConfig: The configuration.
+        """
+        return load_config(file_path)
+
+    @staticmethod
+    def watch_ini(
+        file_path: str,
+        callback: Callable[[FrozenConfig], Any],
+        interval: float = 1.0,
+    ) -> ConfigWatcher:
+        """
+        Polls an INI file from a background thread and calls back with the
+        new configuration whenever it changes. Stop the returned watcher,
+        or use it as a context manager, to end polling.
+
+        Parameters:
+            file_path (str): Path to the INI file.
+            callback (Callable[[FrozenConfig], Any]): Called with each new
+            configuration.
+            interval (float): Seconds between checks.
+
+        Returns
+        -------
+            ConfigWatcher: The started watcher.
+        """
+        return ConfigWatcher(file_path, callback, interval).start()
+
     @staticmethod
     def save_ini(config: configparser.ConfigParser, file_path: str):
         """
@@ -113,9 +171,57 @@ class INIHandler(object):
         for key, value in updates.items():
             config.set(section, key, str(value))
 
+    @staticmethod
+    def edit_ini(
+        file_path: str, atomic: bool = True, fsync: str = "none"
+    ) -> ContextManager[INIDocument]:
+        """
+        Opens an INI file for a batch of edits, made on its text so
+        comments, ordering and formatting are preserved. The file is
+        written once when the block exits, atomically, and only if it
+        changed.
+
+        Parameters:
+            file_path (str): Path to the INI file, created if missing.
+            atomic (bool): Write to a temporary file and rename it over the
+            INI file.
+            fsync (str): "none", "file" or "full".
+
+        Returns
+        -------
+            ContextManager[INIDocument]: The document to edit.
+        """
+        return edit_ini_file(file_path, atomic, fsync)
+
+    @staticmethod
+    def update_ini_file(
+        file_path: str,
+        updates: Dict[str, Optional[Dict[str, Any]]],
+        atomic: bool = True,
+        fsync: str = "none",
+    ) -> bool:
+        """
+        Applies a batch of edits to an INI file and writes it once, like
+        `edit_ini`.
+
+        Parameters:
+            file_path (str): Path to the INI file, created if missing.
+            updates (Dict[str, Optional[Dict[str, Any]]]): Values to set, by
+            section and key. A section mapped to None is removed, and a key
+            mapped to None is removed from its section.
+            atomic (bool): Write to a temporary file and rename it over the
+            INI file.
+            fsync (str): "none", "file" or "full".
+
+        Returns
+        -------
+            bool: True if the file changed.
+        """
+        return update_ini_file(file_path, updates, atomic, fsync)
+
     @staticmethod
     def get_value(
-        config: configparser.ConfigParser,
+        config: Union[configparser.ConfigParser, FrozenConfig],
         section: str,
         key: str,
         fallback: Optional[Any] = None,
@@ -124,7 +230,8 @@ class INIHandler(object):
         Gets a value from a section in the ConfigParser object.
 
         Parameters:
-            config (configparser.ConfigParser): The ConfigParser object.
+            config (Union[configparser.ConfigParser, FrozenConfig]): The
+            configuration.
             section (str): The section from which to get the value.
             key (str): The key for the value to get.
             fallback (Optional[Any]): The default value to return if the key
@@ -135,6 +242,8 @@ class INIHandler(object):
             Any: The value from the specified section and key, or the fallback
             value.
         """
+        if isinstance(config, FrozenConfig):
+            return config.get(section, key, fallback)
         return config.get(section, key, fallback=fallback)
 
     @staticmethod
@@ -173,12 +282,15 @@ class INIHandler(object):
         return config.remove_section(section)
 
     @staticmethod
-    def list_sections(config: configparser.ConfigParser) -> List[str]:
+    def list_sections(
+        config: Union[configparser.ConfigParser, FrozenConfig],
+    ) -> List[str]:
         """
         Lists all sections in the configuration.
 
         Parameters:
-            config (configparser.ConfigParser): The ConfigParser object.
+            config (Union[configparser.ConfigParser, FrozenConfig]): The
+            configuration.
 
         Returns
         -------
@@ -188,32 +300,38 @@ class INIHandler(object):
 
     @staticmethod
     def list_keys(
-        config: configparser.ConfigParser, section: str
+        config: Union[configparser.ConfigParser, FrozenConfig], section: str
     ) -> List[str]:
         """
         Lists all keys in a specific section.
 
         Parameters:
-            config (configparser.ConfigParser): The ConfigParser object.
+            config (Union[configparser.ConfigParser, FrozenConfig]): The
+            configuration.
             section (str): The section to list keys from.
 
         Returns
         -------
             List[str]: A list of key names in the section.
         """
+        if isinstance(config, FrozenConfig):
+            return config.keys(section)
         if config.has_section(section):
             return list(config[section])
         return []
 
     @staticmethod
     def has_key(
-        config: configparser.ConfigParser, section: str, key: str
+        config: Union[configparser.ConfigParser, FrozenConfig],
+        section: str,
+        key: str,
     ) -> bool:
         """
         Checks if a specific key exists in a section.
 
         Parameters:
-            config (configparser.ConfigParser): The ConfigParser object.
+            config (Union[configparser.ConfigParser, FrozenConfig]): The
+            configuration.
             section (str): The section to check.
             key (str): The key to check for.
 
@@ -221,6 +339,8 @@ class INIHandler(object):
         -------
             bool: True if the key exists in the section, False otherwise.
         """
+        if isinstance(config, FrozenConfig):
+            return config.has(section, key)
         return config.has_option(section, key)
 
     @staticmethod
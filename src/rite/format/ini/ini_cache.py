@@ -0,0 +1,391 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - INI Cache Module
+=======================
+
+This module provides a process-wide cache of parsed INI files. A file is
+parsed once per version, identified by its modification time, size and
+inode, and kept as a frozen table of fully interpolated values, so reads
+are dictionary lookups. A polling watcher reloads a file when it changes
+and notifies a callback.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import configparser
+import logging
+import os
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# The version of a file: modification time, size and inode, or None when
+# the file does not exist.
+Stamp = Optional[Tuple[int, int, int]]
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def file_stamp(file_path: str) -> Stamp:
+    """
+    Returns the version of a file, which changes whenever it is written or
+    replaced.
+
+    Parameters:
+        file_path (str): The path to the file.
+
+    Returns
+    -------
+        Stamp: The modification time in nanoseconds, size and inode, or
+        None if the file does not exist.
+    """
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class FrozenConfig:
+    """
+    A read-only snapshot of an INI configuration, with every value
+    interpolated once and stored by section and key.
+
+    Keys follow ConfigParser: they are case-insensitive, and the values of
+    the DEFAULT section are visible in every section.
+    """
+
+    __slots__ = ("_values", "_sections", "stamp")
+
+    def __init__(self, config: configparser.ConfigParser, stamp: Stamp = None):
+        """
+        Freezes a ConfigParser object.
+
+        Parameters:
+            config (configparser.ConfigParser): The configuration.
+            stamp (Stamp): The version of the file it was read from.
+
+        Raises:
+            configparser.InterpolationError: If a value cannot be
+            interpolated.
+        """
+        values: Dict[Tuple[str, str], str] = {}
+        sections: Dict[str, Tuple[str, ...]] = {}
+        for section in [config.default_section] + config.sections():
+            items = config.items(section)
+            if section != config.default_section:
+                # Own keys first, then the defaults, as in config[section].
+                sections[section] = tuple(config[section])
+            for key, value in items:
+                values[(section, key)] = value
+        self._values = MappingProxyType(values)
+        self._sections = MappingProxyType(sections)
+        self.stamp = stamp
+
+    def get(self, section: str, key: str, fallback: Any = None) -> Any:
+        """
+        Gets a value.
+
+        Parameters:
+            section (str): The section of the value.
+            key (str): The key of the value.
+            fallback (Any): The value to return if the key is not found.
+
+        Returns
+        -------
+            Any: The value, or the fallback.
+        """
+        return self._values.get((section, key.lower()), fallback)
+
+    def has(self, section: str, key: str) -> bool:
+        """
+        Checks if a key exists in a section.
+
+        Parameters:
+            section (str): The section to check.
+            key (str): The key to check for.
+
+        Returns
+        -------
+            bool: True if the key exists in the section, False otherwise.
+        """
+        return (section, key.lower()) in self._values
+
+    def sections(self) -> List[str]:
+        """
+        Lists the sections, without the DEFAULT section.
+
+        Returns
+        -------
+            List[str]: The section names, in file order.
+        """
+        return list(self._sections)
+
+    def keys(self, section: str) -> List[str]:
+        """
+        Lists the keys of a section, including the defaults.
+
+        Parameters:
+            section (str): The section to list keys from.
+
+        Returns
+        -------
+            List[str]: The keys, or an empty list if there is no such
+            section, as for the DEFAULT section.
+        """
+        return list(self._sections.get(section, ()))
+
+    def as_dict(self) -> Dict[str, Dict[str, str]]:
+        """
+        Returns the configuration as nested dictionaries.
+
+        Returns
+        -------
+            Dict[str, Dict[str, str]]: The values by section and key,
+            with the defaults merged into each section.
+        """
+        return {
+            section: {key: self._values[(section, key)] for key in keys}
+            for section, keys in self._sections.items()
+        }
+
+
+class ConfigCache:
+    """
+    A thread-safe cache of frozen INI files, keyed by path and
+    revalidated against the file's version on every load.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty cache.
+        """
+        self._entries: Dict[str, FrozenConfig] = {}
+        self._lock = threading.Lock()
+
+    def load(self, file_path: str) -> FrozenConfig:
+        """
+        Loads an INI file, parsing it only if it changed since it was last
+        loaded. A missing file loads as an empty configuration, like
+        `ConfigParser.read`.
+
+        Parameters:
+            file_path (str): The path to the INI file.
+
+        Returns
+        -------
+            FrozenConfig: The configuration.
+
+        Raises:
+            configparser.Error: If the file cannot be parsed or
+            interpolated.
+        """
+        path = os.path.abspath(file_path)
+        stamp = file_stamp(path)
+        entry = self._entries.get(path)
+        if entry is not None and entry.stamp == stamp:
+            return entry
+        config = configparser.ConfigParser()
+        if stamp is not None:
+            with open(path, encoding="utf-8") as file:
+                config.read_file(file, path)
+        entry = FrozenConfig(config, stamp)
+        with self._lock:
+            self._entries[path] = entry
+        return entry
+
+    def invalidate(self, file_path: Optional[str] = None):
+        """
+        Drops a file, or every file, from the cache.
+
+        Parameters:
+            file_path (Optional[str]): The path to drop, or None for all.
+        """
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(file_path), None)
+
+
+class ConfigWatcher:
+    """
+    Polls an INI file from a background thread and calls back with the
+    new configuration whenever the file changes.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        callback: Callable[[FrozenConfig], Any],
+        interval: float = 1.0,
+        cache: Optional[ConfigCache] = None,
+    ):
+        """
+        Initializes the watcher with the current configuration.
+
+        Parameters:
+            file_path (str): The path to the INI file.
+            callback (Callable[[FrozenConfig], Any]): Called from the
+            watcher thread with each new configuration.
+            interval (float): Seconds between checks.
+            cache (Optional[ConfigCache]): The cache to load through,
+            the shared cache by default.
+        """
+        self.file_path = file_path
+        self.callback = callback
+        self.interval = interval
+        self.cache = CACHE if cache is None else cache
+        self.config = self.cache.load(file_path)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _reload(self) -> Optional[FrozenConfig]:
+        """
+        Reloads the file, returning the new configuration, or None if it
+        is unchanged or missing. A missing file, such as one being
+        replaced, keeps the previous configuration.
+        """
+        config = self.cache.load(self.file_path)
+        if config is self.config or config.stamp is None:
+            return None
+        self.config = config
+        return config
+
+    def check(self) -> bool:
+        """
+        Reloads the file and calls back if it changed. A missing file keeps
+        the previous configuration.
+
+        Returns
+        -------
+            bool: True if the configuration changed.
+        """
+        config = self._reload()
+        if config is None:
+            return False
+        self.callback(config)
+        return True
+
+    def _run(self):
+        """
+        Checks the file until the watcher is stopped. A file that fails to
+        load keeps the previous configuration until it changes again, and
+        errors of the reload and the callback are logged, so the thread
+        keeps running.
+        """
+        failed: Stamp = None
+        while not self._stop.wait(self.interval):
+            stamp = file_stamp(self.file_path)
+            if stamp is None or stamp == failed:
+                continue
+            try:
+                config = self._reload()
+            except Exception:
+                failed = stamp
+                logging.exception("Failed to reload %s", self.file_path)
+                continue
+            if config is None:
+                continue
+            try:
+                self.callback(config)
+            except Exception:
+                logging.exception("Callback failed for %s", self.file_path)
+
+    def start(self) -> ConfigWatcher:
+        """
+        Starts the watcher thread.
+
+        Returns
+        -------
+            ConfigWatcher: The watcher.
+        """
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="ConfigWatcher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops the watcher thread and waits for it to exit.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> ConfigWatcher:
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+CACHE = ConfigCache()
+
+
+def load_config(file_path: str) -> FrozenConfig:
+    """
+    Loads an INI file through the shared cache. See `ConfigCache.load`.
+
+    Parameters:
+        file_path (str): The path to the INI file.
+
+    Returns
+    -------
+        FrozenConfig: The configuration.
+    """
+    return CACHE.load(file_path)
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "CACHE",
+    "ConfigCache",
+    "ConfigWatcher",
+    "FrozenConfig",
+    "Stamp",
+    "file_stamp",
+    "load_config",
+]
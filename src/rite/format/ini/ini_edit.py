@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - INI Edit Module
+======================
+
+This module edits INI files in place of their text rather than through
+ConfigParser, so comments, blank lines, ordering and formatting survive.
+Only the lines of the keys and sections that change are rewritten. A
+batch of edits is applied in memory and the file is written once,
+atomically, and only if it changed.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import contextlib
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Import | Libraries
+
+# Import | Local Modules
+from ...path.file.file_atomic import open_output
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+_SECTION = re.compile(r"\[(?P<name>.+)\]")
+_OPTION = re.compile(r"(?P<key>[^=:\s][^=:]*?)\s*[=:]\s*")
+_COMMENT_PREFIXES = ("#", ";")
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class _Section:
+    """
+    The lines of one section: the comments directly above its header, the
+    header, and its body. The lines before the first header have no name
+    and no header.
+    """
+
+    __slots__ = ("name", "lines", "header")
+
+    def __init__(self, name: Optional[str], lines: List[str], header: int):
+        self.name = name
+        self.lines = lines
+        self.header = header
+
+    def find(self, key: str) -> Optional[Tuple[int, int, re.Match]]:
+        """
+        Finds the lines of a key, with its continuation lines and the blank
+        lines and comments between them.
+        """
+        lines = self.lines
+        index = self.header + 1
+        while index < len(lines):
+            line = lines[index]
+            index += 1
+            match = _OPTION.match(line)
+            if match is None or _is_comment(line):
+                continue
+            if match.group("key").lower() != key:
+                continue
+            return index - 1, _end_of_value(lines, index), match
+        return None
+
+    def end_of_options(self) -> int:
+        """
+        Returns the index after the last option line, or after the header.
+        """
+        index = len(self.lines)
+        while index > self.header + 1 and _is_trivia(self.lines[index - 1]):
+            index -= 1
+        return index
+
+
+class INIDocument:
+    """
+    The text of an INI file, edited line by line.
+
+    Section names are case-sensitive and keys are not, as in ConfigParser.
+    Edits apply to the first section and key of a name.
+    """
+
+    def __init__(self, text: str = ""):
+        """
+        Parses the text of an INI file.
+
+        Parameters:
+            text (str): The text of the file.
+        """
+        lines = text.splitlines(keepends=True)
+        self.newline = "\r\n" if lines and lines[0].endswith("\r\n") else "\n"
+        self._sections: List[_Section] = [_Section(None, [], -1)]
+        for line in lines:
+            match = None if line[:1].isspace() else _SECTION.match(line)
+            if match is None:
+                self._sections[-1].lines.append(line)
+                continue
+            # Comments directly above a header belong to its section.
+            previous = self._sections[-1].lines
+            start = len(previous)
+            while start > 0 and _is_comment(previous[start - 1]):
+                start -= 1
+            leading = previous[start:]
+            del previous[start:]
+            self._sections.append(
+                _Section(match.group("name"), leading + [line], len(leading))
+            )
+        self._index: Dict[str, _Section] = {}
+        for section in reversed(self._sections[1:]):
+            self._index[section.name] = section
+        self.changed = False
+
+    @classmethod
+    def read(cls, file_path: str) -> INIDocument:
+        """
+        Reads an INI file, or starts an empty document if it is missing.
+
+        Parameters:
+            file_path (str): The path to the INI file.
+
+        Returns
+        -------
+            INIDocument: The document.
+        """
+        try:
+            with open(file_path, encoding="utf-8", newline="") as file:
+                return cls(file.read())
+        except FileNotFoundError:
+            return cls()
+
+    def __str__(self) -> str:
+        return "".join(
+            line for section in self._sections for line in section.lines
+        )
+
+    def _line(self, text: str) -> str:
+        return text + self.newline
+
+    def sections(self) -> List[str]:
+        """
+        Lists the sections.
+
+        Returns
+        -------
+            List[str]: The section names, in file order.
+        """
+        return list(
+            dict.fromkeys(section.name for section in self._sections[1:])
+        )
+
+    def has_section(self, section: str) -> bool:
+        """
+        Checks if a section exists.
+
+        Parameters:
+            section (str): The section to check.
+
+        Returns
+        -------
+            bool: True if the section exists.
+        """
+        return section in self._index
+
+    def add_section(self, section: str) -> bool:
+        """
+        Adds an empty section at the end of the file.
+
+        Parameters:
+            section (str): The section to add.
+
+        Returns
+        -------
+            bool: True if the section was added, False if it already
+            exists.
+        """
+        if section in self._index:
+            return False
+        lines = []
+        last = next(
+            (s.lines for s in reversed(self._sections) if s.lines), None
+        )
+        if last is not None:
+            if not last[-1].endswith("\n"):
+                last[-1] += self.newline
+            # Separate the new section from the one above with a blank line.
+            if not _is_blank(last[-1]):
+                lines.append(self.newline)
+        lines.append(self._line(f"[{section}]"))
+        new = _Section(section, lines, len(lines) - 1)
+        self._sections.append(new)
+        self._index[section] = new
+        self.changed = True
+        return True
+
+    def remove_section(self, section: str) -> bool:
+        """
+        Removes a section, with the comments directly above its header.
+
+        Parameters:
+            section (str): The section to remove.
+
+        Returns
+        -------
+            bool: True if the section was removed, False if it does not
+            exist.
+        """
+        found = self._index.pop(section, None)
+        if found is None:
+            return False
+        self._sections.remove(found)
+        self.changed = True
+        return True
+
+    def set(self, section: str, key: str, value: Any):
+        """
+        Sets a key, adding the section if needed. An existing key keeps its
+        spelling, delimiter and position; a new key goes after the last
+        key of the section.
+
+        Parameters:
+            section (str): The section of the key.
+            key (str): The key to set.
+            value (Any): The value, converted with `str`.
+        """
+        self.add_section(section)
+        found = self._index[section]
+        text = str(value).replace("\n", "\n\t")
+        match = found.find(key.lower())
+        if match is None:
+            at = found.end_of_options()
+            if not found.lines[at - 1].endswith("\n"):
+                found.lines[at - 1] += self.newline
+            found.lines[at:at] = self._lines(f"{key} = {text}")
+            self.changed = True
+            return
+        start, end, option = match
+        prefix = option.group(0).rstrip("\r\n")
+        # An empty value leaves no space after the delimiter; mirror the
+        # one before it, as in "key = value".
+        if prefix[-1] in "=:" and prefix[-2:-1].isspace():
+            prefix += " "
+        lines = self._lines(prefix + text)
+        if not found.lines[end - 1].endswith("\n"):
+            lines[-1] = lines[-1].rstrip("\r\n")
+        if found.lines[start:end] != lines:
+            found.lines[start:end] = lines
+            self.changed = True
+
+    def _lines(self, text: str) -> List[str]:
+        return [self._line(line) for line in text.split("\n")]
+
+    def get(self, section: str, key: str, fallback: Any = None) -> Any:
+        """
+        Gets the raw value of a key, without interpolation.
+
+        Parameters:
+            section (str): The section of the key.
+            key (str): The key.
+            fallback (Any): The value to return if the key is not found.
+
+        Returns
+        -------
+            Any: The value, or the fallback.
+        """
+        found = self._index.get(section)
+        match = None if found is None else found.find(key.lower())
+        if match is None:
+            return fallback
+        start, end, option = match
+        lines = [found.lines[start][option.end() :]] + [
+            line
+            for line in found.lines[start + 1 : end]
+            if not _is_comment(line)
+        ]
+        return "\n".join(line.strip() for line in lines)
+
+    def remove_key(self, section: str, key: str) -> bool:
+        """
+        Removes a key and its continuation lines.
+
+        Parameters:
+            section (str): The section of the key.
+            key (str): The key to remove.
+
+        Returns
+        -------
+            bool: True if the key was removed, False if the key or section
+            does not exist.
+        """
+        found = self._index.get(section)
+        match = None if found is None else found.find(key.lower())
+        if match is None:
+            return False
+        del found.lines[match[0] : match[1]]
+        self.changed = True
+        return True
+
+    def update(self, updates: Dict[str, Optional[Dict[str, Any]]]) -> bool:
+        """
+        Applies a batch of edits. A section mapped to None is removed, and
+        a key mapped to None is removed from its section; other keys are
+        set, creating their section if needed.
+
+        Parameters:
+            updates (Dict[str, Optional[Dict[str, Any]]]): The edits by
+            section and key.
+
+        Returns
+        -------
+            bool: True if the document changed.
+        """
+        changed = self.changed
+        self.changed = False
+        for section, values in updates.items():
+            if values is None:
+                self.remove_section(section)
+                continue
+            for key, value in values.items():
+                if value is None:
+                    self.remove_key(section, key)
+                else:
+                    self.set(section, key, value)
+        result = self.changed
+        self.changed = changed or result
+        return result
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _is_blank(line: str) -> bool:
+    return not line.strip()
+
+
+def _is_comment(line: str) -> bool:
+    return line.lstrip().startswith(_COMMENT_PREFIXES)
+
+
+def _is_trivia(line: str) -> bool:
+    return _is_blank(line) or _is_comment(line)
+
+
+def _end_of_value(lines: List[str], index: int) -> int:
+    """
+    Returns the index after the continuation lines of a value starting at
+    an index. As in ConfigParser with empty_lines_in_values, blank lines
+    and comments do not end a value, but those after its last
+    continuation line are not part of it.
+    """
+    end = index
+    for index in range(index, len(lines)):
+        line = lines[index]
+        if _is_trivia(line):
+            continue
+        if not line[:1].isspace():
+            break
+        end = index + 1
+    return end
+
+
+@contextlib.contextmanager
+def edit_ini_file(
+    file_path: str, atomic: bool = True, fsync: str = "none"
+) -> Iterator[INIDocument]:
+    """
+    Opens an INI file for a batch of edits. When the block exits without
+    an error, the file is written once, and only if it changed; otherwise
+    it is left untouched. See `open_output` for atomic writes.
+
+    Parameters:
+        file_path (str): The path to the INI file, created if missing.
+        atomic (bool): Replace the file only once it is completely written.
+        fsync (str): "none", "file" or "full".
+
+    Yields
+    ------
+        INIDocument: The document to edit.
+    """
+    document = INIDocument.read(file_path)
+    yield document
+    if document.changed:
+        with open_output(file_path, atomic=atomic, fsync=fsync) as file:
+            file.write(str(document).encode("utf-8"))
+
+
+def update_ini_file(
+    file_path: str,
+    updates: Dict[str, Optional[Dict[str, Any]]],
+    atomic: bool = True,
+    fsync: str = "none",
+) -> bool:
+    """
+    Applies a batch of edits to an INI file and writes it once. See
+    `INIDocument.update` and `edit_ini_file`.
+
+    Parameters:
+        file_path (str): The path to the INI file, created if missing.
+        updates (Dict[str, Optional[Dict[str, Any]]]): The edits by
+        section and key.
+        atomic (bool): Replace the file only once it is completely written.
+        fsync (str): "none", "file" or "full".
+
+    Returns
+    -------
+        bool: True if the file changed.
+    """
+    with edit_ini_file(file_path, atomic, fsync) as document:
+        return document.update(updates)
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "INIDocument",
+    "edit_ini_file",
+    "update_ini_file",
+]
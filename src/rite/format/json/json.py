@@ -21,17 +21,53 @@ Provides JSONHandler Module
 # Import | Future
 from __future__ import annotations
 
-import csv
-import json
-
 # Import | Standard Library
-from typing import Any, Callable, Dict, List
+import json
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 # Import | Libraries
 import xmltodict  # Requires installation: pip install xmltodict
-import yaml
 
 # Import | Local Modules
+from ...data.tree.etree_iterparse import iterparse_to_dict
+from .json_csv import (
+    ConversionStats,
+    csv_to_json_file,
+    iter_csv,
+    json_to_csv_file,
+    write_csv,
+)
+from .json_file import DEFAULT_BUFFER_SIZE, read_json_file, write_json_file
+from .json_lines import iter_jsonl, write_jsonl
+from .json_patch import apply_patch, make_patch
+from .json_path import JSONPath, PathSet, compile_path
+from .json_schema import (
+    SchemaValidator,
+    check_syntax,
+    compile_schema,
+    parse_strict,
+)
+from .json_stream import iter_json
+from .json_tree import deep_merge, diff, find_key, flatten, iter_flatten
+from .json_yaml import (
+    dump_yaml,
+    iter_yaml,
+    iter_yaml_file,
+    load_yaml,
+    read_yaml_file,
+    write_yaml_file,
+)
 
 
 # =============================================================================
@@ -43,11 +79,20 @@ class JSONHandler(object):
     """
     A class for handling JSON data operations.
 
+    Parsing and serialization go through the fastest JSON library installed
+    (see `json_backend`), which can be changed with `set_backend`.
+
     Methods
     -------
     --------
     read_json(file_path: str) -> Any:
         Reads JSON data from a file and returns it.
+    iter_json(file_path: str, path: str = "*") -> Iterator[Any]:
+        Reads the values selected by a path from a JSON file, one at a time.
+    iter_jsonl(file_path: str, workers: int = 1) -> Iterator[Any]:
+        Reads the records of a JSON Lines file, optionally in parallel.
+    write_jsonl(file_path: str, records: Iterable[Any]) -> int:
+        Writes records to a JSON Lines file.
     write_json(file_path: str, data: Any, indent: int = 4):
         Writes JSON data to a file.
     validate_json(data: str) -> bool:
@@ -57,7 +102,8 @@ class JSONHandler(object):
     @staticmethod
     def read_json(file_path: str) -> Any:
         """
-        Reads JSON data from a file.
+        Reads JSON data from a file. Files compressed with gzip or zstd are
+        decompressed.
 
         Parameters:
             file_path (str): The path to the JSON file.
@@ -67,12 +113,76 @@ class JSONHandler(object):
             Any: The data read from the JSON file.
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                return json.load(file)
+            return read_json_file(file_path)
         except Exception as e:
             print(f"Error reading JSON file: {e}")
             raise
 
+    @staticmethod
+    def iter_json(
+        file_path: str,
+        path: str = "*",
+        chunk_size: int = 1024 * 1024,
+        lines: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Reads the values selected by a path from a JSON file, one at a time,
+        without loading the whole file. See `json_stream.iter_json`.
+
+        Parameters:
+            file_path (str): The path to the JSON file.
+            path (str): The path of the values to yield, such as "items.*".
+            chunk_size (int): Number of characters read at a time.
+            lines (bool): Whether the file holds several top-level values,
+                such as JSON Lines, which the path indexes like an array.
+
+        Returns
+        -------
+            Iterator[Any]: The selected values, in document order.
+        """
+        return iter_json(file_path, path, chunk_size, lines)
+
+    @staticmethod
+    def iter_jsonl(
+        file_path: str,
+        workers: Optional[int] = 1,
+        part_size: int = 8 * 1024 * 1024,
+    ) -> Iterator[Any]:
+        """
+        Reads the records of a JSON Lines file, one at a time, parsing parts
+        of the file in a process pool when `workers` is not 1. See
+        `json_lines.iter_jsonl`.
+
+        Parameters:
+            file_path (str): The path to the JSON Lines file.
+            workers (Optional[int]): Number of worker processes, or None for
+            one per CPU.
+            part_size (int): Approximate number of bytes parsed per task.
+
+        Returns
+        -------
+            Iterator[Any]: The records, in file order.
+        """
+        return iter_jsonl(file_path, workers, part_size)
+
+    @staticmethod
+    def write_jsonl(
+        file_path: str, records: Iterable[Any], append: bool = False
+    ) -> int:
+        """
+        Writes records to a JSON Lines file, one per line.
+
+        Parameters:
+            file_path (str): The path to the JSON Lines file.
+            records (Iterable[Any]): The records to write.
+            append (bool): Append to the file instead of replacing it.
+
+        Returns
+        -------
+            int: The number of records written.
+        """
+        return write_jsonl(file_path, records, append)
+
     # def load_json(file):
     #     """
     #     """
@@ -89,41 +199,94 @@ class JSONHandler(object):
     #     return data
 
     @staticmethod
-    def write_json(file_path: str, data: Any, indent: int = 4):
+    def write_json(
+        file_path: str,
+        data: Any,
+        indent: int = 4,
+        atomic: bool = True,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        fsync: str = "none",
+        compression: Optional[str] = None,
+    ):
         """
-        Writes JSON data to a file.
+        Writes JSON data to a file, as UTF-8 with non-ASCII text unescaped,
+        through the JSON backend. Dates, datetimes and UUIDs are written as
+        strings, in ISO 8601 for dates.
 
         Parameters:
             file_path (str): The path to the JSON file.
             data (Any): The data to write to the file.
             indent (int): The indentation level for pretty-printing the JSON
             data.
+            atomic (bool): Write to a temporary file and rename it over the
+            target, so a failed write leaves the previous file intact.
+            buffer_size (int): Size of the write buffer, in bytes.
+            fsync (str): "none", "file" to flush the file to disk, or
+            "full" to also flush the directory entry.
+            compression (Optional[str]): "gzip" or "zstd" to compress the
+            file.
         """
         try:
-            with open(file_path, "w", encoding="utf-8") as file:
-                json.dump(data, file, indent=indent)
+            write_json_file(
+                file_path,
+                data,
+                indent,
+                atomic=atomic,
+                buffer_size=buffer_size,
+                fsync=fsync,
+                compression=compression,
+            )
         except Exception as e:
             print(f"Error writing JSON file: {e}")
             raise
 
     @staticmethod
-    def validate_json(data: str) -> bool:
+    def validate_json(
+        data: Union[str, bytes],
+        schema: Optional[Union[Dict, SchemaValidator]] = None,
+    ) -> bool:
         """
-        Validates a JSON string.
+        Validates a JSON string, and optionally its data against a schema.
 
         Parameters:
-            data (str): The JSON string to validate.
+            data (Union[str, bytes]): The JSON string to validate.
+            schema (Optional[Union[Dict, SchemaValidator]]): A JSON Schema,
+            or one compiled with `compile_json_schema` to validate many
+            strings. Without a schema, only the syntax is checked, without
+            building the data. Either way, NaN and Infinity are rejected.
 
         Returns
         -------
-            bool: True if the string is valid JSON, False otherwise.
+            bool: True if the string is valid JSON matching the schema,
+            False otherwise.
         """
+        if schema is None:
+            return check_syntax(data)
+        if not isinstance(schema, SchemaValidator):
+            schema = SchemaValidator(schema)
         try:
-            json.loads(data)
-            return True
-        except json.JSONDecodeError:
+            return schema.is_valid(parse_strict(data))
+        except ValueError:
             return False
 
+    @staticmethod
+    def compile_json_schema(schema: Dict) -> SchemaValidator:
+        """
+        Compiles a JSON Schema once for validating many values.
+
+        Parameters:
+            schema (Dict): The JSON Schema.
+
+        Returns
+        -------
+            SchemaValidator: The validator, with `is_valid`, `validate`
+            and `iter_errors` methods.
+
+        Raises:
+            ValueError: If the schema is malformed.
+        """
+        return compile_schema(schema)
+
     @staticmethod
     def pretty_print_json(data: Any):
         """
@@ -153,7 +316,8 @@ class JSONHandler(object):
     @staticmethod
     def find_in_json(data: Dict, key: str) -> Any:
         """
-        Search for a key in JSON data and return its value.
+        Search for a key in JSON data and return its value. Nested objects
+        and lists are searched depth first.
 
         Parameters:
             data (Dict): The JSON data to search in.
@@ -163,14 +327,7 @@ class JSONHandler(object):
         -------
             Any: The value of the found key or None.
         """
-        if key in data:
-            return data[key]
-        for _, value in data.items():
-            if isinstance(value, dict):
-                result = JSONHandler.find_in_json(value, key)
-                if result is not None:
-                    return result
-        return None
+        return find_key(data, key)
 
     @staticmethod
     def json_to_xml(json_data: Dict) -> str:
@@ -200,6 +357,27 @@ class JSONHandler(object):
         """
         return xmltodict.parse(xml_data)
 
+    @staticmethod
+    def iter_xml(
+        source: Union[str, IO[bytes]], path: str
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the elements of an XML file matching a path, as JSON objects,
+        in constant memory.
+
+        Parameters:
+            source (Union[str, IO[bytes]]): The path to the XML file, or a
+            binary file object.
+            path (str): A tag matching elements at any depth, such as
+            "entry", or a path from the root, such as "feed/entry".
+
+        Yields
+        ------
+            Dict[str, Any]: The matching elements, keyed by their tag, with
+            attributes prefixed with "@" and text under "#text".
+        """
+        return iterparse_to_dict(source, path)
+
     @staticmethod
     def filter_json(data: Dict, filter_func: Callable[[Dict], bool]) -> Dict:
         """
@@ -233,7 +411,9 @@ class JSONHandler(object):
         return data
 
     @staticmethod
-    def flatten_json(data: Dict, parent_key: str = "", sep: str = ".") -> Dict:
+    def flatten_json(
+        data: Dict, parent_key: str = "", sep: str = ".", lists: bool = False
+    ) -> Dict:
         """
         Flatten a nested JSON object into a single level.
 
@@ -241,21 +421,34 @@ class JSONHandler(object):
             data (Dict): The JSON data to flatten.
             parent_key (str): The base key string.
             sep (str): Separator for nested keys.
+            lists (bool): Also flatten lists, using element indexes as keys.
 
         Returns
         -------
             Dict: The flattened JSON object.
         """
-        items = []
-        for k, v in data.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, Dict):
-                items.extend(
-                    JSONHandler.flatten_json(v, new_key, sep=sep).items()
-                )
-            else:
-                items.append((new_key, v))
-        return dict(items)
+        return flatten(data, parent_key, sep, lists)
+
+    @staticmethod
+    def iter_flatten_json(
+        data: Dict, parent_key: str = "", sep: str = ".", lists: bool = False
+    ) -> Iterator[Tuple[Any, Any]]:
+        """
+        Yield the leaves of a nested JSON object as (path, value) pairs,
+        without building the flattened object.
+
+        Parameters:
+            data (Dict): The JSON data to flatten.
+            parent_key (str): The base key string.
+            sep (str): Separator for nested keys.
+            lists (bool): Also descend into lists, using element indexes as
+            keys.
+
+        Returns
+        -------
+            Iterator[Tuple[Any, Any]]: The path and value of each leaf.
+        """
+        return iter_flatten(data, parent_key, sep, lists)
 
     @staticmethod
     def deep_merge_json(json1: Dict, json2: Dict) -> Dict:
@@ -263,27 +456,19 @@ class JSONHandler(object):
         Merge two JSON objects deeply.
 
         Parameters:
-            json1 (Dict): The first JSON object.
+            json1 (Dict): The first JSON object, updated in place.
             json2 (Dict): The second JSON object.
 
         Returns
         -------
             Dict: The deeply merged JSON object.
         """
-        for key, value in json2.items():
-            if key in json1:
-                if isinstance(json1[key], Dict) and isinstance(value, Dict):
-                    JSONHandler.deep_merge_json(json1[key], value)
-                else:
-                    json1[key] = value
-            else:
-                json1[key] = value
-        return json1
+        return deep_merge(json1, json2)
 
     @staticmethod
     def json_to_yaml(json_data: Dict) -> str:
         """
-        Convert JSON data to YAML format.
+        Convert JSON data to YAML format, with libyaml when available.
 
         Parameters:
             json_data (Dict): The JSON data to convert.
@@ -292,12 +477,12 @@ class JSONHandler(object):
         -------
             str: The converted data in YAML format.
         """
-        return yaml.dump(json_data)
+        return dump_yaml(json_data)
 
     @staticmethod
     def yaml_to_json(yaml_data: str) -> Dict:
         """
-        Convert YAML data to JSON format.
+        Convert YAML data to JSON format, with libyaml when available.
 
         Parameters:
             yaml_data (str): The YAML data to convert.
@@ -306,7 +491,63 @@ class JSONHandler(object):
         -------
             Dict: The converted data in JSON format.
         """
-        return yaml.safe_load(yaml_data)
+        return load_yaml(yaml_data)
+
+    @staticmethod
+    def iter_yaml(yaml_data: Union[str, IO]) -> Iterator[Any]:
+        """
+        Convert the documents of a multi-document YAML stream to JSON data,
+        one at a time.
+
+        Parameters:
+            yaml_data (Union[str, IO]): The YAML data, or a file to read it
+            from incrementally.
+
+        Yields
+        ------
+            Any: The documents, in order.
+        """
+        return iter_yaml(yaml_data)
+
+    @staticmethod
+    def read_yaml(file_path: str, multiple: bool = False) -> Any:
+        """
+        Read JSON data from a YAML file, streaming it from disk.
+
+        Parameters:
+            file_path (str): The path to the YAML file.
+            multiple (bool): Return an iterator over the documents of a
+            multi-document file instead of a single document.
+
+        Returns
+        -------
+            Any: The document, or an iterator over the documents.
+        """
+        if multiple:
+            return iter_yaml_file(file_path)
+        return read_yaml_file(file_path)
+
+    @staticmethod
+    def write_yaml(
+        file_path: str, data: Any, multiple: bool = False, atomic: bool = True
+    ) -> int:
+        """
+        Write JSON data to a YAML file, streaming it to disk.
+
+        Parameters:
+            file_path (str): The path to the YAML file.
+            data (Any): The document, or with `multiple` an iterable of
+            documents, which may be a generator.
+            multiple (bool): Write each item of `data` as a document.
+            atomic (bool): Replace the file only once it is completely
+            written.
+
+        Returns
+        -------
+            int: The number of documents written.
+        """
+        documents = data if multiple else [data]
+        return write_yaml_file(file_path, documents, atomic=atomic)
 
     @staticmethod
     def sort_json(data: Dict, by_key=True, reverse=False) -> Dict:
@@ -331,28 +572,61 @@ class JSONHandler(object):
         )
 
     @staticmethod
-    def diff_json(json1: Dict, json2: Dict) -> Dict:
+    def diff_json(
+        json1: Dict, json2: Dict, deep: bool = False, sep: str = "."
+    ) -> Dict:
         """
         Find differences between two JSON objects.
 
         Parameters:
             json1 (Dict): The first JSON object.
             json2 (Dict): The second JSON object.
+            deep (bool): Report differences inside nested objects by their
+            paths instead of under the top-level key.
+            sep (str): Separator for nested keys.
 
         Returns
         -------
             Dict: A dictionary showing differences.
         """
-        diff = {}
-        for key in json1:
-            if key not in json2:
-                diff[key] = f"Only in first: {json1[key]}"
-            elif json1[key] != json2[key]:
-                diff[key] = f"First: {json1[key]}, Second: {json2[key]}"
-        for key in json2:
-            if key not in json1:
-                diff[key] = f"Only in second: {json2[key]}"
-        return diff
+        return diff(json1, json2, deep, sep)
+
+    @staticmethod
+    def make_json_patch(source: Any, target: Any) -> List[Dict[str, Any]]:
+        """
+        Compute the JSON Patch (RFC 6902) turning one document into another.
+
+        Parameters:
+            source (Any): The original JSON document.
+            target (Any): The changed JSON document.
+
+        Returns
+        -------
+            List[Dict[str, Any]]: The patch operations.
+        """
+        return make_patch(source, target)
+
+    @staticmethod
+    def apply_json_patch(
+        json_data: Any, patch: List[Dict[str, Any]], in_place: bool = False
+    ) -> Any:
+        """
+        Apply a JSON Patch (RFC 6902) to a document.
+
+        Parameters:
+            json_data (Any): The JSON document.
+            patch (List[Dict[str, Any]]): The patch operations.
+            in_place (bool): Change `json_data` itself instead of copying
+            the changed containers.
+
+        Returns
+        -------
+            Any: The patched document.
+
+        Raises:
+            JSONPatchError: If the patch cannot be applied.
+        """
+        return apply_patch(json_data, patch, in_place)
 
     @staticmethod
     def extract_keys(data: Dict) -> List[str]:
@@ -374,21 +648,32 @@ class JSONHandler(object):
         return keys
 
     @staticmethod
-    def json_to_csv(json_data: List[Dict], csv_file: str):
+    def json_to_csv(
+        json_data: Iterable[Dict],
+        csv_file: str,
+        fieldnames: Optional[List[str]] = None,
+        sample: Optional[int] = 1000,
+    ) -> int:
         """
-        Convert JSON data to CSV format.
+        Convert JSON data to CSV format. The records are written one at a
+        time, so a generator can be streamed to disk.
 
         Parameters:
-            json_data (List[Dict]): The JSON data to convert.
+            json_data (Iterable[Dict]): The JSON data to convert.
             csv_file (str): The path to the CSV file to create.
+            fieldnames (Optional[List[str]]): The columns. By default they
+            are the keys of the first `sample` records.
+            sample (Optional[int]): Number of records to discover the
+            columns from, or None for all of them.
 
-        Note: Only works with flat JSON structures.
+        Returns
+        -------
+            int: The number of records written.
+
+        Note: Only works with flat JSON structures. Objects and lists are
+        written as JSON text.
         """
-        with open(csv_file, "w", newline="", encoding="utf-8") as file:
-            writer = csv.DictWriter(file, fieldnames=json_data[0].keys())
-            writer.writeheader()
-            for row in json_data:
-                writer.writerow(row)
+        return write_csv(csv_file, json_data, fieldnames, sample)
 
     @staticmethod
     def csv_to_json(csv_file: str) -> List[Dict]:
@@ -402,33 +687,106 @@ class JSONHandler(object):
         -------
             List[Dict]: The converted data in JSON format.
         """
-        with open(csv_file, "r", encoding="utf-8") as file:
-            return list(csv.DictReader(file))
+        return list(iter_csv(csv_file))
 
     @staticmethod
-    def extract_from_path(json_data: Dict, path: str) -> Any:
+    def iter_csv(csv_file: str) -> Iterator[Dict[str, str]]:
         """
-        Extract data from a JSON object using a specified path.
+        Read the rows of a CSV file one at a time, as JSON objects.
+
+        Parameters:
+            csv_file (str): The path to the CSV file to read.
+
+        Yields
+        ------
+            Dict[str, str]: The rows, keyed by column name.
+        """
+        return iter_csv(csv_file)
+
+    @staticmethod
+    def json_file_to_csv(
+        json_file: str, csv_file: str, **options: Any
+    ) -> ConversionStats:
+        """
+        Convert the records of a JSON or JSON Lines file to a CSV file in
+        bounded memory. See `json_to_csv_file` for the options.
+
+        Parameters:
+            json_file (str): The path to the JSON file to read.
+            csv_file (str): The path to the CSV file to create.
+
+        Returns
+        -------
+            ConversionStats: The rows converted and the throughput.
+        """
+        return json_to_csv_file(json_file, csv_file, **options)
+
+    @staticmethod
+    def csv_file_to_json(
+        csv_file: str, json_file: str, **options: Any
+    ) -> ConversionStats:
+        """
+        Convert the rows of a CSV file to a JSON or JSON Lines file in
+        bounded memory. See `csv_to_json_file` for the options.
+
+        Parameters:
+            csv_file (str): The path to the CSV file to read.
+            json_file (str): The path to the JSON file to create.
+
+        Returns
+        -------
+            ConversionStats: The rows converted and the throughput.
+        """
+        return csv_to_json_file(csv_file, json_file, **options)
+
+    @staticmethod
+    def extract_from_path(json_data: Dict, path: Union[str, JSONPath]) -> Any:
+        """
+        Extract data from a JSON object using a specified path. Integer
+        segments index lists, and `*` segments match every member or
+        element. Paths are compiled once and cached.
 
         Parameters:
             json_data (Dict): The JSON data.
-            path (str): The path to extract data from (e.g., 'key1/key2').
+            path (Union[str, JSONPath]): The path to extract data from
+            (e.g., 'key1/key2', 'items/*/id').
 
         Returns
         -------
-            Any: The extracted data.
+            Any: The extracted data, None if the path does not match, or the
+            list of matches for paths with wildcards.
         """
-        elements = path.split("/")
-        for elem in elements:
-            json_data = json_data.get(elem)
-            if json_data is None:
-                return None
-        return json_data
+        if isinstance(path, str):
+            path = compile_path(path)
+        return path.extract(json_data)
+
+    @staticmethod
+    def extract_paths(
+        json_data: Dict, paths: Union[PathSet, Iterable[str]]
+    ) -> Dict[str, Any]:
+        """
+        Extract the data at many paths in a single traversal. Build the
+        `PathSet` once to apply the same paths to many documents.
+
+        Parameters:
+            json_data (Dict): The JSON data.
+            paths (Union[PathSet, Iterable[str]]): The paths to extract.
+
+        Returns
+        -------
+            Dict[str, Any]: The extracted data, keyed by path, as returned
+            by `extract_from_path`.
+        """
+        if not isinstance(paths, PathSet):
+            paths = PathSet(paths)
+        return paths.extract(json_data)
 
     @staticmethod
     def indent_json(json_data: Any, indent: int = 4) -> str:
         """
-        Adjust the indentation of a JSON string.
+        Adjust the indentation of a JSON string. Like `compress_json` and
+        `pretty_print_json`, it keeps the standard library defaults:
+        non-ASCII text is escaped and only JSON types are serialized.
 
         Parameters:
             json_data (Any): The JSON data to indent.
@@ -485,52 +843,56 @@ class JSONHandler(object):
             return json_data
 
     @staticmethod
-    def path_exists(json_data: Any, path: str) -> bool:
+    def path_exists(json_data: Any, path: Union[str, JSONPath]) -> bool:
         """
         Check if a given path exists in the JSON data.
 
         Parameters:
             json_data (Any): The JSON data.
-            path (str): The path to check (e.g., 'key1/key2').
+            path (Union[str, JSONPath]): The path to check (e.g.,
+            'key1/key2').
 
         Returns
         -------
             bool: True if the path exists, False otherwise.
         """
-        elements = path.split("/")
-        for elem in elements:
-            if isinstance(json_data, dict) and elem in json_data:
-                json_data = json_data[elem]
-            else:
-                return False
-        return True
+        if isinstance(path, str):
+            path = compile_path(path)
+        return path.exists(json_data)
 
     @staticmethod
-    def nested_update(json_data: Any, path: str, value: Any) -> Any:
+    def nested_update(
+        json_data: Any, path: Union[str, JSONPath], value: Any
+    ) -> Any:
         """
         Update a value in a nested JSON structure based on a given path.
 
         Parameters:
             json_data (Any): The JSON data.
-            path (str): The path to the value to update (e.g., 'key1/key2').
+            path (Union[str, JSONPath]): The path to the value to update
+            (e.g., 'key1/key2').
             value (Any): The new value to set.
 
         Returns
         -------
             Any: The updated JSON data.
         """
-        elements = path.split("/")
-        for i, elem in enumerate(elements):
-            if i == len(elements) - 1:
-                json_data[elem] = value
-            else:
-                json_data = json_data.setdefault(elem, {})
-        return json_data
+        if isinstance(path, str):
+            path = compile_path(path)
+        return path.set(json_data, value)
 
     @staticmethod
-    def save_dict_to_json(data: dict, file_path: str, indent: int = 4):
+    def save_dict_to_json(
+        data: dict,
+        file_path: str,
+        indent: int = 4,
+        atomic: bool = True,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        fsync: str = "none",
+        compression: Optional[str] = None,
+    ):
         """
-        Saves a dictionary to a JSON file.
+        Saves a dictionary to a JSON file, encoded as by `write_json`.
 
         Parameters:
             data (dict): The dictionary to save.
@@ -538,10 +900,23 @@ class JSONHandler(object):
             saved.
             indent (int): The indentation level for pretty-printing the JSON
             data.
+            atomic (bool): Replace the file only once it is completely
+            written.
+            buffer_size (int): Size of the write buffer, in bytes.
+            fsync (str): "none", "file" or "full", as for `write_json`.
+            compression (Optional[str]): "gzip" or "zstd" to compress the
+            file.
         """
         try:
-            with open(file_path, "w", encoding="utf-8") as file:
-                json.dump(data, file, indent=indent)
+            write_json_file(
+                file_path,
+                data,
+                indent,
+                atomic=atomic,
+                buffer_size=buffer_size,
+                fsync=fsync,
+                compression=compression,
+            )
         except Exception as e:
             print(f"Error saving dictionary to JSON file: {e}")
             raise
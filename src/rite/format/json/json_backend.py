@@ -0,0 +1,470 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - JSON Backend Module
+==========================
+
+This module provides a common interface over the JSON libraries that may
+be installed: orjson and ujson are used when available, with the standard
+library as the fallback. All backends produce the same output for the same
+data:
+
+- Output is compact by default and UTF-8, without escaping non-ASCII text.
+- Non-string keys (int, float, bool, None) are converted like the standard
+  library does.
+- Dates, times and datetimes are written in ISO 8601 format, and UUIDs as
+  strings.
+- Parse errors raise `json.JSONDecodeError`.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import datetime
+import itertools
+import json
+import uuid
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+# Import | Libraries
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Chunks, mostly whole elements of large arrays and objects, joined for
+# each write when streaming.
+_DUMP_BATCH_CHUNKS = 1024
+
+# Arrays and objects below the top level are streamed element by element
+# from this size; smaller ones are encoded whole, which is much faster.
+_STREAM_MIN_ITEMS = 256
+
+_NO_KEY = object()
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _default(obj: Any) -> Any:
+    """
+    Converts the values the backends agree to support but JSON lacks.
+    """
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    raise TypeError(
+        f"Object of type {type(obj).__name__} is not JSON serializable"
+    )
+
+
+def _key(key: Any, encoder: json.JSONEncoder) -> str:
+    """
+    Converts an object key to a string like the standard library encoder.
+    """
+    if isinstance(key, str):
+        return key
+    if key is True or key is False or key is None:
+        return encoder.encode(key)
+    if isinstance(key, (int, float)):
+        return encoder.encode(key)
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, "
+        f"not {key.__class__.__name__}"
+    )
+
+
+def _stream(
+    value: Any,
+    encoder: json.JSONEncoder,
+    indent: Optional[int],
+    level: int,
+    markers: set,
+) -> Iterator[str]:
+    """
+    Encodes a value in chunks, with the output of `encoder.encode`. The
+    top level and large arrays and objects are streamed element by
+    element, and other values are encoded whole and indented to their
+    level; JSON text has no raw newlines other than indentation.
+    """
+    if isinstance(value, (list, tuple)) and (
+        level == 0 or len(value) >= _STREAM_MIN_ITEMS
+    ):
+        pairs = ((_NO_KEY, item) for item in value)
+        yield from _stream_items(value, pairs, encoder, indent, level, markers)
+    elif isinstance(value, dict) and (
+        level == 0 or len(value) >= _STREAM_MIN_ITEMS
+    ):
+        pairs = sorted(value.items()) if encoder.sort_keys else value.items()
+        yield from _stream_items(value, pairs, encoder, indent, level, markers)
+    else:
+        text = encoder.encode(value)
+        if indent is not None and level:
+            text = text.replace("\n", "\n" + " " * (indent * level))
+        yield text
+
+
+def _stream_items(
+    value: Union[list, tuple, dict],
+    pairs: Iterable[Tuple[Any, Any]],
+    encoder: json.JSONEncoder,
+    indent: Optional[int],
+    level: int,
+    markers: set,
+) -> Iterator[str]:
+    """
+    Encodes the elements of an array or object in chunks.
+    """
+    start, end = ("{", "}") if isinstance(value, dict) else ("[", "]")
+    if not value:
+        yield start + end
+        return
+    if id(value) in markers:
+        raise ValueError("Circular reference detected")
+    markers.add(id(value))
+    newline = "" if indent is None else "\n" + " " * (indent * (level + 1))
+    separator = newline
+    yield start
+    for key, item in pairs:
+        if key is not _NO_KEY:
+            key = encoder.encode(_key(key, encoder))
+            separator += key + encoder.key_separator
+        yield separator
+        yield from _stream(item, encoder, indent, level + 1, markers)
+        separator = encoder.item_separator + newline
+    markers.discard(id(value))
+    yield end if indent is None else "\n" + " " * (indent * level) + end
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class JSONBackend:
+    """
+    The standard library backend, and the interface of the others.
+
+    Methods
+    -------
+        loads(data): Parses a JSON document.
+        dumps(data, indent, sort_keys): Serializes data to a JSON string.
+        dump(data, file, indent, sort_keys): Streams data as UTF-8 JSON to
+        a binary file.
+    """
+
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Parses a JSON document.
+
+        Parameters:
+            data (Union[str, bytes]): The JSON text, or its UTF-8 bytes.
+
+        Returns
+        -------
+            Any: The parsed data.
+
+        Raises:
+            json.JSONDecodeError: If the document is not valid JSON.
+        """
+        return json.loads(data)
+
+    def dumps(
+        self,
+        data: Any,
+        indent: Optional[int] = None,
+        sort_keys: bool = False,
+    ) -> str:
+        """
+        Serializes data to a JSON string.
+
+        Parameters:
+            data (Any): The data to serialize.
+            indent (Optional[int]): Number of spaces to indent nested values
+            with, or None for compact output.
+            sort_keys (bool): Sort object keys.
+
+        Returns
+        -------
+            str: The JSON text.
+
+        Raises:
+            TypeError: If the data holds values that cannot be serialized.
+        """
+        return json.dumps(data, **self._options(indent, sort_keys))
+
+    def dump(
+        self,
+        data: Any,
+        file: IO[bytes],
+        indent: Optional[int] = None,
+        sort_keys: bool = False,
+    ) -> int:
+        """
+        Serializes data as UTF-8 JSON to a binary file. The document is
+        streamed by element of its top level and of its large arrays and
+        objects, so it is never held in memory whole; each element is
+        encoded whole, at the speed of `dumps`.
+
+        Parameters:
+            data (Any): The data to serialize.
+            file (IO[bytes]): The file to write to.
+            indent (Optional[int]): Number of spaces to indent nested values
+            with, or None for compact output.
+            sort_keys (bool): Sort object keys.
+
+        Returns
+        -------
+            int: The number of bytes written.
+
+        Raises:
+            TypeError: If the data holds values that cannot be serialized.
+        """
+        encoder = json.JSONEncoder(**self._options(indent, sort_keys))
+        chunks = _stream(data, encoder, indent, 0, set())
+        written = 0
+        while True:
+            content = "".join(itertools.islice(chunks, _DUMP_BATCH_CHUNKS))
+            if not content:
+                return written
+            content = content.encode()
+            file.write(content)
+            written += len(content)
+
+    @staticmethod
+    def _options(indent: Optional[int], sort_keys: bool) -> Dict[str, Any]:
+        """
+        Returns the options of the standard library encoder.
+        """
+        return {
+            "indent": indent,
+            "sort_keys": sort_keys,
+            "ensure_ascii": False,
+            "separators": (",", ": ") if indent is not None else (",", ":"),
+            "default": _default,
+        }
+
+
+class OrjsonBackend(JSONBackend):
+    """
+    The orjson backend. orjson only indents with two spaces, so other
+    indentations, and integers beyond 64 bits, are handled by the standard
+    library.
+    """
+
+    name = "orjson"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Let the standard library report the error, or parse the
+            # integers orjson rejects.
+            return super().loads(data)
+
+    def dumps(
+        self,
+        data: Any,
+        indent: Optional[int] = None,
+        sort_keys: bool = False,
+    ) -> str:
+        content = self._dumpb(data, indent, sort_keys)
+        if content is None:
+            return super().dumps(data, indent, sort_keys)
+        return content.decode()
+
+    def dump(
+        self,
+        data: Any,
+        file: IO[bytes],
+        indent: Optional[int] = None,
+        sort_keys: bool = False,
+    ) -> int:
+        # orjson produces bytes natively, so they are written as they are.
+        content = self._dumpb(data, indent, sort_keys)
+        if content is None:
+            return super().dump(data, file, indent, sort_keys)
+        file.write(content)
+        return len(content)
+
+    @staticmethod
+    def _dumpb(
+        data: Any, indent: Optional[int], sort_keys: bool
+    ) -> Optional[bytes]:
+        """
+        Serializes data with orjson, or returns None when it cannot.
+        """
+        if indent not in (None, 2):
+            return None
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(data, default=_default, option=option)
+        except TypeError:
+            return None
+
+
+class UjsonBackend(JSONBackend):
+    """
+    The ujson backend.
+    """
+
+    name = "ujson"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return ujson.loads(data)
+        except ValueError:
+            return super().loads(data)
+
+    def dumps(
+        self,
+        data: Any,
+        indent: Optional[int] = None,
+        sort_keys: bool = False,
+    ) -> str:
+        if indent == 0:
+            return super().dumps(data, indent, sort_keys)
+        try:
+            return ujson.dumps(
+                data,
+                indent=indent or 0,
+                sort_keys=sort_keys,
+                ensure_ascii=False,
+                escape_forward_slashes=False,
+                default=_default,
+            )
+        except (TypeError, OverflowError):
+            return super().dumps(data, indent, sort_keys)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+BACKENDS: Dict[str, Type[JSONBackend]] = {
+    "orjson": OrjsonBackend,
+    "ujson": UjsonBackend,
+    "json": JSONBackend,
+}
+
+_MODULES = {"orjson": orjson, "ujson": ujson, "json": json}
+
+_backend: Optional[JSONBackend] = None
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def available_backends() -> List[str]:
+    """
+    Lists the installed backends, fastest first.
+
+    Returns
+    -------
+        List[str]: The backend names.
+    """
+    return [name for name in BACKENDS if _MODULES[name] is not None]
+
+
+def get_backend(name: Optional[str] = None) -> JSONBackend:
+    """
+    Returns a JSON backend.
+
+    Parameters:
+        name (Optional[str]): "orjson", "ujson" or "json". With the default of
+        None, the backend selected with `set_backend` is returned, or else
+        the fastest one installed.
+
+    Returns
+    -------
+        JSONBackend: The backend.
+
+    Raises:
+        ValueError: If the backend is unknown or not installed.
+    """
+    global _backend
+    if name is None:
+        if _backend is None:
+            _backend = BACKENDS[available_backends()[0]]()
+        return _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {name}")
+    if _MODULES[name] is None:
+        raise ValueError(f"JSON backend {name} is not installed")
+    return BACKENDS[name]()
+
+
+def set_backend(name: Optional[str] = None):
+    """
+    Selects the backend used by default.
+
+    Parameters:
+        name (Optional[str]): The backend name, or None to go back to the
+        fastest one installed.
+
+    Raises:
+        ValueError: If the backend is unknown or not installed.
+    """
+    global _backend
+    _backend = get_backend(name) if name is not None else None
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "BACKENDS",
+    "JSONBackend",
+    "OrjsonBackend",
+    "UjsonBackend",
+    "available_backends",
+    "get_backend",
+    "set_backend",
+]
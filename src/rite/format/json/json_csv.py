@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - JSON CSV Module
+======================
+
+This module provides streaming conversion between JSON records and CSV
+rows. Records are read, converted and written one at a time, so files of
+any size are converted in bounded memory. The CSV columns are given, or
+discovered from the first records or from a first pass over the source.
+Each conversion reports its throughput.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import csv
+import itertools
+import os
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+# Import | Libraries
+
+# Import | Local Modules
+from .json_backend import get_backend
+from .json_lines import iter_jsonl
+from .json_stream import iter_json
+from .json_tree import flatten
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Types written as they are; the csv module writes None as an empty cell.
+_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class ConversionStats:
+    """
+    Throughput of a conversion.
+
+    Attributes
+    ----------
+        rows (int): Number of records converted.
+        bytes_read (int): Size of the source file.
+        bytes_written (int): Size of the written file.
+        seconds (float): Duration of the conversion.
+        rows_per_second (float): Records converted per second.
+        bytes_per_second (float): Source bytes converted per second.
+    """
+
+    __slots__ = ("rows", "bytes_read", "bytes_written", "seconds")
+
+    def __init__(
+        self,
+        rows: int = 0,
+        bytes_read: int = 0,
+        bytes_written: int = 0,
+        seconds: float = 0.0,
+    ):
+        self.rows = rows
+        self.bytes_read = bytes_read
+        self.bytes_written = bytes_written
+        self.seconds = seconds
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_read / self.seconds if self.seconds else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"ConversionStats(rows={self.rows}, "
+            f"bytes_read={self.bytes_read}, "
+            f"bytes_written={self.bytes_written}, "
+            f"seconds={self.seconds:.3f})"
+        )
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def discover_fields(
+    records: Iterable[Dict], limit: Optional[int] = None
+) -> List[str]:
+    """
+    Collects the keys of records, in the order they first appear.
+
+    Parameters:
+        records (Iterable[Dict]): The records.
+        limit (Optional[int]): Number of records to look at, or None for
+        all of them.
+
+    Returns
+    -------
+        List[str]: The keys.
+    """
+    fields: Dict[str, None] = {}
+    for record in itertools.islice(records, limit):
+        fields.update(dict.fromkeys(record))
+    return list(fields)
+
+
+def iter_csv(csv_file: str) -> Iterator[Dict[str, str]]:
+    """
+    Reads the rows of a CSV file with a header, one at a time.
+
+    Parameters:
+        csv_file (str): The path to the CSV file.
+
+    Yields
+    ------
+        Dict[str, str]: The rows, keyed by column name.
+    """
+    with open(csv_file, "r", newline="", encoding="utf-8") as file:
+        yield from csv.DictReader(file)
+
+
+def write_csv(
+    csv_file: str,
+    records: Iterable[Dict],
+    fieldnames: Optional[List[str]] = None,
+    sample: Optional[int] = 1000,
+    extrasaction: str = "raise",
+) -> int:
+    """
+    Writes records to a CSV file with a header, one at a time.
+
+    Missing keys are written as empty cells, as are None values. Objects
+    and lists are written as compact JSON.
+
+    Parameters:
+        csv_file (str): The path to the CSV file to create.
+        records (Iterable[Dict]): The records to write.
+        fieldnames (Optional[List[str]]): The columns. By default they are
+        discovered from the first `sample` records, which are held in
+        memory until the header is written.
+        sample (Optional[int]): Number of records to discover the columns
+        from, or None to read all of them first.
+        extrasaction (str): "raise" to fail on a record with keys that are
+        not columns, or "ignore" to drop them.
+
+    Returns
+    -------
+        int: The number of records written.
+
+    Raises:
+        ValueError: If a record has keys that are not columns and
+        `extrasaction` is "raise".
+    """
+    if extrasaction not in ("raise", "ignore"):
+        raise ValueError(f"Invalid extrasaction: {extrasaction}")
+    records = iter(records)
+    if fieldnames is None:
+        head = list(itertools.islice(records, sample))
+        fieldnames = discover_fields(head)
+        records = itertools.chain(head, records)
+    columns = set(fieldnames)
+    dumps = get_backend().dumps
+    count = 0
+    with open(csv_file, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(fieldnames)
+        for record in records:
+            if extrasaction == "raise" and not record.keys() <= columns:
+                extra = sorted(map(str, record.keys() - columns))
+                raise ValueError(
+                    f"Record {count} has keys that are not columns: {extra}"
+                )
+            row = list(map(record.get, fieldnames))
+            if not _SCALARS.issuperset(map(type, row)):
+                row = [
+                    dumps(value) if isinstance(value, (dict, list)) else value
+                    for value in row
+                ]
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def _measure(
+    source: str, target: str, convert: Callable[[], int]
+) -> ConversionStats:
+    """
+    Runs a conversion and returns its throughput.
+    """
+    start = time.perf_counter()
+    rows = convert()
+    return ConversionStats(
+        rows=rows,
+        bytes_read=os.path.getsize(source),
+        bytes_written=os.path.getsize(target),
+        seconds=time.perf_counter() - start,
+    )
+
+
+def json_to_csv_file(
+    json_file: str,
+    csv_file: str,
+    path: str = "*",
+    lines: bool = False,
+    fieldnames: Optional[List[str]] = None,
+    sample: Optional[int] = 1000,
+    two_pass: bool = False,
+    flat: bool = False,
+    extrasaction: str = "raise",
+) -> ConversionStats:
+    """
+    Converts the records of a JSON or JSON Lines file to a CSV file,
+    streaming them one at a time.
+
+    Parameters:
+        json_file (str): The path to the JSON file.
+        csv_file (str): The path to the CSV file to create.
+        path (str): The path of the records in a JSON file, as for
+        `iter_json`. "*" reads the elements of a top-level array.
+        lines (bool): Read a JSON Lines file, one record per line.
+        fieldnames (Optional[List[str]]): The columns. By default they are
+        discovered, see `sample` and `two_pass`.
+        sample (Optional[int]): Number of records to discover the columns
+        from, or None for all of them, held in memory.
+        two_pass (bool): Discover the columns from every record in a first
+        pass over the file, without holding records in memory.
+        flat (bool): Flatten nested objects into dotted column names.
+        extrasaction (str): "raise" to fail on a record with keys that are
+        not columns, or "ignore" to drop them.
+
+    Returns
+    -------
+        ConversionStats: The throughput of the conversion.
+    """
+
+    def records() -> Iterator[Dict]:
+        source = iter_jsonl(json_file) if lines else iter_json(json_file, path)
+        return map(flatten, source) if flat else source
+
+    def convert() -> int:
+        columns = fieldnames
+        if columns is None and two_pass:
+            columns = discover_fields(records())
+        return write_csv(csv_file, records(), columns, sample, extrasaction)
+
+    return _measure(json_file, csv_file, convert)
+
+
+def csv_to_json_file(
+    csv_file: str,
+    json_file: str,
+    lines: bool = False,
+    indent: Optional[int] = None,
+) -> ConversionStats:
+    """
+    Converts the rows of a CSV file to a JSON array, or to JSON Lines,
+    streaming them one at a time. Cells are written as strings.
+
+    Parameters:
+        csv_file (str): The path to the CSV file.
+        json_file (str): The path to the JSON file to create.
+        lines (bool): Write JSON Lines, one record per line, instead of an
+        array.
+        indent (Optional[int]): Number of spaces to indent the records of
+        an array with, or None for one record per line.
+
+    Returns
+    -------
+        ConversionStats: The throughput of the conversion.
+    """
+
+    def convert() -> int:
+        dumps = get_backend().dumps
+        count = 0
+        with open(json_file, "w", encoding="utf-8") as file:
+            if not lines:
+                file.write("[")
+            for row in iter_csv(csv_file):
+                if lines:
+                    file.write(dumps(row))
+                    file.write("\n")
+                else:
+                    file.write(",\n" if count else "\n")
+                    file.write(dumps(row, indent=indent))
+                count += 1
+            if not lines:
+                file.write("\n]\n" if count else "]\n")
+        return count
+
+    return _measure(csv_file, json_file, convert)
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "ConversionStats",
+    "csv_to_json_file",
+    "discover_fields",
+    "iter_csv",
+    "json_to_csv_file",
+    "write_csv",
+]
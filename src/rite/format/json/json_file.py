@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - JSON File Module
+=======================
+
+This module writes JSON documents to disk safely, through `open_output`:
+a document is written to a temporary file next to the target and renamed
+over it once complete, so readers and crashes see either the old or the
+new file, never a truncated one. The write buffer size and the fsync
+policy are configurable, and the output can be compressed with gzip, or
+with zstd when the zstandard package is installed. Compressed files are
+detected when read back.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import contextlib
+import gzip
+import io
+from typing import IO, Any, Iterator, List, Optional
+
+# Import | Libraries
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Import | Local Modules
+from ...path.file.file_atomic import (
+    DEFAULT_BUFFER_SIZE,
+    FSYNC_POLICIES,
+    open_output,
+)
+from .json_backend import get_backend
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+COMPRESSIONS = ("gzip", "zstd")
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+@contextlib.contextmanager
+def _compressor(
+    file: IO[bytes], compression: Optional[str], level: Optional[int]
+) -> Iterator[IO[bytes]]:
+    """
+    Wraps an output file in a compressing writer.
+    """
+    if compression is None:
+        yield file
+    elif compression == "gzip":
+        with gzip.GzipFile(
+            fileobj=file,
+            mode="wb",
+            compresslevel=6 if level is None else level,
+            mtime=0,
+        ) as writer:
+            yield writer
+    elif compression == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd compression requires zstandard")
+        compressor = zstandard.ZstdCompressor(
+            level=3 if level is None else level
+        )
+        with compressor.stream_writer(file, closefd=False) as writer:
+            yield writer
+    else:
+        raise ValueError(f"Unknown compression: {compression}")
+
+
+def write_json_file(
+    file_path: str,
+    data: Any,
+    indent: Optional[int] = 4,
+    atomic: bool = True,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    fsync: str = "none",
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+) -> int:
+    """
+    Writes a JSON document to a file, streamed through the write buffer
+    and compressor. See `open_output`.
+
+    Parameters:
+        file_path (str): The path to the JSON file.
+        data (Any): The data to write.
+        indent (Optional[int]): Number of spaces to indent with, or None
+        for compact output.
+        atomic (bool): Replace the file only once it is completely written.
+        buffer_size (int): Size of the write buffer, in bytes.
+        fsync (str): "none", "file" or "full".
+        compression (Optional[str]): "gzip" or "zstd" to compress the file.
+        level (Optional[int]): The compression level, or None for the
+        default of the compression.
+
+    Returns
+    -------
+        int: The number of bytes of JSON written, before compression.
+
+    Raises:
+        ValueError: If the fsync policy or compression is unknown or
+        unavailable.
+        TypeError: If the data holds values that cannot be serialized.
+    """
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression: {compression}")
+    if compression == "zstd" and zstandard is None:
+        raise ValueError("zstd compression requires zstandard")
+    with open_output(file_path, atomic, buffer_size, fsync) as file:
+        with _compressor(file, compression, level) as writer:
+            return get_backend().dump(data, writer, indent=indent)
+
+
+def read_json_file(file_path: str) -> Any:
+    """
+    Reads a JSON document from a file, decompressing gzip and zstd files.
+
+    Parameters:
+        file_path (str): The path to the JSON file.
+
+    Returns
+    -------
+        Any: The data.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON.
+        ValueError: If the file is zstd compressed and zstandard is not
+        installed.
+    """
+    with open(file_path, "rb") as file:
+        content = file.read()
+    if content.startswith(_GZIP_MAGIC):
+        content = gzip.decompress(content)
+    elif content.startswith(_ZSTD_MAGIC):
+        if zstandard is None:
+            raise ValueError("zstd compressed JSON requires zstandard")
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+        content = decompressor.decompress(content)
+    return get_backend().loads(content)
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "COMPRESSIONS",
+    "DEFAULT_BUFFER_SIZE",
+    "FSYNC_POLICIES",
+    "open_output",
+    "read_json_file",
+    "write_json_file",
+]
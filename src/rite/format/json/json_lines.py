@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - JSON Lines Module
+========================
+
+This module provides streaming readers and writers for JSON Lines (NDJSON)
+files, with one JSON value per line. Large files can be parsed on several
+cores by splitting them on line boundaries and parsing each part in a
+process pool.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+# Import | Libraries
+
+# Import | Local Modules
+from .json_backend import get_backend
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _parse_lines(lines: Iterable[bytes], offset: int) -> Iterator[Any]:
+    """
+    Parses lines of JSON, skipping blank lines. Errors name the byte offset
+    of the failing line.
+    """
+    loads = get_backend().loads
+    for line in lines:
+        if line.strip():
+            try:
+                yield loads(line)
+            except json.JSONDecodeError as e:
+                raise json.JSONDecodeError(
+                    f"{e.msg} (line at byte {offset})", e.doc, e.pos
+                ) from None
+        offset += len(line)
+
+
+def _parse_range(file_path: str, start: int, end: int) -> List[Any]:
+    """
+    Parses the lines between two byte offsets of a file. Runs in a worker
+    process.
+    """
+    with open(file_path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+    return list(_parse_lines(data.splitlines(keepends=True), start))
+
+
+def _line_ranges(file_path: str, part_size: int) -> List[Tuple[int, int]]:
+    """
+    Splits a file into byte ranges of about `part_size` bytes, each ending
+    on a line boundary.
+    """
+    size = os.path.getsize(file_path)
+    ranges = []
+    start = 0
+    with open(file_path, "rb") as file:
+        while start < size:
+            file.seek(min(start + part_size, size))
+            file.readline()
+            end = min(file.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def iter_jsonl(
+    file_path: str,
+    workers: Optional[int] = 1,
+    part_size: int = 8 * 1024 * 1024,
+) -> Iterator[Any]:
+    """
+    Reads the records of a JSON Lines file, one at a time. Blank lines are
+    skipped.
+
+    With several workers, the file is split into parts of about
+    `part_size` bytes on line boundaries, which are parsed in a process
+    pool. Records are still yielded in file order, and only a few parts
+    are held in memory at a time.
+
+    Parameters:
+        file_path (str): The path to the JSON Lines file.
+        workers (Optional[int]): Number of worker processes. None uses one
+        per CPU; 1 parses in the calling process.
+        part_size (int): Approximate number of bytes parsed per task.
+
+    Yields
+    ------
+        Any: The records, in file order.
+
+    Raises:
+        json.JSONDecodeError: If a line is not valid JSON.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        with open(file_path, "rb") as file:
+            yield from _parse_lines(file, 0)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque = deque()
+        for start, end in _line_ranges(file_path, part_size):
+            pending.append(
+                executor.submit(_parse_range, file_path, start, end)
+            )
+            # Bound the number of parsed parts waiting to be consumed.
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def write_jsonl(
+    file_path: str,
+    records: Iterable[Any],
+    append: bool = False,
+) -> int:
+    """
+    Writes records to a JSON Lines file, one compact JSON value per line.
+    The records are consumed as they are written, so any iterable,
+    including a generator, can be streamed to disk.
+
+    Parameters:
+        file_path (str): The path to the JSON Lines file.
+        records (Iterable[Any]): The records to write.
+        append (bool): Append to the file instead of replacing it.
+
+    Returns
+    -------
+        int: The number of records written.
+    """
+    dumps = get_backend().dumps
+    count = 0
+    with open(file_path, "a" if append else "w", encoding="utf-8") as file:
+        for record in records:
+            file.write(dumps(record))
+            file.write("\n")
+            count += 1
+    return count
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "iter_jsonl",
+    "write_jsonl",
+]
@@ -0,0 +1,437 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - JSON Patch Module
+========================
+
+This module computes and applies JSON Patch documents (RFC 6902), so a
+change to a large document can be stored or sent as a small list of
+operations instead of the whole document.
+
+The diff walks both documents with an explicit stack and skips identical
+branches with identity and equality checks, which stop at the first
+difference. After a mismatch in an array, the next elements are looked
+ahead to realign the arrays, so inserting or removing a few elements
+yields one operation each rather than a replacement of every element
+after them. Patches are applied by copying
+only the containers on the paths they change; the rest of the document is
+shared with the original.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import copy
+import functools
+from typing import Any, Dict, List, Tuple
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Number of elements looked ahead to realign arrays after a mismatch.
+_WINDOW = 16
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class JSONPatchError(ValueError):
+    """
+    Raised when a patch is malformed or cannot be applied to a document.
+    """
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def escape_token(token: Any) -> str:
+    """
+    Escapes an object key or array index for use in a JSON Pointer.
+
+    Parameters:
+        token (Any): The key or index.
+
+    Returns
+    -------
+        str: The escaped reference token.
+    """
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_pointer(pointer: str) -> Tuple[str, ...]:
+    """
+    Splits a JSON Pointer (RFC 6901) into its unescaped reference tokens.
+
+    Parameters:
+        pointer (str): The pointer, such as "/users/0/name", or "" for the
+        whole document.
+
+    Returns
+    -------
+        Tuple[str, ...]: The reference tokens.
+
+    Raises:
+        JSONPatchError: If the pointer does not start with "/".
+    """
+    if pointer == "":
+        return ()
+    if not pointer.startswith("/"):
+        raise JSONPatchError(f"Invalid JSON Pointer: {pointer!r}")
+    return tuple(
+        token.replace("~1", "/").replace("~0", "~")
+        for token in pointer[1:].split("/")
+    )
+
+
+def _same(first: Any, second: Any) -> bool:
+    """
+    Compares two values as JSON, telling apart 1, 1.0 and True at every
+    level. Python equality runs first, so only equal values are walked.
+    """
+    return first is second or (first == second and _same_types(first, second))
+
+
+def _same_types(first: Any, second: Any) -> bool:
+    """
+    Checks that two equal values hold numbers of the same types. Scalars
+    are checked in the loop over their container, which is much faster
+    than a call for each.
+    """
+    if isinstance(first, dict):
+        pairs = zip(first.values(), map(second.__getitem__, first))
+    elif isinstance(first, list):
+        pairs = zip(first, second)
+    else:
+        return _same_type(first, second)
+    for value, other in pairs:
+        if value is other:
+            continue
+        if isinstance(value, (dict, list)):
+            if not _same_types(value, other):
+                return False
+        elif type(value) is not type(other) and not _same_type(value, other):
+            return False
+    return True
+
+
+def _same_type(first: Any, second: Any) -> bool:
+    """
+    Checks that two equal scalars are the same JSON type.
+    """
+    return type(first) is type(second) or not (
+        isinstance(first, (int, float)) or isinstance(second, (int, float))
+    )
+
+
+def _resync(source: List, target: List, i: int, j: int) -> Tuple[int, int]:
+    """
+    Looks ahead from a mismatch for the nearest point where the arrays
+    match again. Returns the number of source elements removed and target
+    elements inserted before it, or (0, 0) to pair the two elements.
+    """
+    for k in range(1, _WINDOW + 1):
+        if j + k < len(target) and _same(source[i], target[j + k]):
+            return 0, k
+        if i + k < len(source) and _same(source[i + k], target[j]):
+            return k, 0
+    return 0, 0
+
+
+def _diff_arrays(
+    path: str, source: List, target: List
+) -> List[Tuple[str, Any]]:
+    """
+    Returns the work items turning one array into another, in the order
+    they must be done. Indexes refer to the array as patched so far, which
+    matches `target` up to the current element.
+    """
+    work: List[Tuple[str, Any]] = []
+    i = j = 0
+    while i < len(source) and j < len(target):
+        if _same(source[i], target[j]):
+            i += 1
+            j += 1
+            continue
+        removed, inserted = _resync(source, target, i, j)
+        if not removed and not inserted:
+            work.append(("diff", (f"{path}/{j}", source[i], target[j])))
+            i += 1
+            j += 1
+        for _ in range(removed):
+            work.append(("op", {"op": "remove", "path": f"{path}/{j}"}))
+        i += removed
+        for _ in range(inserted):
+            work.append(
+                (
+                    "op",
+                    {"op": "add", "path": f"{path}/{j}", "value": target[j]},
+                )
+            )
+            j += 1
+    for _ in range(i, len(source)):
+        work.append(("op", {"op": "remove", "path": f"{path}/{j}"}))
+    for j in range(j, len(target)):
+        work.append(
+            ("op", {"op": "add", "path": f"{path}/{j}", "value": target[j]})
+        )
+    return work
+
+
+def _diff_objects(
+    path: str, source: Dict, target: Dict
+) -> List[Tuple[str, Any]]:
+    """
+    Returns the work items turning one object into another.
+    """
+    work: List[Tuple[str, Any]] = []
+    for key in source:
+        if key not in target:
+            work.append(
+                ("op", {"op": "remove", "path": f"{path}/{escape_token(key)}"})
+            )
+    for key, value in target.items():
+        member = f"{path}/{escape_token(key)}"
+        if key not in source:
+            work.append(("op", {"op": "add", "path": member, "value": value}))
+        elif not _same(source[key], value):
+            work.append(("diff", (member, source[key], value)))
+    return work
+
+
+def make_patch(source: Any, target: Any) -> List[Dict[str, Any]]:
+    """
+    Computes a JSON Patch turning one document into another.
+
+    Parameters:
+        source (Any): The original document.
+        target (Any): The changed document.
+
+    Returns
+    -------
+        List[Dict[str, Any]]: The "add", "remove" and "replace" operations,
+        empty if the documents are equal as JSON, where 1, 1.0 and True
+        differ. Values in the operations are shared with `target`, not
+        copied.
+    """
+    patch: List[Dict[str, Any]] = []
+    stack: List[Tuple[str, Any]] = [("diff", ("", source, target))]
+    while stack:
+        kind, item = stack.pop()
+        if kind == "op":
+            patch.append(item)
+            continue
+        path, first, second = item
+        if _same(first, second):
+            continue
+        if isinstance(first, dict) and isinstance(second, dict):
+            work = _diff_objects(path, first, second)
+        elif isinstance(first, list) and isinstance(second, list):
+            work = _diff_arrays(path, first, second)
+        else:
+            work = [("op", {"op": "replace", "path": path, "value": second})]
+        stack.extend(reversed(work))
+    return patch
+
+
+def _index(token: str, size: int) -> int:
+    """
+    Parses an array index token, which must be below `size`.
+    """
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise JSONPatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    if index >= size:
+        raise JSONPatchError(f"Array index out of range: {index}")
+    return index
+
+
+def _child(node: Any, token: str) -> Any:
+    """
+    Returns the member or element of a container named by a token.
+    """
+    if isinstance(node, dict):
+        if token not in node:
+            raise JSONPatchError(f"Missing member: {token!r}")
+        return node[token]
+    if isinstance(node, list):
+        return node[_index(token, len(node))]
+    raise JSONPatchError(f"Cannot descend into {type(node).__name__}")
+
+
+class _Patcher:
+    """
+    Applies operations to a document, copying each container before its
+    first change unless the document is patched in place.
+    """
+
+    def __init__(self, document: Any, in_place: bool):
+        self.in_place = in_place
+        # Copies by id, holding them so their ids are not reused.
+        self.owned: Dict[int, Any] = {}
+        self.root = self._own(document)
+
+    def _own(self, node: Any) -> Any:
+        """
+        Returns a container that may be changed: `node` itself, or a
+        shallow copy of it made once.
+        """
+        if self.in_place or not isinstance(node, (dict, list)):
+            return node
+        if id(node) not in self.owned:
+            node = copy.copy(node)
+            self.owned[id(node)] = node
+        return node
+
+    def get(self, tokens: Tuple[str, ...]) -> Any:
+        node = self.root
+        for token in tokens:
+            node = _child(node, token)
+        return node
+
+    def parent(self, tokens: Tuple[str, ...]) -> Any:
+        """
+        Returns the container holding the value at `tokens`, copying the
+        containers on the way.
+        """
+        node = self.root
+        for token in tokens[:-1]:
+            child = self._own(_child(node, token))
+            if isinstance(node, list):
+                node[int(token)] = child
+            else:
+                node[token] = child
+            node = child
+        return node
+
+    def add(self, tokens: Tuple[str, ...], value: Any):
+        if not tokens:
+            self.root = value
+            return
+        node, token = self.parent(tokens), tokens[-1]
+        if isinstance(node, list):
+            if token == "-":
+                node.append(value)
+            else:
+                node.insert(_index(token, len(node) + 1), value)
+        elif isinstance(node, dict):
+            node[token] = value
+        else:
+            raise JSONPatchError(f"Cannot add to {type(node).__name__}")
+
+    def remove(self, tokens: Tuple[str, ...]) -> Any:
+        if not tokens:
+            raise JSONPatchError("Cannot remove the whole document")
+        node, token = self.parent(tokens), tokens[-1]
+        _child(node, token)
+        if isinstance(node, list):
+            return node.pop(int(token))
+        return node.pop(token)
+
+    def replace(self, tokens: Tuple[str, ...], value: Any):
+        if not tokens:
+            self.root = value
+            return
+        node, token = self.parent(tokens), tokens[-1]
+        _child(node, token)
+        if isinstance(node, list):
+            node[int(token)] = value
+        else:
+            node[token] = value
+
+    def apply(self, operation: Dict[str, Any]):
+        """
+        Applies a single operation.
+        """
+        op = operation.get("op")
+        tokens = parse_pointer(operation["path"])
+        if op == "add":
+            self.add(tokens, operation["value"])
+        elif op == "remove":
+            self.remove(tokens)
+        elif op == "replace":
+            self.replace(tokens, operation["value"])
+        elif op == "move":
+            source = parse_pointer(operation["from"])
+            if tokens[: len(source)] == source and tokens != source:
+                raise JSONPatchError("Cannot move a value into itself")
+            self.add(tokens, self.remove(source))
+        elif op == "copy":
+            value = self.get(parse_pointer(operation["from"]))
+            self.add(tokens, copy.deepcopy(value))
+        elif op == "test":
+            if not _same(self.get(tokens), operation["value"]):
+                raise JSONPatchError(f"Test failed: {operation['path']}")
+        else:
+            raise JSONPatchError(f"Unknown operation: {op!r}")
+
+
+def apply_patch(
+    document: Any, patch: List[Dict[str, Any]], in_place: bool = False
+) -> Any:
+    """
+    Applies a JSON Patch to a document.
+
+    Parameters:
+        document (Any): The document to patch.
+        patch (List[Dict[str, Any]]): The operations: "add", "remove",
+        "replace", "move", "copy" and "test".
+        in_place (bool): Change `document` itself. This is faster, but a
+        failing operation leaves the earlier ones applied. By default the
+        containers on the changed paths are copied, and `document` is left
+        unchanged.
+
+    Returns
+    -------
+        Any: The patched document. Unchanged branches are shared with
+        `document`.
+
+    Raises:
+        JSONPatchError: If an operation is malformed or cannot be applied.
+    """
+    patcher = _Patcher(document, in_place)
+    for number, operation in enumerate(patch):
+        try:
+            patcher.apply(operation)
+        except JSONPatchError as e:
+            raise JSONPatchError(f"Operation {number}: {e}") from None
+        except (KeyError, TypeError, AttributeError) as e:
+            raise JSONPatchError(
+                f"Operation {number}: malformed operation ({e!r})"
+            ) from None
+    return patcher.root
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "JSONPatchError",
+    "apply_patch",
+    "escape_token",
+    "make_patch",
+    "parse_pointer",
+]
@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - JSON Path Module
+=======================
+
+This module provides compiled paths into JSON data, such as `users/0/name`
+or `users/*/name`. A path is parsed once and can then be applied to any
+number of documents, and a set of paths can be extracted from a document
+in a single traversal that visits shared prefixes once.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+WILDCARD = "*"
+
+_MISSING = object()
+
+_CACHE_SIZE = 1024
+
+_cache: Dict[Tuple[str, str], JSONPath] = {}
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _step(value: Any, key: str, index: Optional[int]) -> Any:
+    """
+    Returns the member `key` of an object or the element `index` of a list,
+    or _MISSING.
+    """
+    if isinstance(value, dict):
+        return value.get(key, _MISSING)
+    if isinstance(value, list) and index is not None:
+        if -len(value) <= index < len(value):
+            return value[index]
+    return _MISSING
+
+
+def _children(value: Any) -> Iterable[Any]:
+    """
+    Returns the members of an object or the elements of a list.
+    """
+    if isinstance(value, dict):
+        return value.values()
+    if isinstance(value, list):
+        return value
+    return ()
+
+
+def _parse(segment: str) -> Tuple[str, Optional[int]]:
+    """
+    Parses a path segment into an object key and, if it is an integer, a
+    list index.
+    """
+    try:
+        return segment, int(segment)
+    except ValueError:
+        return segment, None
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class JSONPath:
+    """
+    A path into JSON data, parsed once.
+
+    Segments are separated by "/". A segment selects an object member by
+    key, or a list element when it is an integer (negative integers count
+    from the end). A `*` segment selects every member or element.
+
+    Attributes
+    ----------
+        path (str): The path as written.
+        segments (Tuple[Tuple[str, Optional[int]], ...]): The parsed
+        segments, as keys and list indexes.
+        wildcard (bool): Whether the path has `*` segments and so may match
+        several values.
+
+    Methods
+    -------
+        find(data): Yields every value matching the path.
+        get(data, default): Returns the first matching value.
+        extract(data, default): Returns the value, or all values for paths
+        with wildcards.
+        exists(data): Checks whether the path matches.
+        set(data, value): Sets the value at the path.
+    """
+
+    __slots__ = ("path", "segments", "wildcard")
+
+    def __init__(self, path: str, sep: str = "/"):
+        """
+        Parses a path.
+
+        Parameters:
+            path (str): The path, such as "users/0/name".
+            sep (str): The segment separator.
+        """
+        self.path = path
+        self.segments = tuple(_parse(segment) for segment in path.split(sep))
+        self.wildcard = any(key == WILDCARD for key, _ in self.segments)
+
+    def __repr__(self) -> str:
+        return f"JSONPath({self.path!r})"
+
+    def find(self, data: Any) -> Iterator[Any]:
+        """
+        Yields every value matching the path, in document order.
+
+        Parameters:
+            data (Any): The JSON data.
+
+        Yields
+        ------
+            Any: The matching values.
+        """
+        if not self.wildcard:
+            value = self.get(data, _MISSING)
+            if value is not _MISSING:
+                yield value
+            return
+        depth = len(self.segments)
+        stack: List[Tuple[Any, int]] = [(data, 0)]
+        while stack:
+            value, position = stack.pop()
+            if position == depth:
+                yield value
+                continue
+            key, index = self.segments[position]
+            if key == WILDCARD:
+                stack.extend(
+                    (child, position + 1)
+                    for child in reversed(list(_children(value)))
+                )
+            else:
+                value = _step(value, key, index)
+                if value is not _MISSING:
+                    stack.append((value, position + 1))
+
+    def get(self, data: Any, default: Any = None) -> Any:
+        """
+        Returns the first value matching the path.
+
+        Parameters:
+            data (Any): The JSON data.
+            default (Any): Returned when nothing matches.
+
+        Returns
+        -------
+            Any: The value, or `default`.
+        """
+        if self.wildcard:
+            return next(self.find(data), default)
+        for key, index in self.segments:
+            if isinstance(data, dict):
+                data = data.get(key, _MISSING)
+            else:
+                data = _step(data, key, index)
+            if data is _MISSING:
+                return default
+        return data
+
+    def extract(self, data: Any, default: Any = None) -> Any:
+        """
+        Returns the value at the path, or the list of matching values for
+        paths with wildcards.
+
+        Parameters:
+            data (Any): The JSON data.
+            default (Any): Returned when a path without wildcards does not
+            match.
+
+        Returns
+        -------
+            Any: The value, `default`, or a list of values.
+        """
+        if self.wildcard:
+            return list(self.find(data))
+        return self.get(data, default)
+
+    def exists(self, data: Any) -> bool:
+        """
+        Checks whether the path matches a value, which may be None.
+
+        Parameters:
+            data (Any): The JSON data.
+
+        Returns
+        -------
+            bool: True if a value matches.
+        """
+        if not self.wildcard:
+            return self.get(data, _MISSING) is not _MISSING
+        return next(self.find(data), _MISSING) is not _MISSING
+
+    def set(self, data: Any, value: Any) -> Any:
+        """
+        Sets the value at the path, creating missing objects on the way.
+
+        Parameters:
+            data (Any): The JSON data, updated in place.
+            value (Any): The value to set.
+
+        Returns
+        -------
+            Any: The object or list holding the value.
+
+        Raises:
+            ValueError: If the path has wildcards.
+            TypeError: If the path crosses a value that is neither an object
+            nor a list.
+            IndexError: If a list index is out of range.
+        """
+        if self.wildcard:
+            raise ValueError(f"Cannot set a path with wildcards: {self.path}")
+        *parents, (last_key, last_index) = self.segments
+        for key, index in parents:
+            if isinstance(data, list) and index is not None:
+                data = data[index]
+            elif isinstance(data, dict):
+                data = data.setdefault(key, {})
+            else:
+                raise TypeError(f"Cannot descend into {type(data).__name__}")
+        if isinstance(data, list) and last_index is not None:
+            data[last_index] = value
+        elif isinstance(data, dict):
+            data[last_key] = value
+        else:
+            raise TypeError(f"Cannot set a member of {type(data).__name__}")
+        return data
+
+
+class _PathNode:
+    """
+    A node of the trie of a path set.
+    """
+
+    __slots__ = ("children", "wildcard", "ends")
+
+    def __init__(self):
+        self.children: Dict[str, Tuple[Optional[int], _PathNode]] = {}
+        self.wildcard: Optional[_PathNode] = None
+        self.ends: List[JSONPath] = []
+
+    def push_children(self, value: Any, stack: List[Tuple[Any, _PathNode]]):
+        """
+        Pushes the members of `value` matched by the children of the node.
+        """
+        if isinstance(value, dict):
+            for key, (_, child) in self.children.items():
+                member = value.get(key, _MISSING)
+                if member is not _MISSING:
+                    stack.append((member, child))
+        elif isinstance(value, list):
+            for key, (index, child) in self.children.items():
+                member = _step(value, key, index)
+                if member is not _MISSING:
+                    stack.append((member, child))
+        if self.wildcard is not None:
+            # Pushed last and reversed, so matches are collected in
+            # document order.
+            stack.extend(
+                (member, self.wildcard)
+                for member in reversed(list(_children(value)))
+            )
+
+
+class PathSet:
+    """
+    A set of paths extracted from documents in a single traversal.
+
+    The paths are merged into a trie, so a prefix shared by several paths
+    is walked once per document.
+
+    Attributes
+    ----------
+        paths (List[JSONPath]): The compiled paths.
+
+    Methods
+    -------
+        extract(data, default): Returns the values of all paths.
+    """
+
+    def __init__(self, paths: Iterable[Union[str, JSONPath]], sep: str = "/"):
+        """
+        Compiles a set of paths.
+
+        Parameters:
+            paths (Iterable[Union[str, JSONPath]]): The paths.
+            sep (str): The segment separator of paths given as strings.
+        """
+        self.paths = [
+            path if isinstance(path, JSONPath) else JSONPath(path, sep)
+            for path in paths
+        ]
+        self._root = _PathNode()
+        for path in self.paths:
+            node = self._root
+            for key, index in path.segments:
+                if key == WILDCARD:
+                    if node.wildcard is None:
+                        node.wildcard = _PathNode()
+                    node = node.wildcard
+                else:
+                    if key not in node.children:
+                        node.children[key] = (index, _PathNode())
+                    node = node.children[key][1]
+            node.ends.append(path)
+
+    def extract(self, data: Any, default: Any = None) -> Dict[str, Any]:
+        """
+        Extracts the values of all paths from a document.
+
+        Parameters:
+            data (Any): The JSON data.
+            default (Any): The value of paths without wildcards that do not
+            match.
+
+        Returns
+        -------
+            Dict[str, Any]: The value of each path, as returned by
+            `JSONPath.extract`, keyed by the path as written.
+        """
+        result = {
+            path.path: [] if path.wildcard else default for path in self.paths
+        }
+        stack = [(data, self._root)]
+        while stack:
+            value, node = stack.pop()
+            for path in node.ends:
+                if path.wildcard:
+                    result[path.path].append(value)
+                else:
+                    result[path.path] = value
+            node.push_children(value, stack)
+        return result
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def compile_path(path: str, sep: str = "/") -> JSONPath:
+    """
+    Returns the compiled form of a path, reusing it for repeated paths. Up
+    to `_CACHE_SIZE` paths are kept.
+
+    Parameters:
+        path (str): The path, such as "users/0/name".
+        sep (str): The segment separator.
+
+    Returns
+    -------
+        JSONPath: The compiled path.
+    """
+    try:
+        return _cache[path, sep]
+    except KeyError:
+        pass
+    if len(_cache) >= _CACHE_SIZE:
+        _cache.clear()
+    compiled = _cache[path, sep] = JSONPath(path, sep)
+    return compiled
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "JSONPath",
+    "PathSet",
+    "WILDCARD",
+    "compile_path",
+]
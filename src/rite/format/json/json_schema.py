@@ -0,0 +1,683 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - JSON Schema Module
+=========================
+
+This module validates JSON text and data. `check_syntax` checks that a
+string is strict JSON without building the objects it holds, and
+`SchemaValidator` validates data against a JSON Schema compiled once into
+a tree of closures, so each record is checked without interpreting the
+schema again.
+
+The supported keywords are the validation vocabulary of JSON Schema:
+
+- Any value: `type`, `enum`, `const`, `allOf`, `anyOf`, `oneOf`, `not`
+  and `$ref` to a pointer into the schema, such as "#/$defs/item".
+- Numbers: `minimum`, `maximum`, `exclusiveMinimum`, `exclusiveMaximum`
+  and `multipleOf`.
+- Strings: `minLength`, `maxLength` and `pattern`.
+- Arrays: `items`, `prefixItems`, `minItems`, `maxItems` and
+  `uniqueItems`.
+- Objects: `properties`, `required`, `additionalProperties`,
+  `patternProperties`, `minProperties` and `maxProperties`.
+
+Other keywords, such as `title` or `format`, are ignored.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import json
+import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+# Import | Libraries
+
+# Import | Local Modules
+from .json_backend import get_backend
+from .json_patch import escape_token, parse_pointer
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# A failed check returns the path of the failing value and a message.
+_Error = Tuple[Tuple[Any, ...], str]
+_Check = Callable[[Any], Optional[_Error]]
+
+_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "null": lambda value: value is None,
+    "boolean": lambda value: value is True or value is False,
+    "integer": lambda value: type(value) is int
+    or (type(value) is float and value.is_integer()),
+    "number": lambda value: type(value) is int or type(value) is float,
+    "string": lambda value: type(value) is str,
+    "array": lambda value: type(value) is list,
+    "object": lambda value: type(value) is dict,
+}
+
+
+def _reject_constant(name: str):
+    raise ValueError(f"Invalid JSON constant: {name}")
+
+
+# Builds no objects, and rejects NaN and Infinity, which are not JSON.
+_SYNTAX_DECODER = json.JSONDecoder(
+    object_pairs_hook=lambda pairs: None,
+    parse_constant=_reject_constant,
+)
+
+_STRICT_DECODER = json.JSONDecoder(parse_constant=_reject_constant)
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class ValidationError(ValueError):
+    """
+    Raised when data does not match a schema.
+
+    Attributes
+    ----------
+        path (str): JSON Pointer to the failing value.
+        message (str): What is wrong with it.
+    """
+
+    def __init__(self, path: str, message: str):
+        super().__init__(f"{path or '/'}: {message}")
+        self.path = path
+        self.message = message
+
+
+class SchemaValidator:
+    """
+    A JSON Schema compiled for validating many values.
+
+    Methods
+    -------
+        is_valid(value): Checks whether a value matches.
+        error(value): Returns why a value does not match.
+        validate(value): Raises if a value does not match.
+        iter_errors(values): Yields the values that do not match.
+    """
+
+    def __init__(self, schema: Union[Dict, bool]):
+        """
+        Compiles a schema.
+
+        Parameters:
+            schema (Union[Dict, bool]): The JSON Schema.
+
+        Raises:
+            ValueError: If the schema is malformed.
+        """
+        self.schema = schema
+        self._refs: Dict[str, Optional[_Check]] = {}
+        self._check = self._compile(schema)
+
+    def _compile(self, schema: Union[Dict, bool]) -> Optional[_Check]:
+        """
+        Returns the check of a schema, or None if it accepts anything.
+        """
+        if schema is True:
+            return None
+        if schema is False:
+            return lambda value: ((), "no value is allowed")
+        if not isinstance(schema, dict):
+            raise ValueError(f"Invalid schema: {schema!r}")
+        checks = [
+            check
+            for check in (
+                _compile_type(schema),
+                self._compile_ref(schema),
+                _compile_values(schema),
+                _compile_number(schema),
+                _compile_string(schema),
+                _compile_size(schema, list, "Items", "items"),
+                _compile_size(schema, dict, "Properties", "properties"),
+                _compile_required(schema),
+                _compile_unique(schema),
+                self._compile_items(schema),
+                self._compile_properties(schema),
+                self._compile_patterns(schema),
+                self._compile_additional(schema),
+                self._compile_combinators(schema),
+            )
+            if check is not None
+        ]
+        if not checks:
+            return None
+        if len(checks) == 1:
+            return checks[0]
+
+        def check_all(value: Any) -> Optional[_Error]:
+            for check in checks:
+                error = check(value)
+                if error is not None:
+                    return error
+            return None
+
+        return check_all
+
+    def _compile_ref(self, schema: Dict) -> Optional[_Check]:
+        if "$ref" not in schema:
+            return None
+        ref = schema["$ref"]
+        if not isinstance(ref, str) or not ref.startswith("#"):
+            raise ValueError(f"Only local references are supported: {ref}")
+        if ref not in self._refs:
+            # Registered before compiling, so recursive schemas terminate.
+            self._refs[ref] = None
+            target: Any = self.schema
+            for token in parse_pointer(ref[1:]):
+                try:
+                    target = target[
+                        int(token) if type(target) is list else token
+                    ]
+                except (KeyError, IndexError, TypeError, ValueError):
+                    raise ValueError(
+                        f"Unresolvable reference: {ref}"
+                    ) from None
+            self._refs[ref] = self._compile(target)
+        refs = self._refs
+
+        def check_ref(value: Any) -> Optional[_Error]:
+            check = refs[ref]
+            return None if check is None else check(value)
+
+        return check_ref
+
+    def _compile_items(self, schema: Dict) -> Optional[_Check]:
+        prefix = [
+            self._compile(item) for item in schema.get("prefixItems", ())
+        ]
+        items = self._compile(schema.get("items", True))
+        if items is None and not any(prefix):
+            return None
+
+        def check_items(value: Any) -> Optional[_Error]:
+            if type(value) is not list:
+                return None
+            for index, check in enumerate(prefix[: len(value)]):
+                if check is not None:
+                    error = check(value[index])
+                    if error is not None:
+                        return (index,) + error[0], error[1]
+            if items is not None:
+                for index in range(len(prefix), len(value)):
+                    error = items(value[index])
+                    if error is not None:
+                        return (index,) + error[0], error[1]
+            return None
+
+        return check_items
+
+    def _compile_properties(self, schema: Dict) -> Optional[_Check]:
+        properties = [
+            (key, check)
+            for key, check in (
+                (key, self._compile(sub))
+                for key, sub in schema.get("properties", {}).items()
+            )
+            if check is not None
+        ]
+        if not properties:
+            return None
+
+        def check_properties(value: Any) -> Optional[_Error]:
+            if type(value) is not dict:
+                return None
+            for key, check in properties:
+                if key in value:
+                    error = check(value[key])
+                    if error is not None:
+                        return (key,) + error[0], error[1]
+            return None
+
+        return check_properties
+
+    def _compile_patterns(self, schema: Dict) -> Optional[_Check]:
+        patterns = [
+            (re.compile(pattern), check)
+            for pattern, check in (
+                (pattern, self._compile(sub))
+                for pattern, sub in schema.get("patternProperties", {}).items()
+            )
+            if check is not None
+        ]
+        if not patterns:
+            return None
+
+        def check_patterns(value: Any) -> Optional[_Error]:
+            if type(value) is not dict:
+                return None
+            for key, member in value.items():
+                for pattern, check in patterns:
+                    if pattern.search(key):
+                        error = check(member)
+                        if error is not None:
+                            return (key,) + error[0], error[1]
+            return None
+
+        return check_patterns
+
+    def _compile_additional(self, schema: Dict) -> Optional[_Check]:
+        additional_schema = schema.get("additionalProperties", True)
+        additional = self._compile(additional_schema)
+        if additional is None:
+            return None
+        known = set(schema.get("properties", ()))
+        patterns = [
+            re.compile(pattern)
+            for pattern in schema.get("patternProperties", ())
+        ]
+
+        def check_additional(value: Any) -> Optional[_Error]:
+            if type(value) is not dict or value.keys() <= known:
+                return None
+            for key, member in value.items():
+                if key in known or any(p.search(key) for p in patterns):
+                    continue
+                if additional_schema is False:
+                    return (key,), "additional property not allowed"
+                error = additional(member)
+                if error is not None:
+                    return (key,) + error[0], error[1]
+            return None
+
+        return check_additional
+
+    def _compile_combinators(self, schema: Dict) -> Optional[_Check]:
+        all_of = [self._compile(sub) for sub in schema.get("allOf", ())]
+        all_of = [check for check in all_of if check is not None]
+        any_of = [self._compile(sub) for sub in schema.get("anyOf", ())]
+        one_of = [self._compile(sub) for sub in schema.get("oneOf", ())]
+        has_not = "not" in schema
+        negated = self._compile(schema["not"]) if has_not else None
+        if not (all_of or any_of or one_of or has_not):
+            return None
+
+        def check_combinators(value: Any) -> Optional[_Error]:
+            for check in all_of:
+                error = check(value)
+                if error is not None:
+                    return error
+            if any_of and not any(
+                check is None or check(value) is None for check in any_of
+            ):
+                return (), "expected a match of anyOf"
+            if one_of:
+                matches = sum(
+                    check is None or check(value) is None for check in one_of
+                )
+                if matches != 1:
+                    return (), f"expected one match of oneOf, got {matches}"
+            if has_not and (negated is None or negated(value) is None):
+                return (), "expected no match of not"
+            return None
+
+        return check_combinators
+
+    def is_valid(self, value: Any) -> bool:
+        """
+        Checks whether a value matches the schema.
+
+        Parameters:
+            value (Any): The JSON data.
+
+        Returns
+        -------
+            bool: True if the value matches.
+        """
+        return self._check is None or self._check(value) is None
+
+    def error(self, value: Any) -> Optional[ValidationError]:
+        """
+        Returns the first reason a value does not match the schema.
+
+        Parameters:
+            value (Any): The JSON data.
+
+        Returns
+        -------
+            Optional[ValidationError]: The error, or None if the value
+            matches.
+        """
+        error = None if self._check is None else self._check(value)
+        if error is None:
+            return None
+        path = "".join(f"/{escape_token(token)}" for token in error[0])
+        return ValidationError(path, error[1])
+
+    def validate(self, value: Any):
+        """
+        Validates a value against the schema.
+
+        Parameters:
+            value (Any): The JSON data.
+
+        Raises:
+            ValidationError: If the value does not match.
+        """
+        error = self.error(value)
+        if error is not None:
+            raise error
+
+    def iter_errors(
+        self, values: Iterable[Any]
+    ) -> Iterator[Tuple[int, ValidationError]]:
+        """
+        Validates many values, such as the records of a file.
+
+        Parameters:
+            values (Iterable[Any]): The JSON data.
+
+        Yields
+        ------
+            Tuple[int, ValidationError]: The index and error of each value
+            that does not match.
+        """
+        check = self._check
+        if check is None:
+            return
+        for index, value in enumerate(values):
+            if check(value) is not None:
+                yield index, self.error(value)
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _same(first: Any, second: Any) -> bool:
+    """
+    Compares JSON values, telling apart 1 and True.
+    """
+    return (
+        type(first) is type(second)
+        and first == second
+        or (
+            _TYPES["number"](first)
+            and _TYPES["number"](second)
+            and first == second
+        )
+    )
+
+
+def _unique(values: List) -> bool:
+    """
+    Checks that no two values of an array are equal.
+    """
+    dumps = get_backend().dumps
+    seen = set()
+    for value in values:
+        if type(value) in (dict, list):
+            key: Any = dumps(value, sort_keys=True)
+        elif type(value) is float and value.is_integer():
+            key = (int, int(value))
+        else:
+            key = (type(value), value)
+        if key in seen:
+            return False
+        seen.add(key)
+    return True
+
+
+def _compile_type(schema: Dict) -> Optional[_Check]:
+    if "type" not in schema:
+        return None
+    names = schema["type"]
+    names = [names] if isinstance(names, str) else list(names)
+    for name in names:
+        if name not in _TYPES:
+            raise ValueError(f"Unknown type: {name}")
+    message = f"expected {' or '.join(names)}"
+    if len(names) == 1:
+        test = _TYPES[names[0]]
+    else:
+        tests = [_TYPES[name] for name in names]
+
+        def test(value: Any) -> bool:
+            return any(test(value) for test in tests)
+
+    def check_type(value: Any) -> Optional[_Error]:
+        return None if test(value) else ((), message)
+
+    return check_type
+
+
+def _compile_values(schema: Dict) -> Optional[_Check]:
+    checks = []
+    if "const" in schema:
+        const = schema["const"]
+        checks.append(
+            lambda value: (
+                None if _same(value, const) else ((), f"expected {const!r}")
+            )
+        )
+    if "enum" in schema:
+        enum = list(schema["enum"])
+        message = f"expected one of {enum!r}"
+        checks.append(
+            lambda value: (
+                None
+                if any(_same(value, option) for option in enum)
+                else ((), message)
+            )
+        )
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+    return lambda value: checks[0](value) or checks[1](value)
+
+
+def _compile_number(schema: Dict) -> Optional[_Check]:
+    bounds = [
+        (schema.get("minimum"), lambda value, bound: value >= bound, ">="),
+        (schema.get("maximum"), lambda value, bound: value <= bound, "<="),
+        (
+            schema.get("exclusiveMinimum"),
+            lambda value, bound: value > bound,
+            ">",
+        ),
+        (
+            schema.get("exclusiveMaximum"),
+            lambda value, bound: value < bound,
+            "<",
+        ),
+    ]
+    bounds = [bound for bound in bounds if bound[0] is not None]
+    multiple_of = schema.get("multipleOf")
+    if not bounds and multiple_of is None:
+        return None
+
+    def check_number(value: Any) -> Optional[_Error]:
+        if type(value) is not int and type(value) is not float:
+            return None
+        for bound, test, operator in bounds:
+            if not test(value, bound):
+                return (), f"expected a number {operator} {bound}"
+        if multiple_of is not None:
+            if type(value) is int and type(multiple_of) is int:
+                remainder = value % multiple_of
+            else:
+                # Tolerates the rounding of decimal fractions, as 0.3 / 0.1.
+                quotient = value / multiple_of
+                remainder = abs(quotient - round(quotient)) > 1e-9
+            if remainder:
+                return (), f"expected a multiple of {multiple_of}"
+        return None
+
+    return check_number
+
+
+def _compile_string(schema: Dict) -> Optional[_Check]:
+    size = _compile_size(schema, str, "Length", "characters")
+    if "pattern" not in schema:
+        return size
+    pattern = re.compile(schema["pattern"])
+    message = f"expected a match of {pattern.pattern!r}"
+
+    def check_string(value: Any) -> Optional[_Error]:
+        if type(value) is not str:
+            return None
+        if size is not None:
+            error = size(value)
+            if error is not None:
+                return error
+        return None if pattern.search(value) else ((), message)
+
+    return check_string
+
+
+def _compile_size(
+    schema: Dict, kind: type, keyword: str, unit: str
+) -> Optional[_Check]:
+    """
+    Compiles the `min` and `max` keywords bounding the length of a string,
+    array or object, such as `minItems` and `maxItems`.
+    """
+    low = schema.get(f"min{keyword}")
+    high = schema.get(f"max{keyword}")
+    if low is None and high is None:
+        return None
+
+    def check_size(value: Any) -> Optional[_Error]:
+        if type(value) is not kind:
+            return None
+        if low is not None and len(value) < low:
+            return (), f"expected at least {low} {unit}"
+        if high is not None and len(value) > high:
+            return (), f"expected at most {high} {unit}"
+        return None
+
+    return check_size
+
+
+def _compile_required(schema: Dict) -> Optional[_Check]:
+    required = list(schema.get("required", ()))
+    if not required:
+        return None
+    keys = set(required)
+
+    def check_required(value: Any) -> Optional[_Error]:
+        if type(value) is not dict or keys <= value.keys():
+            return None
+        missing = [key for key in required if key not in value]
+        return (), f"missing required property {missing[0]!r}"
+
+    return check_required
+
+
+def _compile_unique(schema: Dict) -> Optional[_Check]:
+    if not schema.get("uniqueItems", False):
+        return None
+
+    def check_unique(value: Any) -> Optional[_Error]:
+        if type(value) is not list or _unique(value):
+            return None
+        return (), "expected unique items"
+
+    return check_unique
+
+
+def check_syntax(data: Union[str, bytes]) -> bool:
+    """
+    Checks that a string is strict JSON. Objects are not built, and NaN
+    and Infinity, which the standard library accepts, are rejected.
+
+    Parameters:
+        data (Union[str, bytes]): The JSON text, or its UTF-8 bytes.
+
+    Returns
+    -------
+        bool: True if the text is a single valid JSON value.
+    """
+    if isinstance(data, (bytes, bytearray)):
+        try:
+            data = data.decode("utf-8")
+        except UnicodeDecodeError:
+            return False
+    try:
+        _SYNTAX_DECODER.decode(data)
+    except ValueError:
+        return False
+    return True
+
+
+def parse_strict(data: Union[str, bytes]) -> Any:
+    """
+    Parses strict JSON, the text `check_syntax` accepts: NaN and Infinity
+    are rejected.
+
+    Parameters:
+        data (Union[str, bytes]): The JSON text, or its UTF-8 bytes.
+
+    Returns
+    -------
+        Any: The parsed data.
+
+    Raises:
+        ValueError: If the text is not a single valid JSON value.
+    """
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return _STRICT_DECODER.decode(data)
+
+
+def compile_schema(schema: Union[Dict, bool]) -> SchemaValidator:
+    """
+    Compiles a JSON Schema for validating many values.
+
+    Parameters:
+        schema (Union[Dict, bool]): The JSON Schema.
+
+    Returns
+    -------
+        SchemaValidator: The compiled validator.
+
+    Raises:
+        ValueError: If the schema is malformed.
+    """
+    return SchemaValidator(schema)
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "SchemaValidator",
+    "ValidationError",
+    "check_syntax",
+    "compile_schema",
+    "parse_strict",
+]
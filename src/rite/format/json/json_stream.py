@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - JSON Stream Module
+=========================
+
+This module provides an incremental JSON reader. It walks a document from a
+file in fixed-size chunks and only builds the values selected by a path,
+such as `items.*`, so files much larger than memory can be processed one
+record at a time.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import json
+import re
+from typing import IO, Any, Iterator, List
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = frozenset(" \t\n\r,:]}")
+_STRUCTURE = re.compile(r'["\[\]{}]')
+_STRING_END = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+_DECODER = json.JSONDecoder()
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class _JSONStream:
+    """
+    A cursor over a JSON text read from a file in chunks. Consumed text is
+    dropped from the buffer, so memory is bounded by the chunk size and the
+    largest value built.
+    """
+
+    def __init__(self, file: IO[str], chunk_size: int):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int = 0) -> bool:
+        """
+        Reads the next chunk, of at least `size` characters, dropping the
+        consumed part of the buffer. Returns False at the end of the file.
+        """
+        if self._eof:
+            return False
+        chunk = self._file.read(max(size, self._chunk_size))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def peek(self) -> str:
+        """
+        Skips whitespace and returns the next character, or "" at the end.
+        """
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """
+        Consumes the next character, which must be one of `chars`.
+        """
+        char = self.peek()
+        if not char or char not in chars:
+            raise self._error(f"Expecting one of {chars!r}")
+        self._pos += 1
+        return char
+
+    def decode(self) -> Any:
+        """
+        Builds the next value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Double the pending text so large values are decoded a
+                # logarithmic number of times.
+                if self._fill(len(self._buffer) - self._pos):
+                    continue
+                raise
+            # A number or literal may continue in the next chunk, unless it
+            # is followed by a delimiter.
+            complete = self._buffer[self._pos] in '"[{' or (
+                end < len(self._buffer) and self._buffer[end] in _DELIMITERS
+            )
+            if complete or not self._fill():
+                self._pos = end
+                return value
+
+    def skip(self):
+        """
+        Moves past the next value without building it.
+        """
+        char = self.peek()
+        if char == '"':
+            self._skip_string()
+        elif char in ("[", "{"):
+            self._skip_container()
+        else:
+            self.decode()
+
+    def _skip_string(self):
+        """
+        Moves past the string starting at the cursor.
+        """
+        while True:
+            match = _STRING_END.match(self._buffer, self._pos + 1)
+            if match is not None:
+                self._pos = match.end()
+                return
+            if not self._fill(len(self._buffer) - self._pos):
+                raise self._error("Unterminated string")
+
+    def _skip_container(self):
+        """
+        Moves past the array or object starting at the cursor.
+        """
+        depth = 0
+        while True:
+            match = _STRUCTURE.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+                if not self._fill():
+                    raise self._error("Unterminated array or object")
+                continue
+            self._pos = match.start()
+            char = match.group()
+            if char == '"':
+                self._skip_string()
+                continue
+            self._pos += 1
+            depth += 1 if char in "[{" else -1
+            if depth == 0:
+                return
+
+    def select(self, segments: List[str]) -> Iterator[Any]:
+        """
+        Yields the values below the cursor matching the path segments, and
+        moves past the current value.
+        """
+        if not segments:
+            yield self.decode()
+            return
+        segment, rest = segments[0], segments[1:]
+        char = self.peek()
+        if char == "[" and (segment == "*" or segment.isdigit()):
+            for index in self._items():
+                if segment == "*" and not rest:
+                    yield self.decode()
+                elif segment == "*" or int(segment) == index:
+                    yield from self.select(rest)
+                else:
+                    self.skip()
+        elif char == "{":
+            for key in self._members():
+                if segment in ("*", key):
+                    yield from self.select(rest)
+                else:
+                    self.skip()
+        else:
+            self.skip()
+
+    def select_values(self, segments: List[str]) -> Iterator[Any]:
+        """
+        Yields the values matching the path segments in a sequence of
+        top-level values, which the first segment indexes like an array.
+        """
+        segment, rest = segments[0], segments[1:]
+        index = 0
+        while self.peek():
+            if segment == "*" and not rest:
+                yield self.decode()
+            elif segment in ("*", str(index)):
+                yield from self.select(rest)
+            else:
+                self.skip()
+            index += 1
+
+    def _items(self) -> Iterator[int]:
+        """
+        Iterates over an array, stopping before each element. The caller
+        must consume the element.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if self.expect(",]") == "]":
+                return
+
+    def _members(self) -> Iterator[str]:
+        """
+        Iterates over an object, stopping before each value with its key.
+        The caller must consume the value.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self._error("Expecting property name")
+            key = self.decode()
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def iter_json(
+    file_path: str,
+    path: str = "*",
+    chunk_size: int = 1024 * 1024,
+    lines: bool = False,
+) -> Iterator[Any]:
+    """
+    Reads the values selected by a path from a JSON file, one at a time.
+
+    The path is a dot-separated list of object keys, array indexes and `*`
+    wildcards matching every member or element: "*" yields the elements of
+    a top-level array, "items.*" those of the `items` array, and "" the
+    whole document. Values outside the path are skipped without being
+    built.
+
+    With `lines`, the file holds a sequence of top-level values, such as
+    JSON Lines or concatenated documents, and the path indexes them like
+    the elements of an array: "*" yields each record, "*.id" the `id` of
+    each record and "0" the first record.
+
+    Parameters:
+        file_path (str): The path to the JSON file.
+        path (str): The path of the values to yield.
+        chunk_size (int): Number of characters read at a time.
+        lines (bool): Whether the file holds several top-level values.
+
+    Yields
+    ------
+        Any: The selected values, in document order.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON, or holds
+            several top-level values without `lines`.
+    """
+    segments = path.split(".") if path else []
+    with open(file_path, "r", encoding="utf-8") as file:
+        stream = _JSONStream(file, chunk_size)
+        if lines:
+            yield from stream.select_values(segments or ["*"])
+            return
+        if not stream.peek():
+            raise stream._error("Expecting value")
+        yield from stream.select(segments)
+        if stream.peek():
+            raise stream._error("Extra data")
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "iter_json",
+]
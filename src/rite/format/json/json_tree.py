@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - JSON Tree Module
+=======================
+
+This module provides traversals of nested JSON data: flattening, deep
+merging, key search and comparison. They walk the data with an explicit
+stack instead of recursion, so they are not limited by the interpreter's
+recursion depth and do not build intermediate dictionaries per level.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def iter_flatten(
+    data: Dict, parent_key: str = "", sep: str = ".", lists: bool = False
+) -> Iterator[Tuple[Any, Any]]:
+    """
+    Yields the leaves of nested data with their joined key paths, in
+    document order. Empty objects have no leaves and are omitted.
+
+    Parameters:
+        data (Dict): The JSON data to flatten.
+        parent_key (str): Prefix of every path.
+        sep (str): Separator for nested keys.
+        lists (bool): Also descend into lists, using element indexes as
+        keys. By default lists are leaves.
+
+    Yields
+    ------
+        Tuple[Any, Any]: The path and the value of each leaf. Top-level keys
+        are yielded as they are when there is no prefix.
+    """
+    stack: List[Tuple[Any, Iterator]] = [(parent_key, iter(data.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            path = f"{prefix}{sep}{key}" if prefix != "" else key
+            if isinstance(value, dict):
+                stack.append((path, iter(value.items())))
+                break
+            if lists and isinstance(value, list):
+                stack.append((path, enumerate(value)))
+                break
+            yield path, value
+        else:
+            stack.pop()
+
+
+def flatten(
+    data: Dict, parent_key: str = "", sep: str = ".", lists: bool = False
+) -> Dict:
+    """
+    Flattens nested data into a single level. See `iter_flatten`.
+
+    Parameters:
+        data (Dict): The JSON data to flatten.
+        parent_key (str): Prefix of every key.
+        sep (str): Separator for nested keys.
+        lists (bool): Also flatten lists, using element indexes as keys.
+
+    Returns
+    -------
+        Dict: The flattened data.
+    """
+    return dict(iter_flatten(data, parent_key, sep, lists))
+
+
+def deep_merge(target: Dict, source: Dict) -> Dict:
+    """
+    Merges `source` into `target` in place. Objects present in both are
+    merged; any other value in `source` replaces the one in `target`.
+
+    Parameters:
+        target (Dict): The object to update.
+        source (Dict): The object to merge into it.
+
+    Returns
+    -------
+        Dict: The updated `target`.
+    """
+    stack = [(target, source)]
+    while stack:
+        into, values = stack.pop()
+        for key, value in values.items():
+            current = into.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                into[key] = value
+    return target
+
+
+def find_key(data: Any, key: Any) -> Any:
+    """
+    Searches nested data for a key, depth first in document order,
+    descending into objects and lists.
+
+    Parameters:
+        data (Any): The JSON data to search in.
+        key (Any): The key to search for.
+
+    Returns
+    -------
+        Any: The first non-None value found for the key, or None. The
+        children of an object holding the key with a None value are not
+        searched.
+    """
+    stack: List[Iterator] = [iter((data,))]
+    while stack:
+        for node in stack[-1]:
+            if isinstance(node, dict):
+                if key in node:
+                    value = node[key]
+                    if value is not None:
+                        return value
+                    continue
+                stack.append(iter(node.values()))
+                break
+            if isinstance(node, list):
+                stack.append(iter(node))
+                break
+        else:
+            stack.pop()
+    return None
+
+
+def diff(
+    first: Dict, second: Dict, deep: bool = False, sep: str = "."
+) -> Dict:
+    """
+    Finds the differences between two objects.
+
+    Parameters:
+        first (Dict): The first object.
+        second (Dict): The second object.
+        deep (bool): Compare nested objects key by key and report the paths
+        of the differing leaves, joined with `sep`. By default nested
+        objects are compared as a whole under their top-level key.
+        sep (str): Separator for nested keys.
+
+    Returns
+    -------
+        Dict: The differing keys or paths, with a description of each
+        difference.
+    """
+    result: Dict = {}
+    stack: List[Tuple[Any, Dict, Dict]] = [("", first, second)]
+    while stack:
+        prefix, left, right = stack.pop()
+        for key, value in left.items():
+            path = f"{prefix}{sep}{key}" if prefix != "" else key
+            if key not in right:
+                result[path] = f"Only in first: {value}"
+                continue
+            other = right[key]
+            if value is other:
+                continue
+            if deep and isinstance(value, dict) and isinstance(other, dict):
+                stack.append((path, value, other))
+            elif value != other:
+                result[path] = f"First: {value}, Second: {other}"
+        for key, value in right.items():
+            if key not in left:
+                path = f"{prefix}{sep}{key}" if prefix != "" else key
+                result[path] = f"Only in second: {value}"
+    return result
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "deep_merge",
+    "diff",
+    "find_key",
+    "flatten",
+    "iter_flatten",
+]
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - JSON YAML Module
+=======================
+
+This module converts between JSON data and YAML. It uses the libyaml
+based `CSafeLoader` and `CSafeDumper` when PyYAML was built with libyaml,
+and the pure Python safe loader and dumper otherwise. Files are read and
+written as streams, and multi-document YAML is read one document at a
+time.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+from typing import IO, Any, Iterable, Iterator, List, Optional, Union
+
+# Import | Libraries
+import yaml
+
+# Import | Local Modules
+from ...path.file.file_atomic import open_output
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+LIBYAML = Loader is not yaml.SafeLoader
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def load_yaml(data: Union[str, bytes, IO]) -> Any:
+    """
+    Parses a YAML document.
+
+    Parameters:
+        data (Union[str, bytes, IO]): The YAML text, or a file to read it
+        from.
+
+    Returns
+    -------
+        Any: The data.
+
+    Raises:
+        yaml.YAMLError: If the text is not valid YAML or holds several
+        documents.
+    """
+    return yaml.load(data, Loader=Loader)
+
+
+def iter_yaml(data: Union[str, bytes, IO]) -> Iterator[Any]:
+    """
+    Parses the documents of a YAML stream, one at a time.
+
+    Parameters:
+        data (Union[str, bytes, IO]): The YAML text, or a file to read it
+        from incrementally.
+
+    Yields
+    ------
+        Any: The documents, in order.
+
+    Raises:
+        yaml.YAMLError: If the text is not valid YAML.
+    """
+    return yaml.load_all(data, Loader=Loader)
+
+
+def dump_yaml(data: Any, stream: Optional[IO] = None, **options: Any) -> Any:
+    """
+    Serializes data to a YAML document, in block style with sorted keys
+    like `yaml.dump`.
+
+    Parameters:
+        data (Any): The data to serialize.
+        stream (Optional[IO]): A file to write to, or None to return the text.
+        **options (Any): Options of `yaml.dump`, such as `sort_keys`.
+
+    Returns
+    -------
+        Any: The YAML text, or None when written to `stream`.
+
+    Raises:
+        yaml.representer.RepresenterError: If the data holds values that
+        are not plain data.
+    """
+    return yaml.dump(data, stream, Dumper=Dumper, **options)
+
+
+def read_yaml_file(file_path: str) -> Any:
+    """
+    Reads a single YAML document from a file.
+
+    Parameters:
+        file_path (str): The path to the YAML file.
+
+    Returns
+    -------
+        Any: The data.
+    """
+    with open(file_path, "rb") as file:
+        return load_yaml(file)
+
+
+def iter_yaml_file(file_path: str) -> Iterator[Any]:
+    """
+    Reads the documents of a YAML file, one at a time, without reading the
+    whole file first.
+
+    Parameters:
+        file_path (str): The path to the YAML file.
+
+    Yields
+    ------
+        Any: The documents, in order.
+    """
+    with open(file_path, "rb") as file:
+        yield from iter_yaml(file)
+
+
+def write_yaml_file(
+    file_path: str,
+    documents: Iterable[Any],
+    atomic: bool = True,
+    **options: Any,
+) -> int:
+    """
+    Writes YAML documents to a file, each as it is produced, so a
+    generator can be streamed to disk. See `open_output` for atomic
+    writes.
+
+    Parameters:
+        file_path (str): The path to the YAML file.
+        documents (Iterable[Any]): The documents to write.
+        atomic (bool): Replace the file only once it is completely written.
+        **options (Any): Options of `yaml.dump`.
+
+    Returns
+    -------
+        int: The number of documents written.
+    """
+    count = 0
+
+    def counted() -> Iterator[Any]:
+        nonlocal count
+        for document in documents:
+            count += 1
+            yield document
+
+    with open_output(file_path, atomic=atomic) as file:
+        yaml.dump_all(
+            counted(), file, Dumper=Dumper, encoding="utf-8", **options
+        )
+    return count
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "Dumper",
+    "LIBYAML",
+    "Loader",
+    "dump_yaml",
+    "iter_yaml",
+    "iter_yaml_file",
+    "load_yaml",
+    "read_yaml_file",
+    "write_yaml_file",
+]
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - Atomic File Module
+=========================
+
+This module writes files safely. A file is written to a temporary file
+next to the target and renamed over it once complete, so readers and
+crashes see either the old or the new file, never a truncated one. The
+write buffer size and the fsync policy are configurable.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import contextlib
+import io
+import os
+import secrets
+from typing import IO, Iterator, List
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+# Flush nothing to disk, the file before it is renamed, or also the
+# directory holding it, so the rename itself survives a power loss.
+FSYNC_POLICIES = ("none", "file", "full")
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _fsync_directory(path: str):
+    """
+    Flushes a directory entry to disk, where the platform allows it.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@contextlib.contextmanager
+def open_output(
+    file_path: str,
+    atomic: bool = True,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    fsync: str = "none",
+) -> Iterator[IO[bytes]]:
+    """
+    Opens a file for writing in binary mode, replacing it when the block
+    exits without an error.
+
+    Parameters:
+        file_path (str): The path to the file.
+        atomic (bool): Write to a temporary file in the same directory and
+        rename it over `file_path` at the end. The temporary file is
+        removed on error and the original file is left unchanged.
+        buffer_size (int): Size of the write buffer, in bytes.
+        fsync (str): "none", "file" to flush the file to disk before it
+        is closed, or "full" to also flush the directory entry.
+
+    Yields
+    ------
+        IO[bytes]: The file to write to.
+
+    Raises:
+        ValueError: If the fsync policy is unknown.
+    """
+    if fsync not in FSYNC_POLICIES:
+        raise ValueError(f"Unknown fsync policy: {fsync}")
+    target = os.path.realpath(file_path)
+    directory, name = os.path.split(target)
+    if atomic:
+        path = os.path.join(directory, f".{name}.{secrets.token_hex(4)}.tmp")
+        # Created like a new file, so the umask applies.
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        file = io.open(fd, "wb", buffering=buffer_size)
+    else:
+        path = target
+        file = open(target, "wb", buffering=buffer_size)
+    try:
+        with file:
+            yield file
+            if fsync != "none":
+                file.flush()
+                os.fsync(file.fileno())
+        if atomic:
+            with contextlib.suppress(OSError):
+                os.chmod(path, os.stat(target).st_mode & 0o7777)
+            os.replace(path, target)
+    except BaseException:
+        if atomic:
+            with contextlib.suppress(OSError):
+                os.unlink(path)
+        raise
+    if fsync == "full":
+        _fsync_directory(directory)
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "DEFAULT_BUFFER_SIZE",
+    "FSYNC_POLICIES",
+    "open_output",
+]
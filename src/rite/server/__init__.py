@@ -25,7 +25,14 @@ from typing import List
 
 # Import | Local Modules
 from .server_http import BaseHTTPServer
+from .server_http_metrics import RouteMetrics
+from .server_http_middleware import ResponseCache
+from .server_http_pool import ThreadPoolHTTPServer
+from .server_http_router import Router
 from .server_sqlite import SQLiteServer
+from .server_sqlite_async import AsyncSQLiteServer
+from .server_sqlite_cache import QueryCache
+from .server_sqlite_pool import SQLiteConnectionPool
 
 # =============================================================================
 # Exports
@@ -23,15 +23,56 @@ built-in http.server library.
 from __future__ import annotations
 
 import logging
+import mimetypes
+import os
+import random
+import select
+import time
 import urllib.parse
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import (
+    BaseHTTPRequestHandler,
+    HTTPServer,
+    ThreadingHTTPServer,
+)
 
 # Import | Standard Library
-from typing import List
+from email.utils import formatdate
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # Import | Libraries
 
 # Import | Local Modules
+from .server_http_middleware import (
+    ResponseCache,
+    body_etag,
+    compress_body,
+    is_compressible,
+    negotiate_encoding,
+)
+from .server_http_metrics import RouteMetrics, access_logger
+from .server_http_pool import ThreadPoolHTTPServer
+from .server_http_router import Router
+from .server_http_static import (
+    etag_matches,
+    file_etag,
+    is_not_modified,
+    parse_range,
+    resolve_path,
+)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+SERVER_MODES: List[str] = ["single", "threading", "pool"]
+
+# Seconds between checks for waiting connections while a kept-alive
+# connection is idle.
+_IDLE_POLL_INTERVAL = 0.05
+
+
+_logger = logging.getLogger(__name__)
 
 
 # =============================================================================
@@ -46,93 +87,761 @@ class BaseHTTPServer(BaseHTTPRequestHandler):
 
     A simple HTTP server handler class that responds to GET and POST requests.
 
+    Requests are dispatched through `router`. Each subclass gets its own copy
+    of its parent's routes, so routes registered with `route` on a subclass
+    do not leak into other handlers.
+
     Attributes
     ----------
-        None
+        router (Router): The routes served by this handler class.
+        path_params (Dict[str, str]): Parameters of the matched route.
+        query (Dict[str, List[str]]): Query parameters, parsed on first use.
+        timeout (float): Seconds an idle keep-alive connection is kept open.
+        disable_nagle_algorithm (bool): Send small responses immediately
+        instead of waiting for the client to acknowledge the headers.
+        max_form_size (int): Largest url-encoded POST body parsed by the
+        default POST handler.
+        compression (Tuple[str, ...]): Content encodings offered to clients,
+        in order of preference. Empty to disable compression.
+        compress_min_size (int): Smallest response body compressed.
+        compress_level (int): Compression level, from 1 to 9.
+        etag_responses (bool): Add an ETag to generated 200 responses and
+        answer matching `If-None-Match` requests with 304.
+        response_cache (Optional[ResponseCache]): Cache for the responses to
+        routed GET requests, or None to disable caching.
+        access_log_sample_rate (float): Fraction of requests written to the
+        access log. Server errors are always written.
+        metrics (RouteMetrics): Latency histograms per route, served at
+        `/metrics`.
 
     Methods
     -------
+        route(path, methods): Class method decorator registering a handler.
+        static(prefix, directory): Class method serving a directory.
+        iter_body(chunk_size): Stream the request body.
+        serve_file(file_path, content_type): Send a file with validators
+        and range support.
         do_get(): Handle GET requests.
         do_post(): Handle POST requests.
+        handle_index(): Serve the welcome page.
+        handle_info(): Serve the parsed query parameters.
+        handle_metrics(): Serve the latency histograms.
         _send_response(status_code, content, content_type): Helper method to
         send HTTP responses.
         _handle_404(): Helper method to handle 404 Not Found responses.
-        run(server_class, handler_class, port): Static method to run the
-        server.
+        create_server(handler_class, port, mode, workers, queue_size,
+        keep_alive): Static method to create a server without starting it.
+        run(server_class, handler_class, port, mode, workers, queue_size):
+        Static method to run the server.
     """
 
-    def do_get(self):
+    timeout = 15
+    disable_nagle_algorithm = True
+    max_form_size = 1024 * 1024
+    max_drain_size = 1024 * 1024
+    compression: Tuple[str, ...] = ("gzip", "deflate")
+    compress_min_size = 1024
+    compress_level = 6
+    etag_responses = True
+    response_cache: Optional[ResponseCache] = None
+    access_log_sample_rate = 1.0
+    metrics = RouteMetrics()
+    router = Router()
+    route_pattern: Optional[str] = None
+    _cache_key: Optional[Tuple[str, Optional[str]]] = None
+    _served = 0
+    _body_state: Optional[str] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.router = cls.router.copy()
+
+    @classmethod
+    def route(cls, path: str, methods: Iterable[str] = ("GET",)) -> Callable:
         """
-        Handle GET requests. Parses the request path and query parameters.
+        Decorator registering a function as the handler of a path.
+
+        The function is called with the handler instance and the path
+        parameters as keyword arguments, and sends its own response.
+
+        Parameters:
+            path (str): The path, optionally with `{name}` segments.
+            methods (Iterable[str]): The HTTP methods to register.
 
         Returns
         -------
-            None
+            Callable: The decorator.
         """
-        parsed_path = urllib.parse.urlparse(self.path)
-        path = parsed_path.path
-        query = urllib.parse.parse_qs(parsed_path.query)
 
-        logging.info(
-            "GET request,\nPath: %s\nQuery: %s\nHeaders:\n%s",
-            path,
-            query,
-            self.headers,
+        def decorator(func: Callable) -> Callable:
+            for method in methods:
+                cls.router.add(method, path, func)
+            return func
+
+        return decorator
+
+    @classmethod
+    def static(cls, prefix: str, directory: str):
+        """
+        Serves the files of a directory below a path prefix.
+
+        Parameters:
+            prefix (str): The path prefix, such as "/static".
+            directory (str): The directory to serve.
+        """
+
+        def serve(self, file_path):
+            path = resolve_path(directory, file_path)
+            if path is None:
+                self._handle_404()
+            else:
+                self.serve_file(path)
+
+        cls.router.add(
+            "GET", f"{prefix.rstrip('/')}/{{file_path:path}}", serve
         )
 
-        if path == "/":
-            self._send_response(
-                200, "<h1>Welcome to the Python HTTP Server</h1>", "text/html"
-            )
-        elif path == "/info":
-            self._send_response(200, str(query), "text/plain")
-        else:
+    @property
+    def query(self) -> Dict[str, List[str]]:
+        """
+        The query parameters of the request, parsed on first access.
+
+        Returns
+        -------
+            Dict[str, List[str]]: Query parameter names and their values.
+        """
+        if self._query is None:
+            self._query = urllib.parse.parse_qs(self._query_string)
+        return self._query
+
+    def _dispatch(self, method: str) -> bool:
+        """
+        Helper method to run the handler registered for the request.
+
+        Parameters:
+            method (str): The HTTP method of the request.
+
+        Returns
+        -------
+            bool: True if a route matched, False otherwise.
+        """
+        path, _, self._query_string = self.path.partition("?")
+        self._query = None
+        self.request_path = path
+        match = self.router.match_route(method, path)
+        if match is None:
+            return False
+        handler, self.path_params, self.route_pattern = match
+        if method == "GET" and self._may_cache():
+            key = (self.path, self._content_encoding())
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                self._send_body(200, *cached)
+                return True
+            self._cache_key = key
+        handler(self, **self.path_params)
+        return True
+
+    def _may_cache(self) -> bool:
+        """
+        Helper method to check whether the response cache may be used for
+        the request.
+
+        Returns
+        -------
+            bool: True if caching is enabled and the request is anonymous,
+            without credentials or cookies, and does not ask to bypass
+            caches.
+        """
+        if self.response_cache is None:
+            return False
+        if "Authorization" in self.headers or "Cookie" in self.headers:
+            return False
+        cache_control = self.headers.get("Cache-Control", "").lower()
+        return "no-cache" not in cache_control and (
+            "no-store" not in cache_control
+        )
+
+    @staticmethod
+    def _may_store(headers: Dict[str, str]) -> bool:
+        """
+        Helper method to check whether a response may be stored in the
+        shared response cache.
+
+        Parameters:
+            headers (Dict[str, str]): Response headers.
+
+        Returns
+        -------
+            bool: False if the response sets a cookie, is private or not to
+            be stored, or varies on a header other than Accept-Encoding,
+            which is part of the cache key.
+        """
+        cache_control = headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control or "private" in cache_control:
+            return False
+        vary = {
+            name.strip().lower() for name in headers.get("Vary", "").split(",")
+        }
+        return "Set-Cookie" not in headers and vary <= {"", "accept-encoding"}
+
+    def _content_encoding(self) -> Optional[str]:
+        """
+        Helper method to negotiate the content encoding of the response.
+
+        Returns
+        -------
+            Optional[str]: The encoding to use, or None.
+        """
+        if not self.compression:
+            return None
+        return negotiate_encoding(
+            self.headers.get("Accept-Encoding"), self.compression
+        )
+
+    def do_get(self):
+        """
+        Handle GET requests. Dispatches to the registered routes.
+
+        Returns
+        -------
+            None
+        """
+        if not self._dispatch("GET"):
             self._handle_404()
 
     def do_post(self):
         """
-        Handle POST requests. Parses the posted data.
+        Handle POST requests. Dispatches to the registered routes, or parses
+        the posted data if no route matches.
 
         Returns
         -------
             None
         """
-        content_length = int(self.headers["Content-Length"])
-        post_data = urllib.parse.parse_qs(
-            self.rfile.read(content_length).decode("utf-8")
+        if self._dispatch("POST"):
+            return
+
+        size = 0
+        chunks = []
+        form = _logger.isEnabledFor(logging.DEBUG) and self.headers.get(
+            "Content-Type", ""
+        ).startswith("application/x-www-form-urlencoded")
+        for chunk in self.iter_body():
+            size += len(chunk)
+            if form and size <= self.max_form_size:
+                chunks.append(chunk)
+        if form and size <= self.max_form_size:
+            _logger.debug(
+                "POST %s: %s",
+                self.path,
+                urllib.parse.parse_qs(b"".join(chunks).decode("utf-8")),
+            )
+
+        self._send_response(
+            200,
+            "<h1>POST request received</h1>",
+            "text/html",
         )
 
-        logging.info(
-            "POST request,\nPath: %s\nHeaders:\n%s\nBody:\n%s\n",
-            self.path,
-            self.headers,
-            post_data,
+    def iter_body(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """
+        Stream the request body, without reading it into memory at once.
+        Both `Content-Length` and chunked transfer encoding are supported.
+
+        Parameters:
+            chunk_size (int): Maximum number of bytes per chunk.
+
+        Yields
+        ------
+            bytes: The next part of the body.
+        """
+        self._body_state = "reading"
+        if "chunked" in self.headers.get("Transfer-Encoding", "").lower():
+            while True:
+                line = self.rfile.readline(65537)
+                size = int(line.split(b";", 1)[0].strip() or b"0", 16)
+                if size == 0:
+                    # Skip trailers up to the terminating empty line.
+                    while self.rfile.readline(65537).strip():
+                        pass
+                    self._body_state = "done"
+                    return
+                while size > 0:
+                    chunk = self.rfile.read(min(size, chunk_size))
+                    if not chunk:
+                        return
+                    size -= len(chunk)
+                    yield chunk
+                self.rfile.readline(3)
+        remaining = int(self.headers.get("Content-Length", 0))
+        while remaining > 0:
+            chunk = self.rfile.read(min(remaining, chunk_size))
+            if not chunk:
+                return
+            remaining -= len(chunk)
+            yield chunk
+        self._body_state = "done"
+
+    def _body_length(self) -> Optional[int]:
+        """
+        Helper method to read the announced length of the request body.
+
+        Returns
+        -------
+            Optional[int]: The Content-Length, or None for a chunked body.
+        """
+        if "chunked" in self.headers.get("Transfer-Encoding", "").lower():
+            return None
+        return int(self.headers.get("Content-Length", 0))
+
+    def _drain_body(self):
+        """
+        Helper method to discard the part of the request body the handler
+        did not read, so it is not parsed as the next request. The
+        connection is closed instead when the handler stopped reading
+        part way, or the body is malformed or larger than `max_drain_size`.
+
+        Returns
+        -------
+            None
+        """
+        if self._body_state == "done":
+            return
+        length = self._body_length()
+        if length == 0:
+            return
+        too_large = length is not None and length > self.max_drain_size
+        if self._body_state is not None or too_large:
+            self.close_connection = True
+            return
+        size = 0
+        try:
+            for chunk in self.iter_body():
+                size += len(chunk)
+                if size > self.max_drain_size:
+                    break
+        except (OSError, ValueError):
+            pass
+        if self._body_state != "done":
+            self.close_connection = True
+
+    def serve_file(self, file_path: str, content_type: Optional[str] = None):
+        """
+        Send a file, answering conditional requests with 304 and byte range
+        requests with 206. The body is copied by the kernel with
+        `sendfile` where available.
+
+        Parameters:
+            file_path (str): Path of the file to send.
+            content_type (Optional[str]): MIME type of the file. Guessed from
+            the file name by default.
+
+        Returns
+        -------
+            None
+        """
+        headers = {
+            "Content-Type": content_type
+            or mimetypes.guess_type(file_path)[0]
+            or "application/octet-stream"
+        }
+        file_path = self._precompressed(file_path, headers)
+        try:
+            file = open(file_path, "rb")
+        except OSError:
+            self._handle_404()
+            return
+        with file:
+            stat = os.fstat(file.fileno())
+            etag = file_etag(stat)
+            headers["ETag"] = etag
+            headers["Last-Modified"] = formatdate(stat.st_mtime, usegmt=True)
+            headers["Accept-Ranges"] = "bytes"
+            if is_not_modified(self.headers, etag, stat.st_mtime):
+                del headers["Content-Type"]
+                self._send_headers(304, headers)
+                return
+            try:
+                byte_range = parse_range(
+                    self.headers.get("Range"), stat.st_size
+                )
+            except ValueError:
+                headers["Content-Range"] = f"bytes */{stat.st_size}"
+                self._send_response(416, b"", "text/plain", headers=headers)
+                return
+            start, end = byte_range or (0, stat.st_size - 1)
+            if byte_range is not None:
+                headers["Content-Range"] = (
+                    f"bytes {start}-{end}/{stat.st_size}"
+                )
+            headers["Content-Length"] = str(end - start + 1)
+            self._send_headers(206 if byte_range else 200, headers)
+            if end >= start:
+                self.wfile.flush()
+                self.connection.sendfile(file, start, end - start + 1)
+
+    def _precompressed(self, file_path: str, headers: Dict[str, str]) -> str:
+        """
+        Helper method to pick a precompressed variant of a file. A gzip file
+        next to the original, such as `app.js.gz`, is sent instead of it when
+        the client accepts gzip and the variant is not older than the file.
+
+        Parameters:
+            file_path (str): Path of the requested file.
+            headers (Dict[str, str]): Response headers, updated with the
+            content encoding when the variant is used.
+
+        Returns
+        -------
+            str: Path of the file to send.
+        """
+        variant = file_path + ".gz"
+        try:
+            if os.stat(variant).st_mtime < os.stat(file_path).st_mtime:
+                return file_path
+        except OSError:
+            return file_path
+        headers["Vary"] = "Accept-Encoding"
+        if "Range" in self.headers or "gzip" not in self.compression:
+            return file_path
+        if negotiate_encoding(self.headers.get("Accept-Encoding"), ("gzip",)):
+            headers["Content-Encoding"] = "gzip"
+            return variant
+        return file_path
+
+    def handle_index(self):
+        """
+        Serve the welcome page.
+
+        Returns
+        -------
+            None
+        """
+        self._send_response(
+            200, "<h1>Welcome to the Python HTTP Server</h1>", "text/html"
         )
 
+    def handle_info(self):
+        """
+        Serve the parsed query parameters.
+
+        Returns
+        -------
+            None
+        """
+        self._send_response(200, str(self.query), "text/plain")
+
+    def handle_metrics(self):
+        """
+        Serve the latency histograms in the Prometheus text format. The
+        counters change with every request, so the response is not cached.
+
+        Returns
+        -------
+            None
+        """
         self._send_response(
             200,
-            "<h1>POST request received</h1>",
-            "text/html",
+            self.metrics.render(),
+            "text/plain; version=0.0.4",
+            headers={"Cache-Control": "no-store"},
         )
 
-    def _send_response(self, status_code, content, content_type):
+    def handle_one_request(self):
         """
-        Helper method to send HTTP responses.
+        Handle a single request and record its latency and access log
+        entry.
+
+        Returns
+        -------
+            None
+        """
+        self._started = None
+        self._status = None
+        self.route_pattern = None
+        self._cache_key = None
+        if self._served and not self._await_request():
+            self.close_connection = True
+            return
+        self._served += 1
+        self._body_state = None
+        super().handle_one_request()
+        if not self.close_connection and getattr(self, "command", None):
+            self._drain_body()
+        if self._started is not None and self._status is not None:
+            self._record(time.perf_counter() - self._started)
+
+    def _await_request(self) -> bool:
+        """
+        Helper method to wait for the next request on a kept-alive
+        connection. When the server sets a `keep_alive_timeout`, as the
+        worker pool does, the wait ends after that many seconds, or as soon
+        as other connections are waiting for a worker, so idle clients do
+        not hold workers. Otherwise the request read timeout applies.
+
+        Returns
+        -------
+            bool: True if a request may be read, False to close the
+            connection.
+        """
+        timeout = getattr(self.server, "keep_alive_timeout", None)
+        if timeout is None:
+            return True
+        # A pipelined request may already be buffered.
+        self.connection.settimeout(0)
+        try:
+            if self.rfile.peek(1):
+                return True
+        except OSError:
+            return True
+        finally:
+            self.connection.settimeout(self.timeout)
+        has_waiting = getattr(self.server, "has_waiting", lambda: False)
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            readable, _, _ = select.select(
+                [self.connection], [], [], min(remaining, _IDLE_POLL_INTERVAL)
+            )
+            if readable:
+                return True
+            if has_waiting():
+                return False
+
+    def parse_request(self) -> bool:
+        """
+        Parse the request line and headers, starting the latency clock once
+        the request has arrived. A request with an invalid `Content-Length`
+        is answered with 400, as its body cannot be framed.
+
+        Returns
+        -------
+            bool: True if the request can be served.
+        """
+        self._started = time.perf_counter()
+        if not super().parse_request():
+            return False
+        length = self.headers.get("Content-Length")
+        chunked = (
+            "chunked" in self.headers.get("Transfer-Encoding", "").lower()
+        )
+        if length is not None and not chunked:
+            length = length.strip()
+            if not (length.isascii() and length.isdigit()):
+                self.send_error(400, "Invalid Content-Length")
+                return False
+        return True
+
+    def log_request(self, code="-", size="-"):
+        """
+        Remember the response status for the access log, which is written
+        once the response is complete.
+
+        Parameters:
+            code (int | str): The response status code.
+            size (int | str): The response size, if known.
+
+        Returns
+        -------
+            None
+        """
+        try:
+            self._status = int(code)
+        except (TypeError, ValueError):
+            self._status = None
+
+    def log_message(self, format, *args):
+        """
+        Write server messages, such as errors, to the module logger instead
+        of standard error. Formatting is deferred to the logging handlers.
+
+        Returns
+        -------
+            None
+        """
+        _logger.info("%s - " + format, self.client_address[0], *args)
+
+    def _record(self, seconds: float):
+        """
+        Helper method to record a served request in the route metrics and,
+        if sampled, in the access log.
+
+        Parameters:
+            seconds (float): The time taken to serve the request.
+
+        Returns
+        -------
+            None
+        """
+        route = self.route_pattern or "<unmatched>"
+        self.metrics.observe(self.command, route, self._status, seconds)
+        if not access_logger.isEnabledFor(logging.INFO):
+            return
+        if self._status < 500 and random.random() >= (
+            self.access_log_sample_rate
+        ):
+            return
+        # The fields are passed as the record arguments, so the message is
+        # only formatted by the handlers that need text.
+        access_logger.info(
+            "%(client)s %(method)s %(path)s %(status)d %(duration_ms).2fms",
+            {
+                "client": self.client_address[0],
+                "method": self.command,
+                "path": self.path,
+                "route": route,
+                "status": self._status,
+                "duration_ms": seconds * 1000,
+            },
+        )
+
+    def _send_headers(self, status_code, headers):
+        """
+        Helper method to send a status line and headers.
 
         Parameters:
             status_code (int): HTTP status code.
-            content (str): Response content.
-            content_type (str): MIME type of the response content.
+            headers (Dict[str, str]): Response headers.
 
         Returns
         -------
             None
         """
         self.send_response(status_code)
-        self.send_header("Content-type", content_type)
+        for name, value in headers.items():
+            self.send_header(name, value)
         self.end_headers()
+
+    def _send_response(self, status_code, content, content_type, headers=None):
+        """
+        Helper method to send HTTP responses.
+
+        Content given as an iterable of chunks, such as a generator, is
+        streamed: with chunked transfer encoding for HTTP/1.1 clients, or
+        until the connection closes otherwise.
+
+        Parameters:
+            status_code (int): HTTP status code.
+            content (str | bytes | Iterable[str | bytes]): Response content.
+            content_type (str): MIME type of the response content.
+            headers (Optional[Dict[str, str]]): Additional headers.
+
+        Returns
+        -------
+            None
+        """
+        headers = {"Content-type": content_type, **(headers or {})}
         if isinstance(content, str):
             content = content.encode("utf-8")
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            content = bytes(content)
+            if status_code == 200:
+                content = self._encode_content(content, headers)
+                if self.etag_responses:
+                    headers.setdefault("ETag", body_etag(content))
+                if self._cache_key is not None and self._may_store(headers):
+                    self.response_cache.put(self._cache_key, headers, content)
+            self._send_body(status_code, headers, content)
+        else:
+            self._send_stream(status_code, headers, content)
+
+    def _send_stream(self, status_code, headers, content):
+        """
+        Helper method to stream a response whose length is not known in
+        advance.
+
+        Parameters:
+            status_code (int): HTTP status code.
+            headers (Dict[str, str]): Response headers.
+            content (Iterable[str | bytes]): The chunks of the body.
+
+        Returns
+        -------
+            None
+        """
+        chunked = (
+            self.request_version == "HTTP/1.1"
+            and self.protocol_version == "HTTP/1.1"
+        )
+        if chunked:
+            headers["Transfer-Encoding"] = "chunked"
+        else:
+            headers["Connection"] = "close"
+            self.close_connection = True
+        self._send_headers(status_code, headers)
+        for chunk in content:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            if not chunk:
+                continue
+            if chunked:
+                chunk = b"%X\r\n%s\r\n" % (len(chunk), chunk)
+            self.wfile.write(chunk)
+        if chunked:
+            self.wfile.write(b"0\r\n\r\n")
+
+    def _encode_content(
+        self, content: bytes, headers: Dict[str, str]
+    ) -> bytes:
+        """
+        Helper method to compress a response body when the client accepts
+        it and compression is worthwhile.
+
+        Parameters:
+            content (bytes): The response body.
+            headers (Dict[str, str]): Response headers, updated with the
+            content encoding.
+
+        Returns
+        -------
+            bytes: The body to send.
+        """
+        if (
+            not self.compression
+            or "Content-Encoding" in headers
+            or not is_compressible(headers["Content-type"])
+        ):
+            return content
+        headers["Vary"] = ", ".join(
+            filter(None, (headers.get("Vary"), "Accept-Encoding"))
+        )
+        encoding = self._content_encoding()
+        if encoding is None or len(content) < self.compress_min_size:
+            return content
+        headers["Content-Encoding"] = encoding
+        return compress_body(content, encoding, self.compress_level)
+
+    def _send_body(self, status_code, headers, content):
+        """
+        Helper method to send a complete response, or 304 Not Modified when
+        the client's copy matches its ETag.
+
+        Parameters:
+            status_code (int): HTTP status code.
+            headers (Dict[str, str]): Response headers. Not modified.
+            content (bytes): Response body.
+
+        Returns
+        -------
+            None
+        """
+        etag = headers.get("ETag")
+        if status_code == 200 and etag and etag_matches(self.headers, etag):
+            self._send_headers(
+                304,
+                {
+                    name: value
+                    for name, value in headers.items()
+                    if name in ("ETag", "Cache-Control", "Vary", "Expires")
+                },
+            )
+            return
+        self._send_headers(
+            status_code, {**headers, "Content-Length": str(len(content))}
+        )
         self.wfile.write(content)
 
     def _handle_404(self):
@@ -145,28 +854,108 @@ class BaseHTTPServer(BaseHTTPRequestHandler):
         """
         self._send_response(404, "<h1>404 Not Found</h1>", "text/html")
 
+    # http.server dispatches on the upper-case method name.
+    def do_GET(self):  # noqa: N802
+        self.do_get()
+
+    def do_POST(self):  # noqa: N802
+        self.do_post()
+
+    @staticmethod
+    def create_server(
+        handler_class=None,
+        port=8000,
+        mode="single",
+        workers=16,
+        queue_size=64,
+        keep_alive=None,
+        host="",
+    ):
+        """
+        Static method to create an HTTP server without starting it.
+
+        Parameters:
+            handler_class (BaseHTTPRequestHandler): The HTTP request handler
+            class. Defaults to BaseHTTPServer.
+            port (int): Port number to run the server on, 0 for any free
+            port.
+            mode (str): "single" serves one connection at a time, "threading"
+            starts a thread per connection, and "pool" serves connections
+            from a fixed pool of worker threads.
+            workers (int): Number of worker threads in "pool" mode.
+            queue_size (int): Connections waiting for a worker in "pool"
+            mode before new ones are rejected with 503.
+            keep_alive (bool): Serve HTTP/1.1 persistent connections.
+            Defaults to True for the concurrent modes; in "single" mode an
+            idle keep-alive client would block all others.
+            host (str): Address to bind.
+
+        Returns
+        -------
+            HTTPServer: The bound server.
+        """
+        if mode not in SERVER_MODES:
+            raise ValueError(f"Unknown server mode: {mode}")
+        handler_class = handler_class or BaseHTTPServer
+        if keep_alive is None:
+            keep_alive = mode != "single"
+        protocol = "HTTP/1.1" if keep_alive else "HTTP/1.0"
+        if handler_class.protocol_version != protocol:
+            handler_class = type(
+                handler_class.__name__,
+                (handler_class,),
+                {"protocol_version": protocol},
+            )
+        server_address = (host, port)
+        if mode == "pool":
+            return ThreadPoolHTTPServer(
+                server_address,
+                handler_class,
+                workers=workers,
+                queue_size=queue_size,
+            )
+        if mode == "threading":
+            return ThreadingHTTPServer(server_address, handler_class)
+        return HTTPServer(server_address, handler_class)
+
     @staticmethod
     def run(
-        server_class=HTTPServer,
-        handler_class=BaseHTTPRequestHandler,
+        server_class=None,
+        handler_class=None,
         port=8000,
+        mode="single",
+        workers=16,
+        queue_size=64,
     ):
         """
         Static method to run the HTTP server.
 
         Parameters:
-            server_class (HTTPServer): The HTTP server class.
+            server_class (HTTPServer): The HTTP server class. When given, it
+            is used as is and `mode` is ignored.
             handler_class (BaseHTTPRequestHandler): The HTTP request handler
-            class.
+            class. Defaults to BaseHTTPServer.
             port (int): Port number to run the server on.
+            mode (str): Concurrency mode, see `create_server`.
+            workers (int): Number of worker threads in "pool" mode.
+            queue_size (int): Connections waiting for a worker in "pool"
+            mode.
 
         Returns
         -------
             None
         """
         logging.basicConfig(level=logging.INFO)
-        server_address = ("", port)
-        httpd = server_class(server_address, handler_class)
+        if server_class is not None:
+            httpd = server_class(("", port), handler_class or BaseHTTPServer)
+        else:
+            httpd = BaseHTTPServer.create_server(
+                handler_class,
+                port=port,
+                mode=mode,
+                workers=workers,
+                queue_size=queue_size,
+            )
         logging.info("Starting httpd server on port %d", port)
         try:
             httpd.serve_forever()
@@ -176,11 +965,17 @@ class BaseHTTPServer(BaseHTTPRequestHandler):
         logging.info("Stopping httpd server")
 
 
+BaseHTTPServer.router.add("GET", "/", BaseHTTPServer.handle_index)
+BaseHTTPServer.router.add("GET", "/info", BaseHTTPServer.handle_info)
+BaseHTTPServer.router.add("GET", "/metrics", BaseHTTPServer.handle_metrics)
+
+
 # =============================================================================
 # Exports
 # =============================================================================
 
 __all__: List[str] = [
+    "SERVER_MODES",
     "BaseHTTPServer",
 ]
 
@@ -196,7 +991,7 @@ def test():
     """
 
     # Running the server
-    BaseHTTPServer.run(handler_class=HTTPServer, port=8000)
+    BaseHTTPServer.run(port=8000, mode="pool")
 
 
 # =============================================================================
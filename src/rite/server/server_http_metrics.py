@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - HTTP Metrics Module
+==========================
+
+This module provides the observability pieces of the HTTP server: per-route
+latency histograms rendered in the Prometheus text format, and a
+queue-backed access log whose records are formatted on a background thread
+instead of the thread serving the request.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import bisect
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+access_logger = logging.getLogger("rite.server.access")
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class LatencyHistogram:
+    """
+    A thread-safe histogram of durations with fixed bucket bounds.
+
+    Attributes
+    ----------
+        buckets (Sequence[float]): Upper bounds of the buckets, in seconds.
+        count (int): Number of observations.
+        total (float): Sum of the observations, in seconds.
+
+    Methods
+    -------
+        observe(seconds): Records a duration.
+        snapshot(): Returns the cumulative bucket counts, count and sum.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initializes an empty histogram.
+
+        Parameters:
+            buckets (Sequence[float]): Upper bounds of the buckets, in seconds.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.count = 0
+        self.total = 0.0
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        """
+        Records a duration.
+
+        Parameters:
+            seconds (float): The duration, in seconds.
+        """
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total += seconds
+
+    def snapshot(self) -> Tuple[List[int], int, float]:
+        """
+        Returns a consistent view of the histogram.
+
+        Returns
+        -------
+            Tuple[List[int], int, float]: The cumulative count of each bucket
+            followed by the +Inf bucket, the number of observations and
+            their sum.
+        """
+        with self._lock:
+            counts, count, total = list(self._counts), self.count, self.total
+        cumulative, running = [], 0
+        for value in counts:
+            running += value
+            cumulative.append(running)
+        return cumulative, count, total
+
+
+class RouteMetrics:
+    """
+    A registry of latency histograms keyed by method, route pattern and
+    status class.
+
+    Methods
+    -------
+        observe(method, route, status, seconds): Records a request.
+        histogram(method, route, status): Returns a histogram, or None.
+        render(): Renders the histograms in the Prometheus text format.
+    """
+
+    name = "rite_http_request_duration_seconds"
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initializes an empty registry.
+
+        Parameters:
+            buckets (Sequence[float]): Bucket bounds for new histograms.
+        """
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(method: str, route: str, status: int) -> Tuple[str, str, str]:
+        """
+        Private method to build a histogram key. Statuses are grouped by
+        class, such as "2xx", to keep the number of series small.
+        """
+        return method, route, f"{status // 100}xx"
+
+    def observe(self, method: str, route: str, status: int, seconds: float):
+        """
+        Records the duration of a request.
+
+        Parameters:
+            method (str): The HTTP method.
+            route (str): The route pattern, not the request path.
+            status (int): The response status code.
+            seconds (float): The time taken to serve the request.
+        """
+        key = self._key(method, route, status)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(
+                    key, LatencyHistogram(self.buckets)
+                )
+        histogram.observe(seconds)
+
+    def histogram(
+        self, method: str, route: str, status: int
+    ) -> Optional[LatencyHistogram]:
+        """
+        Returns the histogram of a route.
+
+        Parameters:
+            method (str): The HTTP method.
+            route (str): The route pattern.
+            status (int): A status code of the status class.
+
+        Returns
+        -------
+            Optional[LatencyHistogram]: The histogram, or None if no request
+            was recorded for it.
+        """
+        return self._histograms.get(self._key(method, route, status))
+
+    def render(self) -> str:
+        """
+        Renders the histograms in the Prometheus text exposition format.
+
+        Returns
+        -------
+            str: The metrics document.
+        """
+        lines = [f"# TYPE {self.name} histogram"]
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+        for (method, route, status), histogram in histograms:
+            route = route.replace("\\", "\\\\").replace('"', '\\"')
+            labels = f'method="{method}",route="{route}",status="{status}"'
+            counts, count, total = histogram.snapshot()
+            bounds = [f"{bound:g}" for bound in histogram.buckets] + ["+Inf"]
+            for bound, value in zip(bounds, counts):
+                lines.append(
+                    f'{self.name}_bucket{{{labels},le="{bound}"}} {value}'
+                )
+            lines.append(f"{self.name}_sum{{{labels}}} {total:.6f}")
+            lines.append(f"{self.name}_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+
+class _QueueHandler(QueueHandler):
+    """
+    A queue handler passing records through unformatted and dropping them
+    when the queue is full, so logging never blocks a request.
+    """
+
+    dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _AccessLogListener(QueueListener):
+    """
+    A queue listener attached to the access log while it runs.
+    """
+
+    def __init__(self, records: queue.Queue, *handlers: logging.Handler):
+        super().__init__(records, *handlers, respect_handler_level=True)
+        self.queue_handler = _QueueHandler(records)
+        self._propagate = access_logger.propagate
+
+    def start(self):
+        super().start()
+        access_logger.addHandler(self.queue_handler)
+        access_logger.setLevel(logging.INFO)
+        access_logger.propagate = False
+
+    def stop(self):
+        access_logger.removeHandler(self.queue_handler)
+        access_logger.propagate = self._propagate
+        super().stop()
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def start_access_log(
+    *handlers: logging.Handler, queue_size: int = 10000
+) -> QueueListener:
+    """
+    Routes the access log through a bounded queue to the given handlers,
+    which format and write the records on a background thread. Records are
+    dropped rather than blocking requests when the queue is full.
+
+    Parameters:
+        *handlers (logging.Handler): The handlers writing the records.
+        queue_size (int): Maximum number of records waiting to be written.
+
+    Returns
+    -------
+        QueueListener: The started listener. Call `stop()` on it to flush
+        the queue and detach it from the access log.
+    """
+    records: queue.Queue = queue.Queue(maxsize=queue_size)
+    listener = _AccessLogListener(records, *handlers)
+    listener.start()
+    return listener
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "DEFAULT_BUCKETS",
+    "LatencyHistogram",
+    "RouteMetrics",
+    "access_logger",
+    "start_access_log",
+]
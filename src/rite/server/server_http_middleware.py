@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - HTTP Middleware Module
+=============================
+
+This module provides the response processing used by the HTTP server:
+content encoding negotiation, compression, entity tags for generated
+responses and an in-memory cache of GET responses.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import gzip
+import hashlib
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def negotiate_encoding(
+    accept_encoding: Optional[str], supported: Iterable[str]
+) -> Optional[str]:
+    """
+    Picks the content encoding to use from an `Accept-Encoding` header.
+
+    Parameters:
+        accept_encoding (Optional[str]): The `Accept-Encoding` header value.
+        supported (Iterable[str]): The encodings the server can produce, in
+        order of preference.
+
+    Returns
+    -------
+        Optional[str]: The preferred encoding accepted by the client, or None
+        to send the content unencoded.
+    """
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+    best, best_weight = None, 0.0
+    for encoding in supported:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    """
+    Checks whether responses of a MIME type benefit from compression.
+
+    Parameters:
+        content_type (str): The `Content-Type` of the response.
+
+    Returns
+    -------
+        bool: True for textual types, False for already compressed ones.
+    """
+    return content_type.lower().startswith(COMPRESSIBLE_TYPES)
+
+
+def compress_body(content: bytes, encoding: str, level: int = 6) -> bytes:
+    """
+    Compresses a response body.
+
+    Parameters:
+        content (bytes): The response body.
+        encoding (str): "gzip" or "deflate".
+        level (int): The compression level, from 1 (fastest) to 9 (smallest).
+
+    Returns
+    -------
+        bytes: The encoded body.
+
+    Raises:
+        ValueError: If the encoding is not supported.
+    """
+    if encoding == "gzip":
+        # A fixed mtime keeps the output, and so its ETag, reproducible.
+        return gzip.compress(content, compresslevel=level, mtime=0)
+    if encoding == "deflate":
+        return zlib.compress(content, level)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def body_etag(content: bytes) -> str:
+    """
+    Builds a strong ETag from a response body.
+
+    Parameters:
+        content (bytes): The response body, after content encoding.
+
+    Returns
+    -------
+        str: The quoted entity tag.
+    """
+    return f'"{hashlib.blake2b(content, digest_size=12).hexdigest()}"'
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class ResponseCache:
+    """
+    A thread-safe LRU cache of complete responses to GET requests, bounded
+    by entry count, total body size and age.
+
+    Entries are keyed by the request target and the negotiated content
+    encoding, so each encoded variant is stored once and served without
+    calling the route handler or compressing again.
+
+    Attributes
+    ----------
+        max_entries (int): Maximum number of cached responses.
+        max_bytes (int): Maximum total size of the cached bodies.
+        ttl (float): Seconds a response stays valid.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups not found or expired.
+        evictions (int): Number of responses dropped to respect the bounds.
+
+    Methods
+    -------
+        get(key): Returns a cached response or None.
+        put(key, headers, content): Stores a response.
+        clear(): Drops all responses.
+        stats(): Returns the cache counters.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 16 * 1024 * 1024,
+        ttl: float = 60.0,
+    ):
+        """
+        Initializes the cache.
+
+        Parameters:
+            max_entries (int): Maximum number of cached responses.
+            max_bytes (int): Maximum total size of the cached bodies.
+            ttl (float): Seconds a response stays valid.
+        """
+        if max_entries <= 0 or max_bytes <= 0 or ttl <= 0:
+            raise ValueError("Cache bounds must be positive.")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Tuple[Dict[str, str], bytes]]:
+        """
+        Looks up a cached response.
+
+        Parameters:
+            key (Hashable): The request target and content encoding.
+
+        Returns
+        -------
+            Optional[Tuple[Dict[str, str], bytes]]: The response headers and
+            body, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1], entry[2]
+
+    def put(self, key: Hashable, headers: Dict[str, str], content: bytes):
+        """
+        Stores a response. Bodies larger than `max_bytes` are not stored.
+
+        Parameters:
+            key (Hashable): The request target and content encoding.
+            headers (Dict[str, str]): The response headers.
+            content (bytes): The response body.
+        """
+        if len(content) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (
+                time.monotonic() + self.ttl,
+                dict(headers),
+                content,
+            )
+            self._bytes += len(content)
+            while (
+                len(self._entries) > self.max_entries
+                or self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        """
+        Private method to drop an entry. The lock must be held.
+        """
+        self._bytes -= len(self._entries.pop(key)[2])
+
+    def clear(self):
+        """
+        Drops all cached responses.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the cache counters.
+
+        Returns
+        -------
+            Dict[str, int]: Hits, misses, evictions, and the current number
+            of entries and bytes.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "COMPRESSIBLE_TYPES",
+    "ResponseCache",
+    "body_etag",
+    "compress_body",
+    "is_compressible",
+    "negotiate_encoding",
+]
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - HTTP Worker Pool Server Module
+=====================================
+
+This module provides an HTTP server that serves connections from a fixed
+pool of worker threads fed by a bounded queue.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import logging
+import queue
+import threading
+from http.server import HTTPServer
+from typing import List
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+_REJECT_RESPONSE = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Content-Length: 0\r\n"
+    b"Connection: close\r\n"
+    b"\r\n"
+)
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class ThreadPoolHTTPServer(HTTPServer):
+    """
+    An HTTP server handling connections on a bounded pool of threads.
+
+    Unlike `ThreadingHTTPServer`, which starts a thread per connection, the
+    number of threads is fixed and accepted connections wait in a bounded
+    queue. When the queue is full, new connections are answered with
+    503 Service Unavailable instead of piling up. Idle keep-alive
+    connections are closed after `keep_alive_timeout`, or as soon as other
+    connections wait, so they do not hold workers.
+
+    Attributes
+    ----------
+        workers (int): Number of worker threads.
+        queue_size (int): Maximum number of connections waiting for a worker.
+        keep_alive_timeout (float): Seconds an idle keep-alive connection
+        keeps its worker.
+
+    Methods
+    -------
+        process_request(request, client_address): Queues a connection.
+        has_waiting(): Whether connections are waiting for a worker.
+        server_close(): Stops the workers and closes the socket.
+    """
+
+    def __init__(
+        self,
+        server_address,
+        handler_class,
+        workers: int = 16,
+        queue_size: int = 64,
+        bind_and_activate: bool = True,
+        keep_alive_timeout: float = 2.0,
+    ):
+        """
+        Initializes the server and starts its worker threads.
+
+        Parameters:
+            server_address (Tuple[str, int]): Host and port to bind.
+            handler_class (BaseHTTPRequestHandler): The request handler class.
+            workers (int): Number of worker threads.
+            queue_size (int): Maximum number of connections waiting for a
+            worker.
+            bind_and_activate (bool): Bind and listen immediately.
+            keep_alive_timeout (float): Seconds an idle keep-alive
+            connection keeps its worker, separate from the request read
+            timeout of the handler.
+        """
+        if workers <= 0 or queue_size <= 0:
+            raise ValueError("Workers and queue size must be positive.")
+        self.workers = workers
+        self.queue_size = queue_size
+        self.keep_alive_timeout = keep_alive_timeout
+        self.request_queue_size = max(queue_size, 5)
+        self._connections: queue.Queue = queue.Queue(maxsize=queue_size)
+        super().__init__(server_address, handler_class, bind_and_activate)
+        self._threads = [
+            threading.Thread(
+                target=self._work, name=f"http-worker-{n}", daemon=True
+            )
+            for n in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def process_request(self, request, client_address):
+        """
+        Queues an accepted connection for the worker threads, rejecting it
+        when the queue is full.
+
+        Parameters:
+            request (socket.socket): The accepted connection.
+            client_address (Tuple[str, int]): The client address.
+        """
+        try:
+            self._connections.put_nowait((request, client_address))
+        except queue.Full:
+            logging.warning("Rejecting %s: request queue full", client_address)
+            try:
+                request.sendall(_REJECT_RESPONSE)
+            except OSError:
+                pass
+            self.shutdown_request(request)
+
+    def has_waiting(self) -> bool:
+        """
+        Checks whether accepted connections are waiting for a worker.
+
+        Returns
+        -------
+            bool: True if the queue is not empty.
+        """
+        return not self._connections.empty()
+
+    def _work(self):
+        """
+        Private method serving queued connections until stopped.
+        """
+        while True:
+            item = self._connections.get()
+            if item is None:
+                return
+            request, client_address = item
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    def server_close(self):
+        """
+        Closes the listening socket and stops the worker threads once the
+        queued connections are served.
+        """
+        super().server_close()
+        for _ in self._threads:
+            self._connections.put(None)
+        for thread in self._threads:
+            thread.join()
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "ThreadPoolHTTPServer",
+]
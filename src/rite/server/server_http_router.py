@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - HTTP Router Module
+=========================
+
+This module provides the route registry used by the HTTP server. Static
+paths are looked up in a dictionary; parameterized paths such as
+`/users/{user_id}` are matched segment by segment in a trie, so dispatch
+cost does not grow with the number of registered routes.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import copy
+import urllib.parse
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class _Node:
+    """
+    A node of the route trie, holding one path segment.
+    """
+
+    __slots__ = (
+        "static",
+        "param_name",
+        "param",
+        "rest_name",
+        "rest",
+        "handlers",
+    )
+
+    def __init__(self):
+        self.static: Dict[str, _Node] = {}
+        self.param_name: Optional[str] = None
+        self.param: Optional[_Node] = None
+        self.rest_name: Optional[str] = None
+        self.rest: Optional[_Node] = None
+        self.handlers: Dict[str, Tuple[Callable, str]] = {}
+
+
+class Router:
+    """
+    A registry mapping HTTP methods and paths to handlers.
+
+    Paths are split on "/"; a segment written as `{name}` matches any single
+    segment and is passed to the handler as a keyword argument. A final
+    segment written as `{name:path}` matches the remainder of the path.
+    Static segments take precedence over parameters, and parameters over
+    remainders.
+
+    Methods
+    -------
+        add(method, path, handler): Registers a handler.
+        match(method, path): Finds the handler and parameters for a request.
+        match_route(method, path): Also returns the matched route pattern.
+        copy(): Returns an independent copy of the registry.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty router.
+        """
+        self._static: Dict[Tuple[str, str], Tuple[Callable, str]] = {}
+        self._root = _Node()
+
+    @staticmethod
+    def _segments(path: str) -> List[str]:
+        """
+        Private method to split a path into its non-empty segments.
+        """
+        return [segment for segment in path.split("/") if segment]
+
+    def add(self, method: str, path: str, handler: Callable):
+        """
+        Registers a handler for a method and path, replacing any handler
+        already registered for them.
+
+        Parameters:
+            method (str): The HTTP method, such as "GET".
+            path (str): The path, optionally with `{name}` segments.
+            handler (Callable): Called with the request handler instance and
+            the path parameters as keyword arguments.
+
+        Raises:
+            ValueError: If a parameter name conflicts with one already
+            registered at the same position.
+        """
+        method = method.upper()
+        segments = self._segments(path)
+        if not any(segment.startswith("{") for segment in segments):
+            self._static[(method, "/" + "/".join(segments))] = (handler, path)
+            return
+        node = self._root
+        for position, segment in enumerate(segments):
+            if segment.endswith(":path}"):
+                if position != len(segments) - 1:
+                    raise ValueError(f"{segment} must be last in {path}")
+                name = segment[1:-6]
+                if node.rest is None:
+                    node.rest_name, node.rest = name, _Node()
+                elif node.rest_name != name:
+                    raise ValueError(
+                        f"Parameter {{{name}}} conflicts with "
+                        f"{{{node.rest_name}}} in {path}"
+                    )
+                node = node.rest
+            elif segment.startswith("{") and segment.endswith("}"):
+                name = segment[1:-1]
+                if node.param is None:
+                    node.param_name, node.param = name, _Node()
+                elif node.param_name != name:
+                    raise ValueError(
+                        f"Parameter {{{name}}} conflicts with "
+                        f"{{{node.param_name}}} in {path}"
+                    )
+                node = node.param
+            else:
+                node = node.static.setdefault(segment, _Node())
+        node.handlers[method] = (handler, path)
+
+    def match(
+        self, method: str, path: str
+    ) -> Optional[Tuple[Callable, Dict[str, str]]]:
+        """
+        Finds the handler registered for a request.
+
+        Parameters:
+            method (str): The HTTP method of the request.
+            path (str): The request path, without query string.
+
+        Returns
+        -------
+            Optional[Tuple[Callable, Dict[str, str]]]: The handler and the
+            path parameters, or None if no route matches.
+        """
+        match = self.match_route(method, path)
+        return None if match is None else match[:2]
+
+    def match_route(
+        self, method: str, path: str
+    ) -> Optional[Tuple[Callable, Dict[str, str], str]]:
+        """
+        Finds the handler registered for a request and the pattern it was
+        registered with, such as `/users/{user_id}`.
+
+        Parameters:
+            method (str): The HTTP method of the request.
+            path (str): The request path, without query string.
+
+        Returns
+        -------
+            Optional[Tuple[Callable, Dict[str, str], str]]: The handler, the
+            path parameters and the route pattern, or None if no route
+            matches.
+        """
+        route = self._static.get((method, path))
+        if route is not None:
+            return route[0], {}, route[1]
+        segments = self._segments(path)
+        # Depth-first search preferring static segments over parameters.
+        stack = [(self._root, 0, {})]
+        while stack:
+            node, depth, params = stack.pop()
+            if depth == len(segments):
+                route = node.handlers.get(method)
+                if route is not None:
+                    return route[0], params, route[1]
+                continue
+            segment = segments[depth]
+            if node.rest is not None:
+                rest = urllib.parse.unquote("/".join(segments[depth:]))
+                stack.append(
+                    (
+                        node.rest,
+                        len(segments),
+                        {**params, node.rest_name: rest},
+                    )
+                )
+            if node.param is not None:
+                stack.append(
+                    (
+                        node.param,
+                        depth + 1,
+                        {
+                            **params,
+                            node.param_name: urllib.parse.unquote(segment),
+                        },
+                    )
+                )
+            child = node.static.get(segment)
+            if child is not None:
+                stack.append((child, depth + 1, params))
+        return None
+
+    def copy(self) -> Router:
+        """
+        Returns an independent copy of the router, so routes added to the
+        copy do not affect the original.
+
+        Returns
+        -------
+            Router: The copy.
+        """
+        return copy.deepcopy(self)
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "Router",
+]
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - HTTP Static File Module
+==============================
+
+This module provides the helpers used by the HTTP server to serve files:
+validators for conditional requests, byte range parsing and safe path
+resolution.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import email.utils
+import os
+from typing import List, Mapping, Optional, Tuple
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def file_etag(stat: os.stat_result) -> str:
+    """
+    Builds an ETag from a file's modification time and size.
+
+    Parameters:
+        stat (os.stat_result): The file status.
+
+    Returns
+    -------
+        str: The quoted entity tag.
+    """
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def etag_matches(headers: Mapping[str, str], etag: str) -> bool:
+    """
+    Checks an entity tag against the `If-None-Match` request header, using
+    the weak comparison required for GET requests.
+
+    Parameters:
+        headers (Mapping[str, str]): The request headers.
+        etag (str): The current entity tag of the resource.
+
+    Returns
+    -------
+        bool: True if the header lists the tag or "*".
+    """
+    if_none_match = headers.get("If-None-Match")
+    if if_none_match is None:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+def is_not_modified(
+    headers: Mapping[str, str], etag: str, mtime: float
+) -> bool:
+    """
+    Checks the conditional request headers against a resource's validators.
+    `If-None-Match` takes precedence over `If-Modified-Since`.
+
+    Parameters:
+        headers (Mapping[str, str]): The request headers.
+        etag (str): The current entity tag of the resource.
+        mtime (float): The modification time of the resource.
+
+    Returns
+    -------
+        bool: True if the client's copy is current and 304 can be sent.
+    """
+    if headers.get("If-None-Match") is not None:
+        return etag_matches(headers, etag)
+    if_modified_since = headers.get("If-Modified-Since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = email.utils.parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return int(mtime) <= since.timestamp()
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parses a single-range `Range` header.
+
+    Parameters:
+        header (Optional[str]): The `Range` header value.
+        size (int): The size of the resource in bytes.
+
+    Returns
+    -------
+        Optional[Tuple[int, int]]: The first and last byte positions, or None
+        if the header is absent, invalid or asks for several ranges, in
+        which case the whole resource is served.
+
+    Raises:
+        ValueError: If the range cannot be satisfied.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header[6:].strip().partition("-")
+    if not (first or last) or not all(
+        part.isdigit() for part in (first, last) if part
+    ):
+        return None
+    if first and last and int(last) < int(first):
+        return None
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        start, end = max(size - int(last), 0), size - 1
+        if not int(last):
+            raise ValueError("Unsatisfiable range")
+    if start >= size or end < start:
+        raise ValueError("Unsatisfiable range")
+    return start, end
+
+
+def resolve_path(directory: str, relative: str) -> Optional[str]:
+    """
+    Resolves a request path inside a directory, refusing paths that would
+    escape it.
+
+    Parameters:
+        directory (str): The directory being served.
+        relative (str): The path requested, relative to the directory.
+
+    Returns
+    -------
+        Optional[str]: The absolute file path, or None if it is outside the
+        directory or not a regular file.
+    """
+    root = os.path.realpath(directory)
+    path = os.path.realpath(os.path.join(root, relative.lstrip("/")))
+    if os.path.commonpath([root, path]) != root or not os.path.isfile(path):
+        return None
+    return path
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "etag_matches",
+    "file_etag",
+    "is_not_modified",
+    "parse_range",
+    "resolve_path",
+]
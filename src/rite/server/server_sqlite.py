@@ -22,15 +22,65 @@ built-in sqlite3 library.
 # Import | Future
 from __future__ import annotations
 
+import itertools
 import logging
+import re
 import sqlite3
+import time
 
 # Import | Standard Library
-from typing import Any, List, Tuple
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 # Import | Libraries
 
 # Import | Local Modules
+from .server_sqlite_cache import MISS, VIEWS_QUERY, QueryCache
+from .server_sqlite_pool import SQLiteConnectionPool
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+PRAGMA_PROFILES: Dict[str, Dict[str, Any]] = {
+    # Full fsync on every commit; readers still proceed during writes.
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+    },
+    # Bulk loading: no fsync, large page cache, temporary data in memory.
+    "fast-ingest": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -262144,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # Many concurrent readers and an occasional writer.
+    "read-mostly": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
+
+_PRAGMA_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_PRAGMA_VALUE = re.compile(r"^-?[A-Za-z0-9_]+$")
 
 
 # =============================================================================
@@ -50,31 +100,184 @@ class SQLiteServer:
     Attributes
     ----------
         db_path (str): Path to the SQLite3 database file.
+        pool_size (int): Number of pooled connections, 0 to connect per call.
+        pool_timeout (float): Seconds to wait for a pooled connection.
+        cached_statements (int): Size of each connection's statement cache.
+        pragmas (Dict[str, Any]): Pragmas applied to every new connection.
+        cache (Optional[QueryCache]): Cache of `fetch_all` results, if
+        enabled.
 
     Methods
     -------
         execute_query(query, params): Executes a SQL query with parameters.
         fetch_all(query, params): Fetches all rows from a SQL query.
         fetch_one(query, params): Fetches the first row from a SQL query.
+        iter_rows(query, params, batch_size): Iterates over the rows of a SQL
+        query in batches.
         insert(table, data_dict): Inserts data into a table.
+        insert_many(table, rows, columns, chunk_size): Bulk inserts rows in
+        chunked transactions.
         update(table, data_dict, condition): Updates data in a table based on
         a condition.
         delete(table, condition): Deletes data from a table based on a condition.
         transaction(queries): Executes a series of queries in a transaction.
+        close(): Closes pooled connections.
     """
 
-    def __init__(self, db_path: str):
+    def __init__(
+        self,
+        db_path: str,
+        pool_size: int = 0,
+        pool_timeout: float = 5.0,
+        cached_statements: int = 128,
+        profile: Optional[str] = None,
+        pragmas: Optional[Dict[str, Any]] = None,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
+    ):
         """
         Initializes the SQLite3 server with the specified database path.
 
         Parameters:
             db_path (str): Path to the SQLite3 database file.
+            pool_size (int): Number of long-lived connections to keep. With
+            the default of 0 a new connection is opened for every call.
+            pool_timeout (float): Seconds to wait for a free pooled
+            connection before raising TimeoutError.
+            cached_statements (int): Number of prepared statements each
+            connection keeps cached.
+            profile (Optional[str]): Name of a pragma profile from
+            `PRAGMA_PROFILES`, such as "durable", "fast-ingest" or
+            "read-mostly".
+            pragmas (Optional[Dict[str, Any]]): Additional pragmas, taking
+            precedence over those of the profile.
+            cache_size (int): Number of `fetch_all` results to cache. With
+            the default of 0 results are not cached. Cached results of a
+            table are dropped whenever this server writes to it.
+            cache_ttl (Optional[float]): Seconds a cached result stays valid,
+            bounding staleness from writes made by other processes.
+
+        Raises:
+            ValueError: If the profile is unknown or a pragma is malformed.
         """
+        if profile is not None and profile not in PRAGMA_PROFILES:
+            raise ValueError(f"Unknown pragma profile: {profile}")
+        self.pragmas: Dict[str, Any] = {
+            **PRAGMA_PROFILES.get(profile, {}),
+            **(pragmas or {}),
+        }
+        for name, value in self.pragmas.items():
+            if not _PRAGMA_NAME.match(name) or not _PRAGMA_VALUE.match(
+                str(value)
+            ):
+                raise ValueError(f"Invalid pragma: {name} = {value}")
         self.db_path = db_path
+        self.pool_size = pool_size
+        self.pool_timeout = pool_timeout
+        self.cached_statements = cached_statements
+        self._pool: Optional[SQLiteConnectionPool] = None
+        if pool_size > 0:
+            self._pool = SQLiteConnectionPool(
+                self._open_connection, size=pool_size, timeout=pool_timeout
+            )
+        self.cache: Optional[QueryCache] = None
+        if cache_size > 0:
+            self.cache = QueryCache(max_size=cache_size, ttl=cache_ttl)
+            # Loaded from the database before the first result is cached.
+            self.cache.views = None
         logging.basicConfig(level=logging.INFO)
 
+    def __enter__(self) -> SQLiteServer:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """
+        Private method to open a new connection to the database and apply
+        the configured pragmas.
+
+        Returns
+        -------
+            sqlite3.Connection: The new connection.
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=self._pool is None,
+            cached_statements=self.cached_statements,
+        )
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Private context manager providing a connection, either checked out
+        of the pool or opened for the duration of the block.
+
+        Yields
+        ------
+            sqlite3.Connection: The connection to use.
+        """
+        if self._pool is not None:
+            with self._pool.connection() as conn:
+                yield conn
+            return
+        conn = self._open_connection()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _invalidate(self, queries: Iterable[str]):
+        """
+        Private method to drop cached results affected by write statements.
+
+        Parameters:
+            queries (Iterable[str]): The SQL statements that were executed.
+        """
+        if self.cache is not None:
+            self.cache.invalidate_queries(queries)
+
+    def close(self):
+        """
+        Closes all pooled connections. Has no effect without a pool.
+        """
+        if self._pool is not None:
+            self._pool.close()
+
+    @staticmethod
+    def _insert_query(table: str, data_dict: dict) -> str:
+        """
+        Private method to build an INSERT statement with named parameters.
+        """
+        columns = ", ".join(data_dict.keys())
+        placeholders = ":" + ", :".join(data_dict.keys())
+        return f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+
+    @staticmethod
+    def _update_query(table: str, data_dict: dict, condition: str) -> str:
+        """
+        Private method to build an UPDATE statement with named parameters.
+        """
+        assignments = ", ".join([f"{k} = :{k}" for k in data_dict.keys()])
+        return f"UPDATE {table} SET {assignments} WHERE {condition}"
+
+    @staticmethod
+    def _delete_query(table: str, condition: str) -> str:
+        """
+        Private method to build a DELETE statement.
+        """
+        return f"DELETE FROM {table} WHERE {condition}"
+
     def _execute(
-        self, query: str, params: Tuple = (), commit: bool = False
+        self,
+        query: str,
+        params: Tuple = (),
+        commit: bool = False,
+        fetch_one: bool = False,
     ) -> Any:
         """
         Private method to execute a SQL query.
@@ -83,6 +286,7 @@ class SQLiteServer:
             query (str): SQL query to execute.
             params (Tuple): Parameters for the SQL query.
             commit (bool): Specifies whether to commit the transaction.
+            fetch_one (bool): Fetch only the first row of a 'SELECT'.
 
         Returns
         -------
@@ -92,17 +296,13 @@ class SQLiteServer:
             sqlite3.Error: If an error occurs during query execution.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cur = conn.cursor()
-                cur.execute(query, params)
+            with self._connection() as conn, conn:
+                cur = conn.execute(query, params)
                 if commit:
-                    conn.commit()
-                else:
-                    return (
-                        cur.fetchall()
-                        if query.strip().upper().startswith("SELECT")
-                        else None
-                    )
+                    return None
+                if not query.strip().upper().startswith("SELECT"):
+                    return None
+                return cur.fetchone() if fetch_one else cur.fetchall()
         except sqlite3.Error as e:
             logging.error("SQLite error: %s", e)
             raise
@@ -119,7 +319,10 @@ class SQLiteServer:
         -------
             None
         """
-        self._execute(query, params, commit=True)
+        try:
+            self._execute(query, params, commit=True)
+        finally:
+            self._invalidate((query,))
 
     def fetch_all(self, query: str, params: Tuple = ()) -> List[Tuple]:
         """
@@ -133,11 +336,24 @@ class SQLiteServer:
         -------
             List[Tuple]: List of rows returned by the query.
         """
-        return self._execute(query, params)
-
-    def fetch_one(self, query: str, params: Tuple = ()) -> Tuple:
+        if self.cache is None:
+            return self._execute(query, params)
+        rows = self.cache.get(query, params)
+        if rows is not MISS:
+            return list(rows)
+        version = self.cache.version()
+        if self.cache.views is None:
+            views = self._execute(VIEWS_QUERY)
+            self.cache.set_views((name for (name,) in views), version)
+        rows = self._execute(query, params)
+        if rows is not None:
+            self.cache.put(query, params, tuple(rows), version)
+        return rows
+
+    def fetch_one(self, query: str, params: Tuple = ()) -> Optional[Tuple]:
         """
-        Fetches the first row from a SQL query.
+        Fetches the first row from a SQL query. Only that row is read from
+        the cursor, so no `LIMIT` clause is needed.
 
         Parameters:
             query (str): SQL query to execute.
@@ -145,9 +361,49 @@ class SQLiteServer:
 
         Returns
         -------
-            Tuple: The first row returned by the query.
+            Optional[Tuple]: The first row returned by the query, or None if
+            the query returned no rows.
+        """
+        return self._execute(query, params, fetch_one=True)
+
+    def iter_rows(
+        self, query: str, params: Tuple = (), batch_size: int = 1000
+    ) -> Iterator[Tuple]:
+        """
+        Iterates over the rows of a SQL query without loading them all.
+
+        Rows are read from the cursor `batch_size` at a time. A connection is
+        held until the iterator is exhausted or closed, so close partially
+        consumed iterators when using a connection pool.
+
+        Parameters:
+            query (str): SQL query to execute.
+            params (Tuple): Parameters for the SQL query.
+            batch_size (int): Number of rows fetched from the cursor at once.
+
+        Yields
+        ------
+            Tuple: Each row returned by the query.
+
+        Raises:
+            sqlite3.Error: If an error occurs during query execution.
         """
-        return self._execute(query, params)[0]
+        if batch_size <= 0:
+            raise ValueError("Batch size must be a positive integer.")
+        try:
+            with self._connection() as conn:
+                cur = conn.execute(query, params)
+                try:
+                    while True:
+                        rows = cur.fetchmany(batch_size)
+                        if not rows:
+                            return
+                        yield from rows
+                finally:
+                    cur.close()
+        except sqlite3.Error as e:
+            logging.error("SQLite error: %s", e)
+            raise
 
     def insert(self, table: str, data_dict: dict):
         """
@@ -161,10 +417,91 @@ class SQLiteServer:
         -------
             None
         """
-        columns = ", ".join(data_dict.keys())
-        placeholders = ":" + ", :".join(data_dict.keys())
-        query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
-        self._execute(query, data_dict, commit=True)
+        query = self._insert_query(table, data_dict)
+        try:
+            self._execute(query, data_dict, commit=True)
+        finally:
+            self._invalidate((query,))
+
+    def insert_many(
+        self,
+        table: str,
+        rows: Iterable[Union[dict, Sequence]],
+        columns: Optional[Sequence[str]] = None,
+        chunk_size: int = 1000,
+    ) -> Dict[str, float]:
+        """
+        Inserts many rows into a table using a single prepared statement.
+
+        Rows are consumed lazily, so a generator is never materialized
+        beyond one chunk. Each chunk is written with `executemany` inside its
+        own transaction.
+
+        Parameters:
+            table (str): Name of the table to insert data into.
+            rows (Iterable[Union[dict, Sequence]]): Rows as dictionaries
+            keyed by column name, or as sequences of values.
+            columns (Optional[Sequence[str]]): Column names. Defaults to the
+            keys of the first row for dictionaries, or all columns of the
+            table for sequences.
+            chunk_size (int): Number of rows written per transaction.
+
+        Returns
+        -------
+            Dict[str, float]: The number of rows inserted, the elapsed
+            seconds and the resulting rows per second.
+
+        Raises:
+            sqlite3.Error: If an error occurs while inserting a chunk. Chunks
+            committed before the failure are kept.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be a positive integer.")
+        iterator = iter(rows)
+        first = next(iterator, None)
+        if first is None:
+            return {"rows": 0, "seconds": 0.0, "rows_per_second": 0.0}
+
+        if isinstance(first, dict):
+            columns = list(columns or first.keys())
+            placeholders = ", ".join(f":{column}" for column in columns)
+        else:
+            placeholders = ", ".join("?" * len(first))
+        target = f"{table} ({', '.join(columns)})" if columns else table
+        query = f"INSERT INTO {target} VALUES ({placeholders})"
+
+        remaining = itertools.chain((first,), iterator)
+        total = 0
+        start = time.perf_counter()
+        try:
+            with self._connection() as conn:
+                while True:
+                    chunk = list(itertools.islice(remaining, chunk_size))
+                    if not chunk:
+                        break
+                    with conn:
+                        conn.executemany(query, chunk)
+                    total += len(chunk)
+        except sqlite3.Error as e:
+            logging.error("Bulk insert failed after %d rows: %s", total, e)
+            raise
+        finally:
+            self._invalidate((query,))
+        elapsed = time.perf_counter() - start
+
+        stats = {
+            "rows": total,
+            "seconds": elapsed,
+            "rows_per_second": total / elapsed if elapsed else 0.0,
+        }
+        logging.info(
+            "Inserted %d rows into %s in %.3fs (%.0f rows/s)",
+            total,
+            table,
+            elapsed,
+            stats["rows_per_second"],
+        )
+        return stats
 
     def update(self, table: str, data_dict: dict, condition: str):
         """
@@ -179,9 +516,11 @@ class SQLiteServer:
         -------
             None
         """
-        assignments = ", ".join([f"{k} = :{k}" for k in data_dict.keys()])
-        query = f"UPDATE {table} SET {assignments} WHERE {condition}"
-        self._execute(query, data_dict, commit=True)
+        query = self._update_query(table, data_dict, condition)
+        try:
+            self._execute(query, data_dict, commit=True)
+        finally:
+            self._invalidate((query,))
 
     def delete(self, table: str, condition: str):
         """
@@ -195,8 +534,11 @@ class SQLiteServer:
         -------
             None
         """
-        query = f"DELETE FROM {table} WHERE {condition}"
-        self._execute(query, commit=True)
+        query = self._delete_query(table, condition)
+        try:
+            self._execute(query, commit=True)
+        finally:
+            self._invalidate((query,))
 
     def transaction(self, queries: List[Tuple[str, Tuple]]):
         """
@@ -208,7 +550,8 @@ class SQLiteServer:
         Raises:
             sqlite3.Error: If an error occurs during the transaction.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        queries = list(queries)
+        with self._connection() as conn:
             try:
                 cur = conn.cursor()
                 for query, params in queries:
@@ -218,6 +561,8 @@ class SQLiteServer:
                 conn.rollback()
                 logging.error("Transaction failed: %s", e)
                 raise
+            finally:
+                self._invalidate(query for query, _ in queries)
 
 
 # =============================================================================
@@ -225,6 +570,7 @@ class SQLiteServer:
 # =============================================================================
 
 __all__: List[str] = [
+    "PRAGMA_PROFILES",
     "SQLiteServer",
 ]
 
@@ -0,0 +1,462 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - Async SQLite Server Module
+=================================
+
+This module provides an asyncio front-end for the SQLite server. Queries are
+queued to a dedicated worker thread per database, so the event loop never
+blocks on SQLite, and writes that arrive together are committed in a single
+transaction.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import asyncio
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, List, Optional, Tuple
+
+# Import | Libraries
+
+# Import | Local Modules
+from .server_sqlite import SQLiteServer
+from .server_sqlite_cache import MISS, VIEWS_QUERY
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+_READ_ALL = "read_all"
+_READ_ONE = "read_one"
+_WRITE = "write"
+_STOP = None
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class AsyncSQLiteServer:
+    """
+    An asyncio SQLite server with the same interface as `SQLiteServer`.
+
+    Every call is queued to a worker thread that owns the database
+    connection and is processed in submission order, so a read always sees
+    the writes submitted before it. Writes already waiting in the queue are
+    grouped into one transaction; each write runs in its own savepoint, so a
+    failing write is rolled back and reported without affecting the others.
+
+    Attributes
+    ----------
+        db_path (str): Path to the SQLite3 database file.
+        batch_window (float): Seconds to wait for more writes to batch.
+        max_batch (int): Maximum number of writes per transaction.
+
+    Methods
+    -------
+        execute_query(query, params): Executes a SQL query with parameters.
+        fetch_all(query, params): Fetches all rows from a SQL query.
+        fetch_one(query, params): Fetches the first row from a SQL query.
+        insert(table, data_dict): Inserts data into a table.
+        update(table, data_dict, condition): Updates data in a table based on
+        a condition.
+        delete(table, condition): Deletes data from a table based on a condition.
+        transaction(queries): Executes a series of queries in a transaction.
+        close(): Stops the worker thread once queued requests are done.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        batch_window: float = 0.0,
+        max_batch: int = 100,
+        **options: Any,
+    ):
+        """
+        Initializes the server and starts its worker thread.
+
+        Parameters:
+            db_path (str): Path to the SQLite3 database file.
+            batch_window (float): Seconds the worker waits for further writes
+            before committing a batch. With the default of 0 only writes that
+            are already queued are batched.
+            max_batch (int): Maximum number of writes per transaction.
+            **options (Any): Connection options passed to `SQLiteServer`,
+            such as `profile`, `pragmas`, `cache_size` or `cache_ttl`.
+        """
+        if max_batch <= 0:
+            raise ValueError("Batch size must be a positive integer.")
+        self.db_path = db_path
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._server = SQLiteServer(db_path, **options)
+        self._requests: queue.Queue = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._worker = threading.Thread(
+            target=self._run, name=f"sqlite:{db_path}", daemon=True
+        )
+        self._worker.start()
+
+    async def __aenter__(self) -> AsyncSQLiteServer:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _submit(self, kind: str, payload: Any) -> asyncio.Future:
+        """
+        Private method to queue a request for the worker thread.
+
+        Parameters:
+            kind (str): The request kind.
+            payload (Any): The query and parameters, or a list of them for
+            writes.
+
+        Returns
+        -------
+            asyncio.Future: Resolves with the result of the request.
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("AsyncSQLiteServer is closed.")
+            self._requests.put((kind, payload, future))
+        return asyncio.wrap_future(future)
+
+    def _run(self):
+        """
+        Private method running the worker loop until `close` is called.
+        """
+        try:
+            conn = self._server._open_connection()
+        except Exception as e:
+            logging.error("SQLite error: %s", e)
+            self._fail_pending(e)
+            return
+        # Transactions are managed explicitly by the worker.
+        conn.isolation_level = None
+        pending = _STOP
+        try:
+            while True:
+                request = pending or self._requests.get()
+                pending = _STOP
+                if request is _STOP:
+                    break
+                batch = [request]
+                try:
+                    if request[0] != _WRITE:
+                        self._read(conn, request)
+                        continue
+                    pending = self._collect_writes(batch)
+                    self._write(conn, batch)
+                except Exception as e:
+                    # Keep serving: fail the affected requests only.
+                    logging.exception("SQLite worker error")
+                    self._rollback(conn)
+                    self._fail_batch(batch, e)
+        finally:
+            conn.close()
+            with self._lock:
+                self._closed = True
+            self._fail_queued(RuntimeError("AsyncSQLiteServer is closed."))
+
+    def _collect_writes(self, batch: List[Tuple]) -> Optional[Tuple]:
+        """
+        Private method to extend a batch with further queued writes.
+
+        Parameters:
+            batch (List[Tuple]): The batch to extend in place.
+
+        Returns
+        -------
+            Optional[Tuple]: The first non-write request taken from the
+            queue, to be processed after the batch, or None.
+        """
+        deadline = time.monotonic() + self.batch_window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    request = self._requests.get(timeout=remaining)
+                else:
+                    request = self._requests.get_nowait()
+            except queue.Empty:
+                return _STOP
+            if request is _STOP:
+                # Re-queue the stop request so the loop still sees it.
+                self._requests.put(_STOP)
+                return _STOP
+            if request[0] != _WRITE:
+                return request
+            batch.append(request)
+        return _STOP
+
+    @staticmethod
+    def _read(conn: sqlite3.Connection, request: Tuple):
+        """
+        Private method to run a read request and resolve its future.
+        """
+        kind, (query, params), future = request
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            cur = conn.execute(query, params)
+            if query.strip().upper().startswith("SELECT"):
+                result = (
+                    cur.fetchone() if kind == _READ_ONE else cur.fetchall()
+                )
+            else:
+                result = None
+            cur.close()
+        except Exception as e:
+            logging.error("SQLite error: %s", e)
+            future.set_exception(e)
+            return
+        future.set_result(result)
+
+    @staticmethod
+    def _apply(
+        conn: sqlite3.Connection, statements: List[Tuple[str, Any]]
+    ) -> Optional[Exception]:
+        """
+        Private method to run the statements of one write request inside a
+        savepoint, rolling back to it on failure.
+
+        Returns
+        -------
+            Optional[Exception]: The error raised by the request, if any.
+        """
+        conn.execute("SAVEPOINT request")
+        error = None
+        try:
+            for query, params in statements:
+                conn.execute(query, params)
+        except Exception as e:
+            conn.execute("ROLLBACK TO request")
+            logging.error("Transaction failed: %s", e)
+            error = e
+        conn.execute("RELEASE request")
+        return error
+
+    def _write(self, conn: sqlite3.Connection, batch: List[Tuple]):
+        """
+        Private method to run a batch of writes in a single transaction and
+        resolve their futures.
+        """
+        outcomes = []
+        try:
+            conn.execute("BEGIN")
+            for _, statements, future in batch:
+                if future.set_running_or_notify_cancel():
+                    outcomes.append((future, self._apply(conn, statements)))
+            conn.execute("COMMIT")
+        except Exception as e:
+            self._rollback(conn)
+            logging.error("Transaction failed: %s", e)
+            self._fail_batch(batch, e)
+            return
+        finally:
+            self._server._invalidate(
+                query for _, statements, _ in batch for query, _ in statements
+            )
+        for future, error in outcomes:
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+    @staticmethod
+    def _rollback(conn: sqlite3.Connection):
+        """
+        Private method to roll back the open transaction, if any.
+        """
+        try:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+        except sqlite3.Error as e:
+            logging.error("Rollback failed: %s", e)
+
+    @staticmethod
+    def _fail_batch(batch: List[Tuple], error: Exception):
+        """
+        Private method to fail every unresolved future of a batch.
+        """
+        for _, _, future in batch:
+            if future.done():
+                continue
+            if future.running() or future.set_running_or_notify_cancel():
+                future.set_exception(error)
+
+    def _fail_queued(self, error: Exception):
+        """
+        Private method to fail every request still queued once the worker
+        has stopped.
+        """
+        while True:
+            try:
+                request = self._requests.get_nowait()
+            except queue.Empty:
+                return
+            if request is not _STOP and (
+                request[2].set_running_or_notify_cancel()
+            ):
+                request[2].set_exception(error)
+
+    def _fail_pending(self, error: Exception):
+        """
+        Private method to fail every queued request until `close` is called.
+        """
+        while True:
+            request = self._requests.get()
+            if request is _STOP:
+                return
+            future = request[2]
+            if future.set_running_or_notify_cancel():
+                future.set_exception(error)
+
+    async def execute_query(self, query: str, params: Tuple = ()):
+        """
+        Executes a SQL query with parameters.
+
+        Parameters:
+            query (str): SQL query to execute.
+            params (Tuple): Parameters for the SQL query.
+        """
+        await self._submit(_WRITE, [(query, params)])
+
+    async def fetch_all(self, query: str, params: Tuple = ()) -> List[Tuple]:
+        """
+        Fetches all rows from a SQL query.
+
+        Parameters:
+            query (str): SQL query to execute.
+            params (Tuple): Parameters for the SQL query.
+
+        Returns
+        -------
+            List[Tuple]: List of rows returned by the query.
+        """
+        cache = self._server.cache
+        if cache is None:
+            return await self._submit(_READ_ALL, (query, params))
+        rows = cache.get(query, params)
+        if rows is not MISS:
+            return list(rows)
+        version = cache.version()
+        if cache.views is None:
+            views = await self._submit(_READ_ALL, (VIEWS_QUERY, ()))
+            cache.set_views((name for (name,) in views), version)
+        rows = await self._submit(_READ_ALL, (query, params))
+        if rows is not None:
+            cache.put(query, params, tuple(rows), version)
+        return rows
+
+    async def fetch_one(
+        self, query: str, params: Tuple = ()
+    ) -> Optional[Tuple]:
+        """
+        Fetches the first row from a SQL query.
+
+        Parameters:
+            query (str): SQL query to execute.
+            params (Tuple): Parameters for the SQL query.
+
+        Returns
+        -------
+            Optional[Tuple]: The first row returned by the query, or None if
+            the query returned no rows.
+        """
+        return await self._submit(_READ_ONE, (query, params))
+
+    async def insert(self, table: str, data_dict: dict):
+        """
+        Inserts a new row into a table.
+
+        Parameters:
+            table (str): Name of the table to insert data into.
+            data_dict (dict): Dictionary containing column names and values.
+        """
+        query = SQLiteServer._insert_query(table, data_dict)
+        await self._submit(_WRITE, [(query, data_dict)])
+
+    async def update(self, table: str, data_dict: dict, condition: str):
+        """
+        Updates rows in a table.
+
+        Parameters:
+            table (str): Name of the table to update.
+            data_dict (dict): Dictionary containing column names and values.
+            condition (str): SQL condition for the update.
+        """
+        query = SQLiteServer._update_query(table, data_dict, condition)
+        await self._submit(_WRITE, [(query, data_dict)])
+
+    async def delete(self, table: str, condition: str):
+        """
+        Deletes rows from a table.
+
+        Parameters:
+            table (str): Name of the table to delete from.
+            condition (str): SQL condition for the deletion.
+        """
+        query = SQLiteServer._delete_query(table, condition)
+        await self._submit(_WRITE, [(query, ())])
+
+    async def transaction(self, queries: List[Tuple[str, Tuple]]):
+        """
+        Executes a series of queries atomically. The queries may share a
+        database transaction with other writes, but are applied or rolled
+        back as a unit.
+
+        Parameters:
+            queries (List[Tuple[str, Tuple]]): A list of queries and their
+            parameters.
+
+        Raises:
+            sqlite3.Error: If an error occurs during the transaction.
+        """
+        await self._submit(_WRITE, list(queries))
+
+    async def close(self):
+        """
+        Stops accepting requests and waits for the worker thread to finish
+        the ones already queued.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._requests.put(_STOP)
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._worker.join
+        )
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "AsyncSQLiteServer",
+]
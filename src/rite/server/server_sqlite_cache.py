@@ -0,0 +1,437 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - SQLite Query Cache Module
+================================
+
+This module provides an LRU/TTL cache of query results for the SQLite
+server, invalidated per table whenever the server writes to that table.
+Only queries whose tables can all be found are cached: queries over
+subqueries, table-valued functions or views are not.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+MISS = object()
+
+_TABLE_PATTERN = re.compile(
+    r"\b(?:FROM|JOIN|INTO|UPDATE|TABLE)\s+"
+    r"(?:IF\s+(?:NOT\s+)?EXISTS\s+)?"
+    r"([`\"\[]?[\w.]+[`\"\]]?)",
+    re.IGNORECASE,
+)
+
+# Single-quoted literals and comments, which may hide keywords.
+_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'|--[^\n]*|/\*.*?\*/", re.DOTALL)
+
+_TOKEN_PATTERN = re.compile(r'"(?:[^"]|"")*"|`[^`]*`|\[[^\]]*\]|[\w.$]+|\S')
+
+# Keywords ending the FROM clause of a query.
+_CLAUSE_ENDS = {
+    "EXCEPT",
+    "GROUP",
+    "HAVING",
+    "INTERSECT",
+    "LIMIT",
+    "ORDER",
+    "RETURNING",
+    "UNION",
+    "WHERE",
+    "WINDOW",
+}
+
+# Statements that change the schema, and may create or drop views.
+_SCHEMA_CHANGES = {"ALTER", "CREATE", "DROP"}
+
+VIEWS_QUERY = (
+    "SELECT name FROM sqlite_master WHERE type = 'view' "
+    "UNION ALL SELECT name FROM sqlite_temp_master WHERE type = 'view'"
+)
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def tables_in(query: str) -> Set[str]:
+    """
+    Extracts the names of the tables a SQL statement reads or writes.
+
+    Parameters:
+        query (str): The SQL statement.
+
+    Returns
+    -------
+        Set[str]: Lower-cased table names, without quoting.
+    """
+    return {
+        match.strip('`"[]').lower() for match in _TABLE_PATTERN.findall(query)
+    }
+
+
+def read_tables(query: str) -> Optional[Set[str]]:
+    """
+    Extracts the names of every table or view a query reads, from each
+    comma-separated or joined item of its FROM clauses, including those of
+    subqueries.
+
+    Parameters:
+        query (str): The SQL query.
+
+    Returns
+    -------
+        Optional[Set[str]]: Lower-cased names, without quoting, or None if
+        they cannot all be determined, as with subqueries or table-valued
+        functions in a FROM clause, or schema-qualified names.
+    """
+    tokens = _TOKEN_PATTERN.findall(_LITERAL_PATTERN.sub("''", query))
+    tables: Set[str] = set()
+    for index, token in enumerate(tokens):
+        if token.upper() == "FROM":
+            found = _from_items(tokens, index + 1)
+            if found is None:
+                return None
+            tables |= found
+    return tables
+
+
+def _table_name(tokens: List[str], index: int) -> Optional[str]:
+    """
+    Private function to read the table name of a FROM item, or None if the
+    item is not a plain, unqualified name.
+    """
+    token = tokens[index]
+    if tokens[index + 1 : index + 2] in (["("], ["."]):
+        return None
+    if not (token[0].isalnum() or token[0] in '_"`['):
+        return None
+    name = token.strip('`"[]').lower()
+    return None if "." in name else name
+
+
+def _from_items(tokens: List[str], index: int) -> Optional[Set[str]]:
+    """
+    Private function to read the table names of a FROM clause, starting at
+    the token after FROM, or None if an item is not a plain name.
+    """
+    tables: Set[str] = set()
+    expect_table = True
+    depth = 0
+    for index in range(index, len(tokens)):
+        token = tokens[index]
+        word = token.upper()
+        if expect_table:
+            name = _table_name(tokens, index)
+            if name is None:
+                return None
+            tables.add(name)
+            expect_table = False
+        elif token == "(":
+            depth += 1
+        elif token == ")":
+            if not depth:
+                break
+            depth -= 1
+        elif depth:
+            continue
+        elif token == ";" or word in _CLAUSE_ENDS:
+            break
+        elif token == "," or word == "JOIN":
+            expect_table = True
+    return None if expect_table else tables
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class QueryCache:
+    """
+    A thread-safe LRU cache of query results with an optional time to live.
+
+    Entries are keyed by query and parameters and indexed by the tables the
+    query reads, so a write only drops the entries that depend on the tables
+    it touches. Results read while an invalidation happens are not stored,
+    which prevents a slow read from caching data older than a local write.
+
+    Queries over views are not cached, as writes name the base tables of a
+    view rather than the view. The view names are loaded by the server
+    through `set_views`, and again after any schema change it runs.
+
+    Writes made by other processes, or by triggers on other tables, are not
+    seen by the cache; use `ttl` to bound staleness in those cases.
+
+    Attributes
+    ----------
+        max_size (int): Maximum number of cached results.
+        ttl (Optional[float]): Seconds a result stays valid, or None.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups not found or expired.
+        evictions (int): Number of results dropped to respect `max_size`.
+        invalidations (int): Number of results dropped because of writes.
+        views (Optional[Set[str]]): Names of the views, or None when they
+        must be loaded before results can be cached.
+
+    Methods
+    -------
+        version(): Returns a token to pass to `put`.
+        get(query, params): Returns a cached result or MISS.
+        put(query, params, rows, version): Stores a result.
+        set_views(names, version): Sets the names of the views.
+        invalidate(tables): Drops results depending on the given tables.
+        invalidate_queries(queries): Drops results affected by statements.
+        clear(): Drops all results.
+        stats(): Returns the cache counters.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None):
+        """
+        Initializes the cache.
+
+        Parameters:
+            max_size (int): Maximum number of cached results.
+            ttl (Optional[float]): Seconds a result stays valid. With the
+            default of None results stay valid until invalidated or evicted.
+        """
+        if max_size <= 0:
+            raise ValueError("Cache size must be a positive integer.")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.views: Optional[Set[str]] = set()
+        self._entries: OrderedDict = OrderedDict()
+        self._tables: Dict[str, Set[Hashable]] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(query: str, params: Any) -> Optional[Hashable]:
+        """
+        Private method to build a hashable key, or None if the parameters
+        cannot be hashed.
+        """
+        if isinstance(params, dict):
+            params = tuple(sorted(params.items()))
+        elif isinstance(params, list):
+            params = tuple(params)
+        key = (query, params)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def version(self) -> int:
+        """
+        Returns a token identifying the current invalidation state. Take it
+        before running a query and pass it to `put` with the result.
+
+        Returns
+        -------
+            int: The current version.
+        """
+        return self._version
+
+    def get(self, query: str, params: Any = ()) -> Any:
+        """
+        Looks up the cached result of a query.
+
+        Parameters:
+            query (str): The SQL query.
+            params (Any): Parameters for the SQL query.
+
+        Returns
+        -------
+            Any: The cached rows, or MISS.
+        """
+        key = self._key(query, params)
+        with self._lock:
+            entry = self._entries.get(key) if key is not None else None
+            if entry is None:
+                self.misses += 1
+                return MISS
+            expires, tables, rows = entry
+            if expires is not None and expires < time.monotonic():
+                self._remove(key, tables)
+                self.misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return rows
+
+    def put(self, query: str, params: Any, rows: Any, version: int):
+        """
+        Stores the result of a query, unless an invalidation happened since
+        `version` was taken, or the tables it reads are unknown or include
+        a view.
+
+        Parameters:
+            query (str): The SQL query.
+            params (Any): Parameters for the SQL query.
+            rows (Any): The result to cache. It must not be mutated later.
+            version (int): The token returned by `version` before the query
+            ran.
+        """
+        key = self._key(query, params)
+        if key is None:
+            return
+        tables = read_tables(query)
+        if tables is None:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if version != self._version:
+                return
+            if self.views is None or not tables.isdisjoint(self.views):
+                return
+            if key in self._entries:
+                self._remove(key, self._entries[key][1])
+            self._entries[key] = (expires, tables, rows)
+            for table in tables:
+                self._tables.setdefault(table, set()).add(key)
+            while len(self._entries) > self.max_size:
+                old_key, (_, old_tables, _) = next(iter(self._entries.items()))
+                self._remove(old_key, old_tables)
+                self.evictions += 1
+
+    def set_views(self, names: Iterable[str], version: int):
+        """
+        Sets the names of the views, unless an invalidation happened since
+        `version` was taken.
+
+        Parameters:
+            names (Iterable[str]): The view names, as read with
+            `VIEWS_QUERY`.
+            version (int): The token returned by `version` before the names
+            were read.
+        """
+        views = {name.lower() for name in names}
+        with self._lock:
+            if version == self._version:
+                self.views = views
+
+    def _remove(self, key: Hashable, tables: Iterable[str]):
+        """
+        Private method to drop an entry and its table index references. The
+        lock must be held.
+        """
+        del self._entries[key]
+        for table in tables:
+            keys = self._tables.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tables[table]
+
+    def invalidate(self, tables: Iterable[str]):
+        """
+        Drops every result that depends on one of the given tables.
+
+        Parameters:
+            tables (Iterable[str]): Names of the tables that were written.
+        """
+        with self._lock:
+            self._version += 1
+            for table in tables:
+                for key in list(self._tables.get(table.lower(), ())):
+                    self._remove(key, self._entries[key][1])
+                    self.invalidations += 1
+
+    def invalidate_queries(self, queries: Iterable[str]):
+        """
+        Drops every result affected by the given write statements. If the
+        tables of a statement cannot be determined, or it changes the
+        schema, the cache is cleared; after a schema change the views must
+        be loaded again.
+
+        Parameters:
+            queries (Iterable[str]): The SQL statements that were executed.
+        """
+        tables: Set[str] = set()
+        for query in queries:
+            words = query.split(None, 1)
+            if words and words[0].upper() in _SCHEMA_CHANGES:
+                with self._lock:
+                    self.views = None
+                self.clear()
+                return
+            found = tables_in(query)
+            if not found:
+                self.clear()
+                return
+            tables |= found
+        self.invalidate(tables)
+
+    def clear(self):
+        """
+        Drops all cached results.
+        """
+        with self._lock:
+            self._version += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._tables.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the cache counters.
+
+        Returns
+        -------
+            Dict[str, int]: Hits, misses, evictions, invalidations and the
+            current number of entries.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+            }
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "MISS",
+    "QueryCache",
+    "VIEWS_QUERY",
+    "read_tables",
+    "tables_in",
+]
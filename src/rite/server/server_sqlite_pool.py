@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Rite - SQLite Connection Pool Module
+====================================
+
+This module provides a bounded pool of long-lived SQLite connections, used by
+the SQLite server to avoid opening a new connection for every query.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Future
+from __future__ import annotations
+
+# Import | Standard Library
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, List
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class SQLiteConnectionPool:
+    """
+    A bounded pool of reusable SQLite connections.
+
+    Connections are created lazily by the given factory, up to `size`
+    connections, and handed out to one caller at a time. Idle connections are
+    reused most-recently-released first, so their statement caches stay warm.
+
+    Attributes
+    ----------
+        size (int): Maximum number of connections held by the pool.
+        timeout (float): Seconds to wait for a free connection.
+
+    Methods
+    -------
+        acquire(): Checks a connection out of the pool.
+        release(conn): Returns a connection to the pool.
+        connection(): Context manager wrapping acquire/release.
+        close(): Closes all idle connections and disables the pool.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], sqlite3.Connection],
+        size: int = 5,
+        timeout: float = 5.0,
+    ):
+        """
+        Initializes the connection pool.
+
+        Parameters:
+            factory (Callable[[], sqlite3.Connection]): Opens a new connection.
+            size (int): Maximum number of connections held by the pool.
+            timeout (float): Seconds to wait for a free connection before
+            raising TimeoutError.
+        """
+        if size <= 0:
+            raise ValueError("Pool size must be a positive integer.")
+        self.size = size
+        self.timeout = timeout
+        self._factory = factory
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def acquire(self) -> sqlite3.Connection:
+        """
+        Checks a connection out of the pool, opening a new one while the pool
+        is below its size.
+
+        Returns
+        -------
+            sqlite3.Connection: A connection reserved for the caller.
+
+        Raises:
+            RuntimeError: If the pool has been closed.
+            TimeoutError: If no connection becomes free within the timeout.
+        """
+        if self._closed:
+            raise RuntimeError("Connection pool is closed.")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            create = self._created < self.size
+            if create:
+                self._created += 1
+        if create:
+            try:
+                return self._factory()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No SQLite connection available within {self.timeout}s"
+            ) from None
+
+    def release(self, conn: sqlite3.Connection):
+        """
+        Returns a connection to the pool. Any open transaction is rolled back
+        so the next caller starts from a clean state.
+
+        Parameters:
+            conn (sqlite3.Connection): The connection to return.
+        """
+        if self._closed:
+            conn.close()
+            with self._lock:
+                self._created -= 1
+            return
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put_nowait(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Context manager that checks a connection out and returns it on exit.
+
+        Yields
+        ------
+            sqlite3.Connection: A connection reserved for the caller.
+        """
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self):
+        """
+        Closes all idle connections. Connections still checked out are closed
+        when they are released.
+        """
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._created -= 1
+
+
+# =============================================================================
+# Exports
+# =============================================================================
+
+__all__: List[str] = [
+    "SQLiteConnectionPool",
+]
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Benchmarks for Read CSV File Module
+===================================
+
+Compares reading a CSV file with `csv.DictReader`, untyped and with the
+`to_number` and `to_bool` helpers applied per cell, against the chunked,
+columnar reader, as lists and as NumPy arrays when NumPy is installed.
+
+Usage:
+------
+    PYTHONPATH=src python tst/benchmark/bench_csv_read.py
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import csv
+import os
+import tempfile
+import time
+
+from rite.convert.to_bool import to_bool
+from rite.convert.to_number import to_number
+from rite.format.csv.file_csv_read import (
+    iter_csv_records,
+    numpy,
+    read_csv_columns,
+)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+ROWS = 200_000
+
+TYPES = {"id": "number", "price": "number", "active": "bool"}
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _time(func) -> str:
+    """
+    Return the time of a call.
+    """
+    start = time.perf_counter()
+    func()
+    return f"{(time.perf_counter() - start) * 1000:8.1f} ms"
+
+
+def _dict_reader(file_path: str, typed: bool):
+    """
+    Read the file with csv.DictReader, converting cells one by one.
+    """
+    with open(file_path, newline="", encoding="utf-8") as file:
+        rows = []
+        for row in csv.DictReader(file):
+            if typed:
+                row["id"] = to_number(row["id"])
+                row["price"] = to_number(row["price"])
+                row["active"] = to_bool(row["active"])
+            rows.append(row)
+    return rows
+
+
+def main():
+    """
+    Run the benchmark and print the results.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "data.csv")
+        with open(file_path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["id", "name", "price", "active"])
+            for i in range(ROWS):
+                writer.writerow([i, f"item {i}", i * 0.25, i % 2 == 0])
+
+        print(f"{ROWS} rows")
+        print(
+            f"  {'DictReader':>24}: "
+            f"{_time(lambda: _dict_reader(file_path, False))}"
+        )
+        print(
+            f"  {'DictReader, typed':>24}: "
+            f"{_time(lambda: _dict_reader(file_path, True))}"
+        )
+        print(
+            f"  {'iter_csv_records, typed':>24}: "
+            f"{_time(lambda: list(iter_csv_records(file_path, types=TYPES)))}"
+        )
+        print(
+            f"  {'read_csv_columns':>24}: "
+            f"{_time(lambda: read_csv_columns(file_path))}"
+        )
+        print(
+            f"  {'read_csv_columns, typed':>24}: "
+            f"{_time(lambda: read_csv_columns(file_path, types=TYPES))}"
+        )
+        print(
+            f"  {'read_csv_columns, infer':>24}: "
+            f"{_time(lambda: read_csv_columns(file_path, types='infer'))}"
+        )
+        if numpy is not None:
+            print(
+                f"  {'read_csv_columns, numpy':>24}: "
+                + _time(
+                    lambda: read_csv_columns(
+                        file_path, types=TYPES, use_numpy=True
+                    )
+                )
+            )
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
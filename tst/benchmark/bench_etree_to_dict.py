@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Benchmarks for ElementTree to Dictionary Modules
+================================================
+
+Compares converting the records of an XML document with `xmltodict`, as
+`JSONHandler.xml_to_json` does, with parsing the whole tree and calling
+`etree_to_dict`, and with streaming them with `iterparse_to_dict`,
+reporting time and peak traced memory.
+
+Usage:
+------
+    PYTHONPATH=src python tst/benchmark/bench_etree_to_dict.py
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import io
+import time
+import tracemalloc
+from xml.etree.ElementTree import fromstring
+
+import xmltodict
+
+from rite.data.tree.etree_iterparse import iterparse_to_dict
+from rite.data.tree.etree_to_dict import etree_to_dict
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+RECORDS = 100_000
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def whole_xmltodict(data):
+    """
+    Parse the whole document with xmltodict.
+    """
+    return len(xmltodict.parse(data)["feed"]["entry"])
+
+
+def whole_etree(data):
+    """
+    Parse the whole tree, then convert each record.
+    """
+    return sum(1 for entry in fromstring(data) if etree_to_dict(entry))
+
+
+def streaming(data):
+    """
+    Stream the records.
+    """
+    return sum(1 for _ in iterparse_to_dict(io.BytesIO(data), "entry"))
+
+
+def _run(func, data):
+    """
+    Print the time of a call, and the peak traced memory of a second call.
+    """
+    start = time.perf_counter()
+    func(data)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"  {func.__name__:>16}: {elapsed:.2f} s, peak {peak >> 20} MiB")
+
+
+def main():
+    """
+    Run the benchmark on a generated document.
+    """
+    data = (
+        b"<feed>"
+        + b"".join(
+            b'<entry id="%d"><title>Entry %d</title><tag>a</tag>'
+            b"<tag>b</tag></entry>" % (i, i)
+            for i in range(RECORDS)
+        )
+        + b"</feed>"
+    )
+    print(f"{RECORDS} records, {len(data) >> 20} MiB")
+    for func in (whole_xmltodict, whole_etree, streaming):
+        _run(func, data)
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
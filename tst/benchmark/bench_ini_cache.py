@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Benchmarks for INI Cache Module
+===============================
+
+Compares reloading an INI file with `load_ini` and reading values through
+ConfigParser against `load_config` and the frozen lookups.
+
+Usage:
+------
+    PYTHONPATH=src python tst/benchmark/bench_ini_cache.py
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import os
+import tempfile
+import time
+
+from rite.format.ini.ini import INIHandler
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+SECTIONS = 20
+KEYS = 20
+READS = 100_000
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _time(func) -> str:
+    """
+    Return the time of a call.
+    """
+    start = time.perf_counter()
+    func()
+    return f"{(time.perf_counter() - start) * 1000:8.1f} ms"
+
+
+def main():
+    """
+    Run the benchmark and print the results.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "config.ini")
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write("[DEFAULT]\nroot = /srv\n")
+            for s in range(SECTIONS):
+                file.write(f"[section{s}]\n")
+                for k in range(KEYS):
+                    file.write(f"key{k} = %(root)s/{s}/{k}\n")
+
+        def reads(config):
+            for i in range(READS):
+                INIHandler.get_value(config, "section7", f"key{i % KEYS}")
+                INIHandler.has_key(config, "section7", "missing")
+
+        def reloads(load):
+            for _ in range(1_000):
+                INIHandler.get_value(load(file_path), "section7", "key3")
+
+        print(f"{READS} reads, {SECTIONS}x{KEYS} keys")
+        parser = INIHandler.load_ini(file_path)
+        frozen = INIHandler.load_config(file_path)
+        print(f"  {'ConfigParser':>22}: {_time(lambda: reads(parser))}")
+        print(f"  {'FrozenConfig':>22}: {_time(lambda: reads(frozen))}")
+        print("1000 reloads and reads")
+        print(
+            f"  {'load_ini':>22}: "
+            f"{_time(lambda: reloads(INIHandler.load_ini))}"
+        )
+        print(
+            f"  {'load_config':>22}: "
+            f"{_time(lambda: reloads(INIHandler.load_config))}"
+        )
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Benchmarks for INI Edit Module
+==============================
+
+Compares applying a batch of edits to many INI files with `load_ini`,
+one `update_ini` call and `save_ini` per edit, against one
+`update_ini_file` call per file.
+
+Usage:
+------
+    PYTHONPATH=src python tst/benchmark/bench_ini_edit.py
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import os
+import tempfile
+import time
+
+from rite.format.ini.ini import INIHandler
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+FILES = 200
+EDITS = 10
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _time(func) -> str:
+    """
+    Return the time of a call.
+    """
+    start = time.perf_counter()
+    func()
+    return f"{(time.perf_counter() - start) * 1000:8.1f} ms"
+
+
+def main():
+    """
+    Run the benchmark and print the results.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [os.path.join(directory, f"{i}.ini") for i in range(FILES)]
+        for path in paths:
+            with open(path, "w", encoding="utf-8") as file:
+                for s in range(10):
+                    file.write(f"# Section {s}\n[section{s}]\n")
+                    for k in range(10):
+                        file.write(f"key{k} = {k}\n")
+                    file.write("\n")
+        edits = [("section3", {f"key{k}": "new"}) for k in range(EDITS)]
+
+        def per_edit():
+            for path in paths:
+                for section, updates in edits:
+                    config = INIHandler.load_ini(path)
+                    INIHandler.update_ini(config, section, updates)
+                    INIHandler.save_ini(config, path)
+
+        def batched():
+            updates = {"section3": {f"key{k}": "newer" for k in range(EDITS)}}
+            for path in paths:
+                INIHandler.update_ini_file(path, updates)
+
+        print(f"{FILES} files, {EDITS} edits each")
+        print(f"  {'save_ini per edit':>22}: {_time(per_edit)}")
+        print(f"  {'update_ini_file':>22}: {_time(batched)}")
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Benchmarks for JSON Backend Module
+==================================
+
+Compares the parse and serialization throughput of each installed JSON
+backend on representative documents: a small API response, a large array
+of records, a deeply nested tree and a text-heavy document.
+
+Usage:
+------
+    PYTHONPATH=src python tst/benchmark/bench_json_backend.py
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import time
+
+from rite.format.json.json_backend import available_backends, get_backend
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+TARGET_SECONDS = 0.5
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _documents():
+    """
+    Build the benchmark documents.
+    """
+    records = [
+        {
+            "id": n,
+            "name": f"item-{n}",
+            "price": n * 0.25,
+            "active": n % 2 == 0,
+            "tags": ["alpha", "beta"],
+        }
+        for n in range(10_000)
+    ]
+    tree = {}
+    node = tree
+    for depth in range(200):
+        node["level"] = depth
+        node["child"] = {}
+        node = node["child"]
+    text = {
+        f"paragraph-{n}": "Lorem ipsum dolor sit amet, café ☃ " * 20
+        for n in range(500)
+    }
+    return {
+        "small": {"status": "ok", "user": {"id": 7, "roles": ["admin"]}},
+        "records": records,
+        "nested": tree,
+        "text": text,
+    }
+
+
+def _rate(func, argument) -> float:
+    """
+    Return the number of calls per second of a function.
+    """
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        func(argument)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= TARGET_SECONDS:
+            return calls / elapsed
+
+
+def main():
+    """
+    Run the benchmark and print the results for each backend.
+    """
+    backends = [get_backend(name) for name in available_backends()]
+    for label, document in _documents().items():
+        encoded = backends[-1].dumps(document)
+        print(f"{label} ({len(encoded) / 1024:,.1f} KiB)")
+        for backend in backends:
+            loads = _rate(backend.loads, encoded)
+            dumps = _rate(backend.dumps, document)
+            print(
+                f"  {backend.name:>7}: {loads:12,.0f} loads/s "
+                f"{dumps:12,.0f} dumps/s"
+            )
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
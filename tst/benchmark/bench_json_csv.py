@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Benchmarks for JSON CSV Module
+==============================
+
+Compares the previous in-memory `json_to_csv` and `csv_to_json`, which
+load every record before writing, against the streaming file conversions,
+reporting time, throughput and peak traced memory.
+
+Usage:
+------
+    PYTHONPATH=src python tst/benchmark/bench_json_csv.py
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import csv
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from rite.format.json.json import JSONHandler
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+RECORDS = 200_000
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def in_memory(json_file, csv_file, json_out):
+    """
+    The previous conversions, loading the whole file, for comparison.
+    """
+    with open(json_file, encoding="utf-8") as file:
+        json_data = json.load(file)
+    with open(csv_file, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=json_data[0].keys())
+        writer.writeheader()
+        for row in json_data:
+            writer.writerow(row)
+    with open(csv_file, "r", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    with open(json_out, "w", encoding="utf-8") as file:
+        json.dump(rows, file)
+
+
+def streaming(json_file, csv_file, json_out):
+    """
+    The streaming conversions.
+    """
+    stats = JSONHandler.json_file_to_csv(json_file, csv_file)
+    print(f"    json to csv: {stats.rows_per_second:,.0f} rows/s")
+    stats = JSONHandler.csv_file_to_json(csv_file, json_out)
+    print(f"    csv to json: {stats.rows_per_second:,.0f} rows/s")
+
+
+def _run(func, *arguments):
+    """
+    Print the time of a call, and the peak traced memory of a second call.
+    Tracing slows allocations down, so it is left out of the timing.
+    """
+    start = time.perf_counter()
+    func(*arguments)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(*arguments)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"  {func.__name__:>10}: {elapsed:.2f} s, peak {peak >> 20} MiB")
+
+
+def main():
+    """
+    Run the benchmark on a generated file.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        json_file = os.path.join(directory, "data.json")
+        with open(json_file, "w", encoding="utf-8") as file:
+            json.dump(
+                [
+                    {"id": i, "name": f"user{i}", "score": i * 0.5}
+                    for i in range(RECORDS)
+                ],
+                file,
+            )
+        size = os.path.getsize(json_file) >> 20
+        print(f"{RECORDS} records, {size} MiB")
+        for func in (in_memory, streaming):
+            _run(
+                func,
+                json_file,
+                os.path.join(directory, "data.csv"),
+                os.path.join(directory, "out.json"),
+            )
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
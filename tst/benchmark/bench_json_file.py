@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Benchmarks for JSON File Module
+===============================
+
+Measures the write throughput of `JSONHandler.write_json` for a large
+document: the previous direct write, atomic writes with each fsync policy
+and a few buffer sizes, and gzip and zstd compressed output.
+
+Usage:
+------
+    PYTHONPATH=src python tst/benchmark/bench_json_file.py
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import os
+import tempfile
+import time
+
+from rite.format.json.json_backend import get_backend
+from rite.format.json.json_file import write_json_file, zstandard
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+RECORDS = 200_000
+REPEAT = 3
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def direct_write(file_path, data):
+    """
+    The previous write, straight into the target, for comparison.
+    """
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write(get_backend().dumps(data, indent=4))
+
+
+def _time(func) -> float:
+    """
+    Return the best time of a few calls.
+    """
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """
+    Run the benchmark and print the throughput of each configuration.
+    """
+    data = {
+        "items": [
+            {"id": i, "name": f"item{i}", "tags": ["a", "b"], "score": i / 3}
+            for i in range(RECORDS)
+        ]
+    }
+    size = len(get_backend().dumps(data, indent=4).encode())
+    print(f"{RECORDS} records, {size >> 20} MiB")
+    cases = [("direct", lambda path: direct_write(path, data))]
+    for fsync in ("none", "file", "full"):
+        cases.append(
+            (
+                f"atomic, fsync {fsync}",
+                lambda path, fsync=fsync: write_json_file(
+                    path, data, fsync=fsync
+                ),
+            )
+        )
+    for buffer_size in (8 * 1024, 64 * 1024):
+        cases.append(
+            (
+                f"atomic, buffer {buffer_size >> 10} KiB",
+                lambda path, size=buffer_size: write_json_file(
+                    path, data, buffer_size=size
+                ),
+            )
+        )
+    compressions = ["gzip"] + (["zstd"] if zstandard is not None else [])
+    for compression in compressions:
+        for level in (1, None):
+            cases.append(
+                (
+                    f"{compression}, level {level or 'default'}",
+                    lambda path, c=compression, lv=level: write_json_file(
+                        path, data, compression=c, level=lv
+                    ),
+                )
+            )
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "data.json")
+        for name, func in cases:
+            seconds = _time(lambda: func(path))
+            print(
+                f"  {name:>24}: {seconds * 1000:7.1f} ms, "
+                f"{size / seconds / 2**20:6.1f} MiB/s, "
+                f"{os.path.getsize(path) >> 10:>6} KiB on disk"
+            )
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Benchmarks for JSON Lines Module
+================================
+
+Measures the time to write a JSON Lines file and to read it back with
+`iter_jsonl` in the calling process and with growing process pools.
+
+Usage:
+------
+    PYTHONPATH=src python tst/benchmark/bench_json_lines.py
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import os
+import tempfile
+import time
+
+from rite.format.json.json_lines import iter_jsonl, write_jsonl
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+RECORDS = 500_000
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _records():
+    """
+    Generate the benchmark records.
+    """
+    for n in range(RECORDS):
+        yield {
+            "id": n,
+            "name": f"item-{n}",
+            "tags": ["alpha", "beta", "gamma"],
+            "attributes": {"price": n * 0.25, "active": n % 2 == 0},
+        }
+
+
+def main():
+    """
+    Run the benchmark and print the results for each worker count.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "data.jsonl")
+        start = time.perf_counter()
+        write_jsonl(file_path, _records())
+        elapsed = time.perf_counter() - start
+        print(f"{'write':>10}: {RECORDS / elapsed:12,.0f} records/s")
+        counts = sorted({1, 2, 4, os.cpu_count() or 1})
+        for workers in counts:
+            start = time.perf_counter()
+            count = sum(1 for _ in iter_jsonl(file_path, workers=workers))
+            elapsed = time.perf_counter() - start
+            assert count == RECORDS
+            print(f"{workers:>3} workers: {count / elapsed:12,.0f} records/s")
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
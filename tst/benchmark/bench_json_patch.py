@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Benchmarks for JSON Patch Module
+================================
+
+Measures the JSON Patch diff and apply on a large document with a few
+changes, comparing the size of the patch with the size of the document,
+and applying the patch with a full deep copy of the document.
+
+Usage:
+------
+    PYTHONPATH=src python tst/benchmark/bench_json_patch.py
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import copy
+import json
+import time
+
+from rite.format.json.json import JSONHandler
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+RECORDS = 100_000
+REPEAT = 3
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _documents():
+    """
+    Build a document and a copy with an update, an insertion and a removal.
+    """
+    source = {
+        "items": [
+            {"id": i, "name": f"item{i}", "tags": ["a", "b"]}
+            for i in range(RECORDS)
+        ],
+        "meta": {"count": RECORDS},
+    }
+    target = copy.deepcopy(source)
+    target["items"][RECORDS // 2]["name"] = "changed"
+    target["items"].insert(RECORDS // 3, {"id": -1})
+    del target["items"][-10]
+    target["meta"]["count"] = RECORDS
+    return source, target
+
+
+def _time(func) -> str:
+    """
+    Return the best time of a few calls.
+    """
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return f"{best * 1000:.1f} ms"
+
+
+def main():
+    """
+    Run the benchmark and print the results.
+    """
+    source, target = _documents()
+    patch = JSONHandler.make_json_patch(source, target)
+    print(
+        f"document {len(json.dumps(target)) >> 10} KiB, "
+        f"patch {len(json.dumps(patch))} bytes, {len(patch)} operations"
+    )
+    print(
+        f"  {'diff':>22}: {_time(lambda: JSONHandler.make_json_patch(source, target)):>10}"
+    )
+    print(
+        f"  {'deepcopy + in place':>22}: {_time(lambda: JSONHandler.apply_json_patch(copy.deepcopy(source), patch, in_place=True)):>10}"
+    )
+    print(
+        f"  {'apply (copy on write)':>22}: {_time(lambda: JSONHandler.apply_json_patch(source, patch)):>10}"
+    )
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
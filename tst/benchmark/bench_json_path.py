@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Benchmarks for JSON Path Module
+===============================
+
+Compares the previous `extract_from_path`, which split the path on every
+call, against compiled paths and a `PathSet` extracting several paths in
+one traversal: once per record, and once over a document holding all the
+records, where each wildcard path would otherwise walk every record.
+
+Usage:
+------
+    PYTHONPATH=src python tst/benchmark/bench_json_path.py
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import time
+
+from rite.format.json.json import JSONHandler
+from rite.format.json.json_path import PathSet, compile_path
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+RECORDS = 50_000
+PATHS = [
+    "user/profile/name",
+    "user/profile/email",
+    "user/address/city",
+    "user/address/zip",
+    "order/total",
+]
+REPEAT = 3
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def split_extract(json_data, path):
+    """
+    The previous path extraction, for comparison.
+    """
+    elements = path.split("/")
+    for element in elements:
+        if isinstance(json_data, dict) and element in json_data:
+            json_data = json_data[element]
+        else:
+            return None
+    return json_data
+
+
+def _records():
+    """
+    Build records with a few nested objects each.
+    """
+    return [
+        {
+            "user": {
+                "profile": {"name": f"user{i}", "email": f"u{i}@example.com"},
+                "address": {"city": "Oslo", "zip": f"{i:05d}"},
+            },
+            "order": {"total": i * 1.5},
+        }
+        for i in range(RECORDS)
+    ]
+
+
+def _time(func) -> str:
+    """
+    Return the best time of a few calls.
+    """
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return f"{best * 1000:.1f} ms"
+
+
+def main():
+    """
+    Run the benchmark and print the results.
+    """
+    records = _records()
+    compiled = [compile_path(path) for path in PATHS]
+    path_set = PathSet(PATHS)
+    cases = [
+        (
+            "split per call",
+            lambda: [
+                [split_extract(record, path) for path in PATHS]
+                for record in records
+            ],
+        ),
+        (
+            "extract_from_path",
+            lambda: [
+                [JSONHandler.extract_from_path(record, path) for path in PATHS]
+                for record in records
+            ],
+        ),
+        (
+            "compiled",
+            lambda: [
+                [path.get(record) for path in compiled] for record in records
+            ],
+        ),
+        (
+            "PathSet",
+            lambda: [path_set.extract(record) for record in records],
+        ),
+    ]
+    print(f"{RECORDS} records, {len(PATHS)} paths")
+    for name, func in cases:
+        print(f"  {name:>18}: {_time(func):>12}")
+
+    document = {"items": records}
+    wildcards = [f"items/*/{path}" for path in PATHS]
+    compiled = [compile_path(path) for path in wildcards]
+    path_set = PathSet(wildcards)
+    print(f"1 document, {len(PATHS)} wildcard paths")
+    for name, func in (
+        ("compiled", lambda: [path.extract(document) for path in compiled]),
+        ("PathSet", lambda: path_set.extract(document)),
+    ):
+        print(f"  {name:>18}: {_time(func):>12}")
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Benchmarks for JSON Schema Module
+=================================
+
+Compares the compiled `SchemaValidator` against a naive validator that
+interprets the schema for every record, and the `jsonschema` package when
+it is installed. Also compares the syntax check of `validate_json` with
+parsing the text.
+
+Usage:
+------
+    PYTHONPATH=src python tst/benchmark/bench_json_schema.py
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import json
+import time
+
+from rite.format.json.json_schema import SchemaValidator, check_syntax
+
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+RECORDS = 100_000
+
+SCHEMA = {
+    "type": "object",
+    "required": ["id", "name", "tags"],
+    "properties": {
+        "id": {"type": "integer", "minimum": 0},
+        "name": {"type": "string", "maxLength": 20},
+        "email": {"type": ["string", "null"]},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "address": {
+            "type": "object",
+            "properties": {"city": {"type": "string"}},
+        },
+    },
+}
+
+_TYPES = {
+    "integer": int,
+    "string": str,
+    "null": type(None),
+    "array": list,
+    "object": dict,
+}
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def naive_validate(value, schema):
+    """
+    Validate by walking the schema for every value, for comparison.
+    """
+    if "type" in schema:
+        names = schema["type"]
+        names = [names] if isinstance(names, str) else names
+        if not any(type(value) is _TYPES[name] for name in names):
+            return False
+    if "minimum" in schema and value < schema["minimum"]:
+        return False
+    if "maxLength" in schema and len(value) > schema["maxLength"]:
+        return False
+    return _naive_children(value, schema)
+
+
+def _naive_children(value, schema):
+    """
+    Validate the members or items of a value, for comparison.
+    """
+    if isinstance(value, dict):
+        if any(key not in value for key in schema.get("required", ())):
+            return False
+        return all(
+            naive_validate(value[key], sub)
+            for key, sub in schema.get("properties", {}).items()
+            if key in value
+        )
+    if isinstance(value, list) and "items" in schema:
+        return all(naive_validate(item, schema["items"]) for item in value)
+    return True
+
+
+def _time(func) -> str:
+    """
+    Return the time of a call, as records per second.
+    """
+    start = time.perf_counter()
+    func()
+    return f"{RECORDS / (time.perf_counter() - start):>12,.0f} records/s"
+
+
+def main():
+    """
+    Run the benchmark and print the throughput of each validator.
+    """
+    records = [
+        {
+            "id": i,
+            "name": f"user{i}",
+            "email": None,
+            "tags": ["a", "b"],
+            "address": {"city": "Oslo"},
+        }
+        for i in range(RECORDS)
+    ]
+    validator = SchemaValidator(SCHEMA)
+    print(f"{RECORDS} records")
+    print(
+        f"  {'naive':>18}: "
+        + _time(lambda: [naive_validate(r, SCHEMA) for r in records])
+    )
+    print(
+        f"  {'compiled':>18}: "
+        + _time(lambda: [validator.is_valid(r) for r in records])
+    )
+    if jsonschema is not None:
+        checker = jsonschema.Draft202012Validator(SCHEMA)
+        print(
+            f"  {'jsonschema':>18}: "
+            + _time(lambda: [checker.is_valid(r) for r in records])
+        )
+    texts = [json.dumps(record) for record in records]
+    print(
+        f"  {'json.loads':>18}: "
+        + _time(lambda: [json.loads(text) for text in texts])
+    )
+    print(
+        f"  {'check_syntax':>18}: "
+        + _time(lambda: [check_syntax(text) for text in texts])
+    )
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Benchmarks for JSON Stream Module
+=================================
+
+Compares the peak resident memory and run time of `JSONHandler.read_json`
+against the incremental `iter_json` reader on a large array of records.
+Each reader runs in a fresh interpreter so its peak memory is measured on
+its own.
+
+Usage:
+------
+    PYTHONPATH=src python tst/benchmark/bench_json_stream.py [records]
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from rite.format.json.json import JSONHandler
+from rite.format.json.json_stream import iter_json
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+RECORDS = 500_000
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _prepare(file_path: str, records: int):
+    """
+    Write a document with an `items` array of records.
+    """
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write('{"meta": {"source": "benchmark"}, "items": [\n')
+        for n in range(records):
+            record = {
+                "id": n,
+                "name": f"item-{n}",
+                "tags": ["alpha", "beta", "gamma"],
+                "price": n * 0.25,
+                "active": n % 2 == 0,
+            }
+            file.write(("," if n else "") + json.dumps(record) + "\n")
+        file.write("]}\n")
+
+
+def _child(reader: str, file_path: str):
+    """
+    Sum the record prices with one reader and print the run time and the
+    peak resident memory of this process.
+    """
+    start = time.perf_counter()
+    if reader == "read_json":
+        items = JSONHandler.read_json(file_path)["items"]
+    else:
+        items = iter_json(file_path, "items.*")
+    total = sum(item["price"] for item in items)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"seconds": elapsed, "peak_kib": peak, "total": total}))
+
+
+def main():
+    """
+    Run the benchmark and print the results for each reader.
+    """
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else RECORDS
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "data.json")
+        _prepare(file_path, records)
+        size = os.path.getsize(file_path) / 2**20
+        print(f"{records:,} records, {size:,.1f} MiB")
+        for reader in ("read_json", "iter_json"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--child", reader, file_path],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(output)
+            print(
+                f"{reader:>10}: {result['seconds']:8.2f} s "
+                f"{result['peak_kib'] / 1024:10,.1f} MiB peak RSS"
+            )
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--child":
+        _child(sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Benchmarks for JSON Tree Module
+===============================
+
+Compares the iterative flatten, deep merge and key search of `JSONHandler`
+against the previous recursive implementations, on a wide document with
+many keys per level and on a deep one nested thousands of levels.
+
+Usage:
+------
+    PYTHONPATH=src python tst/benchmark/bench_json_tree.py
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import time
+
+from rite.format.json.json import JSONHandler
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+WIDE_KEYS = 40
+DEEP_LEVELS = 5_000
+REPEAT = 5
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def recursive_flatten(data, parent_key="", sep="."):
+    """
+    The previous recursive flatten, for comparison.
+    """
+    items = []
+    for k, v in data.items():
+        new_key = f"{parent_key}{sep}{k}" if parent_key else k
+        if isinstance(v, dict):
+            items.extend(recursive_flatten(v, new_key, sep=sep).items())
+        else:
+            items.append((new_key, v))
+    return dict(items)
+
+
+def recursive_merge(json1, json2):
+    """
+    The previous recursive deep merge, for comparison.
+    """
+    for key, value in json2.items():
+        if key in json1:
+            if isinstance(json1[key], dict) and isinstance(value, dict):
+                recursive_merge(json1[key], value)
+            else:
+                json1[key] = value
+        else:
+            json1[key] = value
+    return json1
+
+
+def recursive_find(data, key):
+    """
+    The previous recursive key search, for comparison.
+    """
+    if key in data:
+        return data[key]
+    for _, value in data.items():
+        if isinstance(value, dict):
+            result = recursive_find(value, key)
+            if result is not None:
+                return result
+    return None
+
+
+def _wide():
+    """
+    Build an object with many keys on each of three levels.
+    """
+    return {
+        f"a{i}": {
+            f"b{j}": {f"c{k}": k for k in range(WIDE_KEYS)}
+            for j in range(WIDE_KEYS)
+        }
+        for i in range(WIDE_KEYS)
+    }
+
+
+def _deep():
+    """
+    Build an object nested thousands of levels deep.
+    """
+    data = {"leaf": 1}
+    for _ in range(DEEP_LEVELS):
+        data = {"k": data, "v": 0}
+    return data
+
+
+def _time(func, make_arguments) -> str:
+    """
+    Return the best time of a few calls on fresh documents, or the error
+    raised.
+    """
+    best = float("inf")
+    for _ in range(REPEAT):
+        arguments = make_arguments()
+        start = time.perf_counter()
+        try:
+            func(*arguments)
+        except RecursionError:
+            return "RecursionError"
+        best = min(best, time.perf_counter() - start)
+    return f"{best * 1000:.1f} ms"
+
+
+def main():
+    """
+    Run the benchmark and print the results for each document.
+    """
+    for label, build in (("wide", _wide), ("deep", _deep)):
+        print(label)
+        cases = [
+            (
+                "flatten",
+                recursive_flatten,
+                JSONHandler.flatten_json,
+                lambda: (build(),),
+            ),
+            (
+                "merge",
+                recursive_merge,
+                JSONHandler.deep_merge_json,
+                lambda: (build(), build()),
+            ),
+            (
+                "find",
+                recursive_find,
+                JSONHandler.find_in_json,
+                lambda: (build(), "leaf"),
+            ),
+        ]
+        for name, old, new, make_arguments in cases:
+            print(
+                f"  {name:>8}: recursive {_time(old, make_arguments):>15} "
+                f"iterative {_time(new, make_arguments):>15}"
+            )
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
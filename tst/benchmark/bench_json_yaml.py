@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Benchmarks for JSON YAML Module
+===============================
+
+Compares the previous `json_to_yaml` and `yaml_to_json`, built on
+`yaml.dump` and `yaml.safe_load`, with the libyaml based conversions, and
+reading a multi-document file whole against streaming it.
+
+Usage:
+------
+    PYTHONPATH=src python tst/benchmark/bench_json_yaml.py
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import os
+import tempfile
+import time
+
+import yaml
+
+from rite.format.json.json import JSONHandler
+from rite.format.json.json_yaml import LIBYAML
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+RECORDS = 5_000
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _time(func) -> str:
+    """
+    Return the time of a call.
+    """
+    start = time.perf_counter()
+    func()
+    return f"{(time.perf_counter() - start) * 1000:8.1f} ms"
+
+
+def main():
+    """
+    Run the benchmark and print the results.
+    """
+    data = {
+        "items": [
+            {"id": i, "name": f"item{i}", "tags": ["a", "b"], "ok": True}
+            for i in range(RECORDS)
+        ]
+    }
+    text = yaml.dump(data)
+    print(f"{RECORDS} records, libyaml {LIBYAML}")
+    print(f"  {'yaml.dump':>22}: {_time(lambda: yaml.dump(data))}")
+    print(
+        f"  {'json_to_yaml':>22}: "
+        f"{_time(lambda: JSONHandler.json_to_yaml(data))}"
+    )
+    print(f"  {'yaml.safe_load':>22}: {_time(lambda: yaml.safe_load(text))}")
+    print(
+        f"  {'yaml_to_json':>22}: "
+        f"{_time(lambda: JSONHandler.yaml_to_json(text))}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "data.yaml")
+        JSONHandler.write_yaml(file_path, data["items"], multiple=True)
+
+        def whole():
+            with open(file_path, encoding="utf-8") as file:
+                return list(yaml.safe_load_all(file.read()))
+
+        def streamed():
+            return sum(1 for _ in JSONHandler.read_yaml(file_path, True))
+
+        print(f"  {'safe_load_all, whole':>22}: {_time(whole)}")
+        print(f"  {'read_yaml, streamed':>22}: {_time(streamed)}")
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
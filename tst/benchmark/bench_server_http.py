@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Benchmarks for BaseHTTPServer Module
+====================================
+
+Measures requests per second and p99 latency of each server mode under
+concurrent clients, with handlers that spend a little time waiting on I/O,
+the cost of the access log at several sample rates, and the cost of route
+dispatch as the number of routes grows.
+
+Usage:
+------
+    PYTHONPATH=src python tst/benchmark/bench_server_http.py
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import http.client
+import logging
+import os
+import threading
+import time
+
+from rite.server.server_http import SERVER_MODES, BaseHTTPServer
+from rite.server.server_http_metrics import start_access_log
+from rite.server.server_http_router import Router
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+CLIENTS = 16
+REQUESTS_PER_CLIENT = 100
+HANDLER_DELAY = 0.002
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class SlowHandler(BaseHTTPServer):
+    """
+    Handler simulating a short wait on a backend for every request.
+    """
+
+    def do_get(self):
+        time.sleep(HANDLER_DELAY)
+        super().do_get()
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _load(httpd):
+    """
+    Run the clients against a server and return (requests/s, p99 seconds).
+    """
+    host, port = httpd.server_address[:2]
+    latencies = []
+    lock = threading.Lock()
+
+    def client():
+        conn = http.client.HTTPConnection(host, port, timeout=30)
+        timings = []
+        for _ in range(REQUESTS_PER_CLIENT):
+            start = time.perf_counter()
+            conn.request("GET", "/")
+            conn.getresponse().read()
+            timings.append(time.perf_counter() - start)
+        conn.close()
+        with lock:
+            latencies.extend(timings)
+
+    threads = [threading.Thread(target=client) for _ in range(CLIENTS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    return len(latencies) / elapsed, p99
+
+
+def _serve(handler_class, mode):
+    """
+    Run the clients against a new server and return (requests/s, p99).
+    """
+    httpd = BaseHTTPServer.create_server(
+        handler_class, port=0, mode=mode, workers=CLIENTS
+    )
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        return _load(httpd)
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def _access_log():
+    """
+    Print the throughput of the pool mode with the access log written to
+    a file at several sample rates.
+    """
+    file_handler = logging.FileHandler(os.devnull)
+    listener = start_access_log(file_handler)
+    try:
+        for rate in (1.0, 0.1, 0.0):
+
+            class Handler(BaseHTTPServer):
+                access_log_sample_rate = rate
+
+            rps, p99 = _serve(Handler, "pool")
+            print(
+                f"log {rate:>4.0%}: {rps:10,.0f} requests/s "
+                f"{p99 * 1000:8.2f} ms p99"
+            )
+    finally:
+        listener.stop()
+        file_handler.close()
+
+
+def _dispatch():
+    """
+    Print the time to match a static and a parameterized path for routers
+    of growing size.
+    """
+    for count in (10, 100, 1000):
+        router = Router()
+        for n in range(count):
+            router.add("GET", f"/static/{n}", n)
+            router.add("GET", f"/resource{n}/{{item_id}}/detail", n)
+        for path in ("/static/5", "/resource5/42/detail"):
+            start = time.perf_counter()
+            for _ in range(100_000):
+                router.match("GET", path)
+            per_call = (time.perf_counter() - start) / 100_000 * 1e9
+            print(f"{count:>6} routes {path:>22}: {per_call:8.0f} ns/match")
+
+
+def main():
+    """
+    Run the benchmark and print the results for each server mode.
+    """
+    for mode in SERVER_MODES:
+        rps, p99 = _serve(SlowHandler, mode)
+        print(f"{mode:>10}: {rps:10,.0f} requests/s {p99 * 1000:8.2f} ms p99")
+    _access_log()
+    _dispatch()
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Benchmarks for SQLiteServer Module
+==================================
+
+Measures the connection, insert, pragma and caching paths of SQLiteServer.
+
+Benchmarks:
+-----------
+- Per-call connections against pooled connections under a threaded read
+  load.
+- Row-by-row inserts against the bulk insert path.
+- Throughput of a mixed read/write load under each pragma profile.
+- Median latency of repeated lookups with and without the result cache.
+
+Usage:
+------
+    PYTHONPATH=src python tst/benchmark/bench_server_sqlite.py
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from rite.server.server_sqlite import PRAGMA_PROFILES, SQLiteServer
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+ROWS = 10_000
+THREADS = 8
+QUERIES_PER_THREAD = 2_000
+BULK_ROWS = 200_000
+MIXED_SECONDS = 2.0
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _prepare(db_path: str):
+    """
+    Create and fill the benchmark table.
+    """
+    server = SQLiteServer(db_path)
+    server.execute_query(
+        "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, value REAL)"
+    )
+    server.transaction(
+        [
+            (
+                "INSERT INTO items (name, value) VALUES (?, ?)",
+                (f"item-{i}", i * 0.5),
+            )
+            for i in range(ROWS)
+        ]
+    )
+
+
+def _threaded_reads(server: SQLiteServer) -> float:
+    """
+    Run point lookups from several threads and return queries per second.
+    """
+
+    def worker(offset: int):
+        for i in range(QUERIES_PER_THREAD):
+            server.fetch_one(
+                "SELECT name, value FROM items WHERE id = ?",
+                ((offset + i) % ROWS + 1,),
+            )
+
+    threads = [
+        threading.Thread(target=worker, args=(n * 1000,))
+        for n in range(THREADS)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return THREADS * QUERIES_PER_THREAD / elapsed
+
+
+def _bulk_inserts(db_path: str):
+    """
+    Compare row-by-row inserts against `insert_many` and print rows/s.
+    """
+    with SQLiteServer(db_path, pool_size=1) as server:
+        server.execute_query("CREATE TABLE bulk (name TEXT, value REAL)")
+        rows = 2_000
+        start = time.perf_counter()
+        for i in range(rows):
+            server.insert("bulk", {"name": f"row-{i}", "value": i})
+        single = rows / (time.perf_counter() - start)
+        stats = server.insert_many(
+            "bulk",
+            ({"name": f"row-{i}", "value": i} for i in range(BULK_ROWS)),
+            chunk_size=10_000,
+        )
+    print(f"{'insert':>10}: {single:12,.0f} rows/s")
+    print(f"{'bulk':>10}: {stats['rows_per_second']:12,.0f} rows/s")
+
+
+def _mixed_load(db_path: str, profile):
+    """
+    Run reader threads alongside one writer thread for a fixed time and
+    return the reads and writes per second.
+    """
+    counts = {"reads": 0, "writes": 0}
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    with SQLiteServer(
+        db_path, pool_size=THREADS + 1, profile=profile
+    ) as server:
+
+        def reader(offset: int):
+            done = 0
+            while not stop.is_set():
+                server.fetch_one(
+                    "SELECT name, value FROM items WHERE id = ?",
+                    ((offset + done) % ROWS + 1,),
+                )
+                done += 1
+            with lock:
+                counts["reads"] += done
+
+        def writer():
+            done = 0
+            while not stop.is_set():
+                server.update(
+                    "items",
+                    {"value": done},
+                    f"id = {done % ROWS + 1}",
+                )
+                done += 1
+            with lock:
+                counts["writes"] += done
+
+        threads = [
+            threading.Thread(target=reader, args=(n * 1000,))
+            for n in range(THREADS)
+        ]
+        threads.append(threading.Thread(target=writer))
+        for thread in threads:
+            thread.start()
+        time.sleep(MIXED_SECONDS)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    return (
+        counts["reads"] / MIXED_SECONDS,
+        counts["writes"] / MIXED_SECONDS,
+    )
+
+
+def _profiles(tmp: str):
+    """
+    Run the mixed load against a fresh database for each pragma profile.
+    """
+    for profile in (None, *PRAGMA_PROFILES):
+        db_path = os.path.join(tmp, f"mixed-{profile or 'default'}.db")
+        _prepare(db_path)
+        reads, writes = _mixed_load(db_path, profile)
+        print(
+            f"{profile or 'default':>12}: {reads:10,.0f} reads/s"
+            f" {writes:10,.0f} writes/s"
+        )
+
+
+def _cached_lookups(db_path: str):
+    """
+    Print the median latency of repeated lookups with and without caching.
+    """
+    for label, cache_size in (("uncached", 0), ("cached", 1024)):
+        with SQLiteServer(db_path, pool_size=1, cache_size=cache_size) as db:
+            timings = []
+            for i in range(20_000):
+                start = time.perf_counter()
+                db.fetch_all(
+                    "SELECT name, value FROM items WHERE id = ?",
+                    (i % 100 + 1,),
+                )
+                timings.append(time.perf_counter() - start)
+        p50 = statistics.median(timings) * 1e6
+        print(f"{label:>10}: {p50:10.1f} us p50")
+
+
+def main():
+    """
+    Run the benchmark and print queries per second for each mode.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        _prepare(db_path)
+        for label, pool_size in (("per-call", 0), ("pooled", THREADS)):
+            with SQLiteServer(db_path, pool_size=pool_size) as server:
+                qps = _threaded_reads(server)
+            print(f"{label:>10}: {qps:12,.0f} queries/s")
+        _cached_lookups(db_path)
+        _bulk_inserts(db_path)
+        _profiles(tmp)
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
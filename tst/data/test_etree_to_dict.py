@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for ElementTree to Dictionary Modules
+===========================================
+
+This test suite verifies the iterative `etree_to_dict` and the streaming
+`iterparse_to_dict`.
+
+Tested Features:
+----------------
+- Attributes, text and repeated children.
+- Trees nested deeper than the recursion limit.
+- Streaming the elements matching a tag or a path, with namespaces.
+- Discarding processed elements while streaming.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import io
+import sys
+import tracemalloc
+from xml.etree.ElementTree import ParseError, fromstring
+
+import pytest
+
+from rite.data.tree.etree_iterparse import iterparse_to_dict
+from rite.data.tree.etree_to_dict import etree_to_dict
+from rite.format.json.json import JSONHandler
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+FEED = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>News</title>
+  <entry id="1"><title>First</title><tag>a</tag><tag>b</tag></entry>
+  <entry id="2"><title>Second</title><note lang="en">Hi</note></entry>
+  <meta><entry id="3"/></meta>
+</feed>
+"""
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+
+def test_etree_to_dict():
+    """
+    Test attributes, text, repeated children and empty elements.
+    """
+    root = fromstring(
+        "<book id='1'><title>Python</title><tag>a</tag><tag>b</tag>"
+        "<note lang='en'>Hi</note><empty/>text</book>"
+    )
+    assert etree_to_dict(root) == {
+        "book": {
+            "title": "Python",
+            "tag": ["a", "b"],
+            "note": {"@lang": "en", "#text": "Hi"},
+            "empty": None,
+            "@id": "1",
+        }
+    }
+    assert etree_to_dict(fromstring("<a> x </a>")) == {"a": "x"}
+
+
+def test_deep_tree():
+    """
+    Test a tree nested deeper than the recursion limit.
+    """
+    depth = sys.getrecursionlimit() + 100
+    root = fromstring("<n>" * depth + "leaf" + "</n>" * depth)
+    result = etree_to_dict(root)
+    for _ in range(depth - 1):
+        result = result["n"]
+    assert result == {"n": "leaf"}
+
+
+def test_iterparse_tag(tmp_path):
+    """
+    Test streaming the elements with a tag at any depth from a file.
+    """
+    file_path = tmp_path / "feed.xml"
+    file_path.write_bytes(FEED)
+    records = list(JSONHandler.iter_xml(str(file_path), "entry"))
+    ns = "{http://www.w3.org/2005/Atom}"
+    assert [record[f"{ns}entry"]["@id"] for record in records] == [
+        "1",
+        "2",
+        "3",
+    ]
+    assert records[0][f"{ns}entry"][f"{ns}tag"] == ["a", "b"]
+
+
+def test_iterparse_path():
+    """
+    Test streaming the elements at a path, and discarding them.
+    """
+    records = list(iterparse_to_dict(io.BytesIO(FEED), "feed/entry"))
+    assert len(records) == 2
+    assert list(iterparse_to_dict(io.BytesIO(FEED), "/*/meta/entry")) == [
+        {"{http://www.w3.org/2005/Atom}entry": {"@id": "3"}}
+    ]
+
+
+def test_iterparse_memory():
+    """
+    Test that processed elements are discarded, keeping memory flat.
+    """
+    data = b"<root>" + b"<item><v>1</v></item>" * 50_000 + b"</root>"
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in iterparse_to_dict(io.BytesIO(data), "item"))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert count == 50_000
+    # The whole tree takes over 10 MiB.
+    assert peak < 2 * 1024 * 1024
+    with pytest.raises(ParseError):
+        list(iterparse_to_dict(io.BytesIO(b"<root><item>"), "item"))
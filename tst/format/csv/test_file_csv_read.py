@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for Read CSV File Module
+==============================
+
+This test suite verifies the CSV reading engine and dialect sniffing.
+
+Tested Features:
+----------------
+- Sniffing delimiters, dialects and headers from a sample.
+- Typed, columnar reading in chunks, as lists and NumPy arrays.
+- Strict type inference, widened to text instead of losing cells.
+- Agreement with `csv.DictReader` for untyped records.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+- `numpy` for the array output, skipped when not installed.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import csv
+import io
+
+import pytest
+
+from rite.format.csv.file_csv_read import (
+    infer_type,
+    iter_csv_chunks,
+    iter_csv_records,
+    parse_bool,
+    parse_number,
+    read_csv_columns,
+)
+from rite.format.csv.format_csv_delim import detect_delimiter, sniff_dialect
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+CONTENT = """\
+id;name;active;size
+1;"Smith; John";yes;20
+
+2;Doe;no;
+3;Roe;TRUE;1.5
+"""
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+
+def test_sniffing():
+    """
+    Test detecting the delimiter and header from a sample.
+    """
+    dialect, has_header = sniff_dialect(CONTENT)
+    assert dialect.delimiter == ";" and has_header
+    assert detect_delimiter("data.csv", "a|b|c\n1|2|3\n") == "|"
+    assert detect_delimiter("data.tsv") == "\t"
+    assert sniff_dialect("single")[0].delimiter == ","
+
+
+def test_converters():
+    """
+    Test the fast paths agree with the convert helpers.
+    """
+    assert parse_number("1e3") == 1000.0
+    assert parse_number(" 45.5 % ") == 45.5
+    assert parse_number("n/a") is None
+    assert parse_number("nan") is None and parse_number("1_000") is None
+    assert parse_number(" 9007199254740993 ") == 9007199254740993
+    assert parse_bool("on") is True
+    assert parse_bool(" No ") is False
+    assert parse_bool("maybe") is None
+    assert infer_type(["1", "0", ""]) == "number"
+    assert infer_type(["yes", "0"]) == "bool"
+    assert infer_type(["1", "x"]) == "str"
+    assert infer_type(["-1.5", ".5", "2E3", " 3. "]) == "number"
+    for value in ("nan", "inf", "1_000", "20 m", "45.5 %", "0x10"):
+        assert infer_type(["1", value]) == "str"
+
+
+def test_columns():
+    """
+    Test typed, columnar reading across chunks.
+    """
+    columns = read_csv_columns(
+        io.StringIO(CONTENT, newline=""), types="infer", chunk_size=2
+    )
+    assert columns == {
+        "id": [1.0, 2.0, 3.0],
+        "name": ["Smith; John", "Doe", "Roe"],
+        "active": [True, False, True],
+        "size": [20.0, None, 1.5],
+    }
+    chunks = list(
+        iter_csv_chunks(
+            io.StringIO("1,2,3\n4\n"),
+            header=False,
+            types={"column_2": "number", "column_3": len},
+        )
+    )
+    assert chunks == [
+        {"column_1": ["1", "4"], "column_2": [2.0, None], "column_3": [1, 0]}
+    ]
+    with pytest.raises(ValueError):
+        read_csv_columns(io.StringIO(CONTENT), types={"id": "date"})
+
+
+def test_inferred_columns_widen():
+    """
+    Test that an inferred column is kept as text from the chunk with a cell
+    that does not fit its type, or whole when reading the whole file,
+    instead of losing the cell, and that integers stay exact.
+    """
+    text = "n,b,s\n1,yes,a\n2,no,b\n,maybe,c\nn/a,yes,d\n5,no,e\n"
+    chunks = list(
+        iter_csv_chunks(io.StringIO(text), types="infer", chunk_size=2)
+    )
+    assert [chunk["n"] for chunk in chunks] == [
+        [1, 2],
+        ["", "n/a"],
+        ["5"],
+    ]
+    assert [chunk["b"] for chunk in chunks] == [
+        [True, False],
+        ["maybe", "yes"],
+        ["no"],
+    ]
+    columns = read_csv_columns(io.StringIO(text), types="infer", chunk_size=2)
+    assert columns["n"] == ["1", "2", "", "n/a", "5"]
+    assert columns["b"] == ["yes", "no", "maybe", "yes", "no"]
+    columns = read_csv_columns(
+        io.StringIO("n\n9007199254740993\n\n2.5\n"), types="infer"
+    )
+    assert columns["n"] == [9007199254740993, 2.5]
+    assert type(columns["n"][0]) is int
+
+
+def test_records(tmp_path):
+    """
+    Test that untyped records match csv.DictReader.
+    """
+    file_path = tmp_path / "data.csv"
+    file_path.write_text(CONTENT.replace(";", ",").replace(",,", ",x,"))
+    with open(file_path, newline="", encoding="utf-8") as file:
+        expected = list(csv.DictReader(file))
+    assert list(iter_csv_records(str(file_path), chunk_size=1)) == expected
+    assert list(iter_csv_records(file_path, header=None)) == expected
+
+
+def test_numpy():
+    """
+    Test the NumPy array output.
+    """
+    numpy = pytest.importorskip("numpy")
+    columns = read_csv_columns(
+        io.StringIO(CONTENT), types="infer", use_numpy=True, chunk_size=2
+    )
+    assert columns["id"].dtype == int
+    assert columns["size"].dtype == float
+    assert columns["active"].dtype == bool
+    assert numpy.isnan(columns["size"][1])
+    assert list(columns["name"]) == ["Smith; John", "Doe", "Roe"]
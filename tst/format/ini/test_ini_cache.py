@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for INI Cache Module
+==========================
+
+This test suite verifies `INIHandler.load_config`, the frozen lookups of
+`get_value`, `has_key`, `list_sections` and `list_keys`, and
+`INIHandler.watch_ini`.
+
+Tested Features:
+----------------
+- Lookups matching ConfigParser, including defaults and interpolation.
+- Reuse of the cached configuration until the file changes.
+- Reloading and notification by the watcher.
+- Watcher errors logged, and missing files ignored.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import os
+import threading
+import time
+
+from rite.format.ini.ini import INIHandler
+from rite.format.ini.ini_cache import ConfigCache, ConfigWatcher
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+CONTENT = """\
+[DEFAULT]
+root = /srv
+
+[paths]
+Data = %(root)s/data
+logs = %(root)s/logs
+
+[server]
+port = 8080
+"""
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+
+def test_matches_configparser(tmp_path):
+    """
+    Test that frozen lookups give the results of ConfigParser.
+    """
+    file_path = str(tmp_path / "config.ini")
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write(CONTENT)
+    parser = INIHandler.load_ini(file_path)
+    frozen = INIHandler.load_config(file_path)
+    cases = [
+        ("paths", "data"),
+        ("paths", "DATA"),
+        ("server", "root"),
+        ("DEFAULT", "root"),
+        ("server", "missing"),
+        ("missing", "root"),
+    ]
+    for section, key in cases:
+        assert INIHandler.get_value(
+            frozen, section, key, "x"
+        ) == INIHandler.get_value(parser, section, key, "x")
+        assert INIHandler.has_key(frozen, section, key) == INIHandler.has_key(
+            parser, section, key
+        )
+    assert INIHandler.list_sections(frozen) == ["paths", "server"]
+    for section in ("paths", "DEFAULT", "missing"):
+        assert INIHandler.list_keys(frozen, section) == INIHandler.list_keys(
+            parser, section
+        )
+    assert frozen.as_dict()["paths"]["data"] == "/srv/data"
+
+
+def test_cache_revalidates(tmp_path):
+    """
+    Test that a file is parsed again only when it changes.
+    """
+    cache = ConfigCache()
+    file_path = str(tmp_path / "config.ini")
+    assert cache.load(file_path).sections() == []
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write(CONTENT)
+    config = cache.load(file_path)
+    assert cache.load(file_path) is config
+    with open(file_path, "a", encoding="utf-8") as file:
+        file.write("[extra]\n")
+    assert cache.load(file_path).sections() == ["paths", "server", "extra"]
+    cache.invalidate()
+    assert cache.load(file_path) is not config
+
+
+def test_watcher(tmp_path):
+    """
+    Test that the watcher calls back when the file is replaced.
+    """
+    file_path = str(tmp_path / "config.ini")
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write(CONTENT)
+    changed = threading.Event()
+    configs = []
+
+    def callback(config):
+        configs.append(config)
+        changed.set()
+
+    watcher = ConfigWatcher(file_path, callback, cache=ConfigCache())
+    assert not watcher.check()
+    with INIHandler.watch_ini(file_path, callback, interval=0.01):
+        new_path = str(tmp_path / "new.ini")
+        with open(new_path, "w", encoding="utf-8") as file:
+            file.write("[server]\nport = 9090\n")
+        os.replace(new_path, file_path)
+        assert changed.wait(5)
+    assert configs[-1].get("server", "port") == "9090"
+    assert watcher.check()
+    assert watcher.config.get("server", "port") == "9090"
+
+
+def test_watcher_survives_errors(tmp_path, caplog):
+    """
+    Test that the watcher logs failed reloads and callbacks, ignores a
+    missing file and keeps running.
+    """
+    file_path = str(tmp_path / "config.ini")
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write(CONTENT)
+    ports = []
+    called = threading.Event()
+
+    def callback(config):
+        ports.append(config.get("server", "port"))
+        called.set()
+        if len(ports) == 1:
+            raise RuntimeError("callback failed")
+
+    def replace(content):
+        new_path = str(tmp_path / "new.ini")
+        with open(new_path, "wb") as file:
+            file.write(content)
+        os.replace(new_path, file_path)
+
+    def logged(text):
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if any(text in record.message for record in caplog.records):
+                return True
+            time.sleep(0.01)
+        return False
+
+    watcher = ConfigWatcher(file_path, callback, 0.01, ConfigCache())
+    with watcher:
+        replace(b"[server]\nport = \xff\n")
+        assert logged("Failed to reload")
+        os.remove(file_path)
+        time.sleep(0.1)
+        assert not ports
+        assert watcher.config.get("server", "port") == "8080"
+        replace(b"[server]\nport = 1\n")
+        assert logged("Callback failed") and called.wait(5)
+        called.clear()
+        replace(b"[server]\nport = 2\n")
+        assert called.wait(5)
+        assert watcher._thread.is_alive()
+    assert ports == ["1", "2"]
+    assert watcher.config.get("server", "port") == "2"
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for INI Edit Module
+=========================
+
+This test suite verifies `INIHandler.edit_ini` and
+`INIHandler.update_ini_file`.
+
+Tested Features:
+----------------
+- Round trips of untouched files, byte for byte.
+- Setting and removing keys and sections while keeping comments.
+- Writing once, atomically, and not at all without changes.
+- Values spanning blank lines and comments, as in ConfigParser.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import configparser
+import os
+
+import pytest
+
+from rite.format.ini.ini import INIHandler
+from rite.format.ini.ini_edit import INIDocument
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+CONTENT = """\
+; Service configuration
+[DEFAULT]
+root=/srv
+
+# Paths on disk
+[paths]
+data = %(root)s/data
+Logs = first
+    second
+# end of paths
+
+# The server
+[server]
+port: 8080
+"""
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+
+def _parse(text):
+    config = configparser.ConfigParser()
+    config.read_string(text)
+    return {section: dict(config[section]) for section in config.sections()}
+
+
+def test_round_trip():
+    """
+    Test that an untouched document is unchanged, including line endings.
+    """
+    assert str(INIDocument(CONTENT)) == CONTENT
+    crlf = CONTENT.replace("\n", "\r\n")
+    document = INIDocument(crlf)
+    document.set("server", "host", "localhost")
+    assert str(document).count("\n") == str(document).count("\r\n")
+
+
+def test_update():
+    """
+    Test that edits keep comments and agree with ConfigParser.
+    """
+    document = INIDocument(CONTENT)
+    assert document.update(
+        {
+            "paths": {"LOGS": "/var/log\n/tmp", "cache": 1},
+            "server": None,
+            "extra": {"key": "value", "missing": None},
+        }
+    )
+    assert not document.update({"paths": {"cache": "1"}, "gone": None})
+    assert document.get("paths", "logs") == "/var/log\n/tmp"
+    text = str(document)
+    assert "# Paths on disk\n[paths]" in text
+    assert "port" not in text and "# The server" not in text
+    assert "# end of paths\n\n[extra]\nkey = value\n" in text
+    expected = _parse(CONTENT)
+    expected["paths"].update(logs="/var/log\n/tmp", cache="1")
+    del expected["server"]
+    expected["extra"] = {"key": "value", "root": "/srv"}
+    assert _parse(text) == expected
+    assert document.sections() == ["DEFAULT", "paths", "extra"]
+
+
+def test_file(tmp_path):
+    """
+    Test writing a batch once, and not writing without changes.
+    """
+    file_path = str(tmp_path / "config.ini")
+    assert INIHandler.update_ini_file(file_path, {"a": {"x": 1}})
+    with open(file_path, encoding="utf-8") as file:
+        assert file.read() == "[a]\nx = 1\n"
+    stat = os.stat(file_path)
+    assert not INIHandler.update_ini_file(file_path, {"a": {"x": 1}})
+    assert os.stat(file_path).st_ino == stat.st_ino
+    with INIHandler.edit_ini(file_path) as document:
+        document.set("a", "y", 2)
+        document.remove_key("a", "x")
+        assert document.add_section("b")
+    assert _parse(open(file_path, encoding="utf-8").read()) == {
+        "a": {"y": "2"},
+        "b": {},
+    }
+    with pytest.raises(RuntimeError):
+        with INIHandler.edit_ini(file_path) as document:
+            document.remove_section("a")
+            raise RuntimeError
+    assert INIDocument.read(file_path).has_section("a")
+    assert os.listdir(tmp_path) == ["config.ini"]
+
+
+def test_blank_lines_in_values():
+    """
+    Test that blank lines and comments between continuation lines belong
+    to the value, as in ConfigParser.
+    """
+    text = "[a]\nkey = a\n  b\n\n  c\n# note\n  d\n\nnext = 1\n"
+    document = INIDocument(text)
+    assert document.get("a", "key") == _parse(text)["a"]["key"]
+    document.set("a", "key", "z")
+    assert str(document) == "[a]\nkey = z\n\nnext = 1\n"
+    document = INIDocument("[a]\nkey = a\n  b\n\n  c\n")
+    document.set("a", "key", "z")
+    assert str(document) == "[a]\nkey = z\n"
+    document.set("a", "key", "x\n\ny")
+    assert _parse(str(document))["a"]["key"] == "x\n\ny"
+    assert document.remove_key("a", "key")
+    assert str(document) == "[a]\n"
+
+
+def test_empty_values():
+    """
+    Test that setting an empty value keeps the spacing of its delimiter.
+    """
+    document = INIDocument("[a]\nkey =\nother=\nlast :\n")
+    document.set("a", "key", "v")
+    document.set("a", "other", "w")
+    document.set("a", "last", "x")
+    assert str(document) == "[a]\nkey = v\nother=w\nlast : x\n"
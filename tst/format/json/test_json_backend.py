@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for JSON Backend Module
+=============================
+
+This test suite verifies that every installed JSON backend behaves like
+the standard library backend.
+
+Tested Features:
+----------------
+- Identical compact, indented and sorted output.
+- Non-string keys, dates, datetimes and UUIDs.
+- Integers beyond 64 bits.
+- Parse errors raised as `json.JSONDecodeError`.
+- Selecting the default backend used by `JSONHandler`.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import datetime
+import io
+import json
+import uuid
+
+import pytest
+
+from rite.format.json import json_backend
+from rite.format.json.json import JSONHandler
+from rite.format.json.json_backend import (
+    available_backends,
+    get_backend,
+    set_backend,
+)
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+DOCUMENT = {
+    "text": "café / ☃",
+    "numbers": [0, -1, 1.5, 2**70],
+    "nested": {"b": [True, False, None], "a": {}},
+    1: "int key",
+    None: "null key",
+    "when": datetime.datetime(2024, 5, 17, 8, 30, 15, 250000),
+    "aware": datetime.datetime(2024, 5, 17, tzinfo=datetime.timezone.utc),
+    "day": datetime.date(2024, 5, 17),
+    "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+}
+
+
+@pytest.fixture(params=available_backends())
+def backend(request):
+    """
+    Provide each installed backend.
+    """
+    return get_backend(request.param)
+
+
+@pytest.mark.parametrize("indent", [None, 2, 4])
+@pytest.mark.parametrize("sort_keys", [False, True])
+def test_dumps_matches_stdlib(backend, indent, sort_keys):
+    """
+    Test that every backend serializes like the standard library backend.
+    """
+    data = dict(DOCUMENT)
+    if sort_keys:
+        data = {str(key): value for key, value in data.items()}
+    expected = get_backend("json").dumps(data, indent, sort_keys)
+    assert backend.dumps(data, indent, sort_keys) == expected
+
+
+@pytest.mark.parametrize("indent", [None, 0, 2, 4])
+@pytest.mark.parametrize("sort_keys", [False, True])
+def test_dump_streams(backend, indent, sort_keys):
+    """
+    Test that dump writes what dumps returns, in several writes for a large
+    document with the standard library encoder.
+    """
+
+    class Writer(io.BytesIO):
+        writes = 0
+
+        def write(self, data):
+            self.writes += 1
+            return super().write(data)
+
+    records = [DOCUMENT[key] for key in ("text", "nested")] * 20000
+    data = dict(DOCUMENT)
+    if sort_keys:
+        data = {str(key): value for key, value in data.items()}
+    data = {
+        **data,
+        "records": records,
+        "large": {f"key {i}": [i, {}, []] for i in range(1000, 0, -1)},
+        "empty": [],
+    }
+    file = Writer()
+    size = backend.dump(data, file, indent, sort_keys)
+    expected = backend.dumps(data, indent, sort_keys).encode()
+    assert file.getvalue() == expected and size == len(expected)
+    if backend.name == "json":
+        assert file.writes > 1
+
+
+def test_dump_circular(backend):
+    """
+    Test that dump rejects circular references, like dumps.
+    """
+    data = list(range(1000))
+    data.append(data)
+    with pytest.raises(ValueError):
+        backend.dump({"data": data}, io.BytesIO())
+
+
+def test_values(backend):
+    """
+    Test the representation of keys and values JSON lacks.
+    """
+    data = backend.loads(backend.dumps(DOCUMENT))
+    assert data["1"] == "int key"
+    assert data["null"] == "null key"
+    assert data["when"] == "2024-05-17T08:30:15.250000"
+    assert data["aware"] == "2024-05-17T00:00:00+00:00"
+    assert data["day"] == "2024-05-17"
+    assert data["id"] == "12345678-1234-5678-1234-567812345678"
+    assert data["numbers"][3] == 2**70
+    assert backend.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+
+def test_errors(backend):
+    """
+    Test that parse errors are raised as JSONDecodeError and unsupported
+    values as TypeError.
+    """
+    with pytest.raises(json.JSONDecodeError):
+        backend.loads('{"a": }')
+    with pytest.raises(TypeError):
+        backend.dumps({"a": object()})
+
+
+def test_select_backend(monkeypatch):
+    """
+    Test selecting the backend used by JSONHandler.
+    """
+    with pytest.raises(ValueError, match="Unknown"):
+        get_backend("simdjson")
+    monkeypatch.setattr(json_backend, "_backend", None)
+    set_backend("json")
+    assert type(get_backend()) is json_backend.JSONBackend
+    assert not JSONHandler.validate_json("{")
+    set_backend()
+    assert get_backend().name == available_backends()[0]
+
+
+def test_formatting_keeps_stdlib_defaults(capsys):
+    """
+    Test that the formatting helpers of JSONHandler escape non-ASCII text
+    and reject values JSON lacks, whatever the backend.
+    """
+    assert JSONHandler.compress_json({"a": [1, "é"]}) == '{"a":[1,"\\u00e9"]}'
+    assert JSONHandler.indent_json({"a": "é"}, 2) == '{\n  "a": "\\u00e9"\n}'
+    JSONHandler.pretty_print_json({"b": "é", "a": 1})
+    assert capsys.readouterr().out == (
+        '{\n    "a": 1,\n    "b": "\\u00e9"\n}\n'
+    )
+    for format_json in (JSONHandler.compress_json, JSONHandler.indent_json):
+        with pytest.raises(TypeError):
+            format_json({"when": DOCUMENT["when"]})
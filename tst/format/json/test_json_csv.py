@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for JSON CSV Module
+=========================
+
+This test suite verifies the streaming conversions between JSON records
+and CSV rows behind `JSONHandler.json_to_csv`, `csv_to_json`,
+`json_file_to_csv` and `csv_file_to_json`.
+
+Tested Features:
+----------------
+- Writing generators with given or discovered columns.
+- Rejecting or ignoring keys outside the columns.
+- Two-pass column discovery and flattening nested records.
+- Round-tripping through JSON arrays and JSON Lines.
+- Throughput statistics.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import json
+
+import pytest
+
+from rite.format.json.json import JSONHandler
+from rite.format.json.json_csv import discover_fields, write_csv
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+
+def test_write_generator(tmp_path):
+    """
+    Test streaming a generator with discovered columns.
+    """
+    csv_file = str(tmp_path / "data.csv")
+    records = ({"id": i, "tags": [i], "note": None} for i in range(3))
+    assert JSONHandler.json_to_csv(records, csv_file) == 3
+    with open(csv_file, encoding="utf-8") as file:
+        assert file.read().splitlines() == [
+            "id,tags,note",
+            "0,[0],",
+            "1,[1],",
+            "2,[2],",
+        ]
+    assert JSONHandler.csv_to_json(csv_file)[1] == {
+        "id": "1",
+        "tags": "[1]",
+        "note": "",
+    }
+
+
+def test_extra_keys(tmp_path):
+    """
+    Test keys that only appear after the sampled records.
+    """
+    csv_file = str(tmp_path / "data.csv")
+    records = [{"a": 1}, {"a": 2, "b": 3}]
+    with pytest.raises(ValueError, match="'b'"):
+        write_csv(csv_file, records, sample=1)
+    assert write_csv(csv_file, records, sample=1, extrasaction="ignore") == 2
+    assert list(JSONHandler.iter_csv(csv_file)) == [{"a": "1"}, {"a": "2"}]
+    assert discover_fields(iter(records)) == ["a", "b"]
+    assert write_csv(csv_file, records, fieldnames=["b", "a"]) == 2
+    assert JSONHandler.csv_to_json(csv_file)[0] == {"b": "", "a": "1"}
+
+
+def test_file_round_trip(tmp_path):
+    """
+    Test converting a JSON file to CSV and back, in two passes.
+    """
+    json_file = tmp_path / "data.json"
+    csv_file = str(tmp_path / "data.csv")
+    records = [{"id": 1, "user": {"name": "Ann"}}, {"id": 2, "extra": "x"}]
+    json_file.write_text(json.dumps({"items": records}), encoding="utf-8")
+    stats = JSONHandler.json_file_to_csv(
+        str(json_file), csv_file, path="items.*", two_pass=True, flat=True
+    )
+    assert stats.rows == 2
+    assert stats.bytes_read == json_file.stat().st_size
+    assert stats.rows_per_second > 0
+
+    lines_file = str(tmp_path / "data.jsonl")
+    stats = JSONHandler.csv_file_to_json(csv_file, lines_file, lines=True)
+    assert stats.rows == 2
+    expected = [
+        {"id": "1", "user.name": "Ann", "extra": ""},
+        {"id": "2", "user.name": "", "extra": "x"},
+    ]
+    assert list(JSONHandler.iter_jsonl(lines_file)) == expected
+
+    array_file = str(tmp_path / "out.json")
+    JSONHandler.csv_file_to_json(csv_file, array_file, indent=2)
+    assert JSONHandler.read_json(array_file) == expected
+    stats = JSONHandler.json_file_to_csv(lines_file, csv_file, lines=True)
+    assert stats.rows == 2
+
+
+def test_empty(tmp_path):
+    """
+    Test converting no records.
+    """
+    csv_file = str(tmp_path / "data.csv")
+    json_file = str(tmp_path / "data.json")
+    assert JSONHandler.json_to_csv([], csv_file) == 0
+    assert JSONHandler.csv_file_to_json(csv_file, json_file).rows == 0
+    assert JSONHandler.read_json(json_file) == []
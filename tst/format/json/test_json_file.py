@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for JSON File Module
+==========================
+
+This test suite verifies the atomic, buffered and compressed writes behind
+`JSONHandler.write_json` and `save_dict_to_json`.
+
+Tested Features:
+----------------
+- Replacing files atomically, keeping their permissions.
+- Leaving the previous file intact when a write fails.
+- The fsync policies and buffer sizes.
+- Writing and reading back gzip and zstd compressed files.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import datetime
+import gzip
+import os
+import uuid
+
+import pytest
+
+from rite.format.json.json import JSONHandler
+from rite.format.json.json_file import (
+    open_output,
+    read_json_file,
+    write_json_file,
+)
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+
+@pytest.mark.parametrize("fsync", ["none", "file", "full"])
+def test_atomic_write(tmp_path, fsync):
+    """
+    Test replacing a file, keeping its permissions and leaving no
+    temporary files.
+    """
+    file_path = tmp_path / "data.json"
+    file_path.write_text("old", encoding="utf-8")
+    os.chmod(file_path, 0o640)
+    JSONHandler.write_json(
+        str(file_path), {"a": [1, 2]}, fsync=fsync, buffer_size=16
+    )
+    assert JSONHandler.read_json(str(file_path)) == {"a": [1, 2]}
+    assert os.stat(file_path).st_mode & 0o777 == 0o640
+    assert os.listdir(tmp_path) == ["data.json"]
+
+
+@pytest.mark.parametrize("atomic", [True, False])
+def test_failed_write(tmp_path, atomic):
+    """
+    Test that an atomic write failing midway leaves the old file.
+    """
+    file_path = tmp_path / "data.json"
+    file_path.write_text('{"old": true}', encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        with open_output(str(file_path), atomic=atomic) as file:
+            file.write(b'{"new": ')
+            raise RuntimeError("interrupted")
+    assert os.listdir(tmp_path) == ["data.json"]
+    expected = '{"old": true}' if atomic else '{"new": '
+    assert file_path.read_text(encoding="utf-8") == expected
+
+
+def test_write_size(tmp_path):
+    """
+    Test that the returned size is the size of the written JSON.
+    """
+    file_path = str(tmp_path / "data.json")
+    data = [{"id": i, "name": f"ré{i}"} for i in range(50000)]
+    size = write_json_file(file_path, data, buffer_size=4096)
+    assert size == os.path.getsize(file_path)
+    assert read_json_file(file_path) == data
+
+
+def test_write_encoding(tmp_path):
+    """
+    Test that files are UTF-8 with non-ASCII text unescaped, and dates and
+    UUIDs written as strings.
+    """
+    file_path = str(tmp_path / "data.json")
+    day = datetime.date(2024, 5, 17)
+    JSONHandler.write_json(file_path, {"text": "é", "day": day}, indent=None)
+    with open(file_path, "rb") as file:
+        assert file.read() == '{"text":"é","day":"2024-05-17"}'.encode()
+    JSONHandler.save_dict_to_json({"id": uuid.UUID(int=1)}, file_path)
+    assert JSONHandler.read_json(file_path) == {"id": str(uuid.UUID(int=1))}
+
+
+def test_invalid_options(tmp_path):
+    """
+    Test that unknown policies are rejected before any file is created.
+    """
+    file_path = str(tmp_path / "data.json")
+    with pytest.raises(ValueError):
+        write_json_file(file_path, {}, fsync="sometimes")
+    with pytest.raises(ValueError):
+        write_json_file(file_path, {}, compression="lzma")
+    with pytest.raises(TypeError):
+        JSONHandler.save_dict_to_json({"a": object()}, file_path)
+    assert os.listdir(tmp_path) == []
+
+
+def test_gzip(tmp_path):
+    """
+    Test writing and reading back a gzip compressed file.
+    """
+    file_path = tmp_path / "data.json.gz"
+    data = {"items": list(range(1000))}
+    JSONHandler.save_dict_to_json(
+        data, str(file_path), indent=None, compression="gzip"
+    )
+    assert gzip.decompress(file_path.read_bytes()).startswith(b'{"items":')
+    assert JSONHandler.read_json(str(file_path)) == data
+
+
+def test_zstd(tmp_path):
+    """
+    Test writing and reading back a zstd compressed file.
+    """
+    pytest.importorskip("zstandard")
+    file_path = str(tmp_path / "data.json.zst")
+    assert write_json_file(file_path, [1, 2], compression="zstd", level=1)
+    assert read_json_file(file_path) == [1, 2]
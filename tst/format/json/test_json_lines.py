@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for JSON Lines Module
+===========================
+
+This test suite verifies the functionality of `iter_jsonl` and
+`write_jsonl`.
+
+Tested Features:
+----------------
+- Round-tripping records, including non-ASCII text.
+- Appending to an existing file and skipping blank lines.
+- Parallel parsing yielding the same records in file order.
+- Reporting malformed lines.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import json
+
+import pytest
+
+from rite.format.json.json import JSONHandler
+from rite.format.json.json_lines import iter_jsonl, write_jsonl
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+
+def test_round_trip(tmp_path):
+    """
+    Test writing, appending and reading records.
+    """
+    file_path = str(tmp_path / "data.jsonl")
+    records = [{"id": 1, "name": "café"}, [1, 2], "x", None]
+    assert JSONHandler.write_jsonl(file_path, iter(records)) == 4
+    assert write_jsonl(file_path, [{"id": 2}], append=True) == 1
+    with open(file_path, "a", encoding="utf-8") as file:
+        file.write("\n  \n")
+    assert list(JSONHandler.iter_jsonl(file_path)) == records + [{"id": 2}]
+    with open(file_path, encoding="utf-8") as file:
+        assert file.readline() == '{"id":1,"name":"café"}\n'
+
+
+def test_parallel(tmp_path):
+    """
+    Test that parallel parsing preserves the records and their order.
+    """
+    file_path = str(tmp_path / "data.jsonl")
+    records = [{"id": n, "text": "x" * (n % 50)} for n in range(2000)]
+    write_jsonl(file_path, records)
+    assert list(iter_jsonl(file_path, workers=3, part_size=1000)) == records
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_malformed(tmp_path, workers):
+    """
+    Test that a malformed line raises JSONDecodeError naming its offset.
+    """
+    file_path = tmp_path / "data.jsonl"
+    file_path.write_text('{"id": 1}\n{"id": \n')
+    with pytest.raises(json.JSONDecodeError, match="line at byte 10"):
+        list(iter_jsonl(str(file_path), workers=workers, part_size=4))
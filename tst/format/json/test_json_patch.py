@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for JSON Patch Module
+===========================
+
+This test suite verifies `make_patch` and `apply_patch`, exposed as
+`JSONHandler.make_json_patch` and `apply_json_patch`.
+
+Tested Features:
+----------------
+- Minimal operations for object and array changes.
+- Escaping of "~" and "/" in keys.
+- Round-tripping patches without changing the original document.
+- The move, copy and test operations.
+- Reporting operations that cannot be applied.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import pytest
+
+from rite.format.json.json import JSONHandler
+from rite.format.json.json_patch import (
+    JSONPatchError,
+    apply_patch,
+    make_patch,
+    parse_pointer,
+)
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+
+def test_make_patch():
+    """
+    Test that changes yield one operation each.
+    """
+    source = {"a": 1, "b": {"c": [1, 2, 3]}, "d/e~": True, "f": None}
+    target = {"a": 1.0, "b": {"c": [0, 1, 2, 3]}, "d/e~": True, "g": "x"}
+    assert JSONHandler.make_json_patch(source, target) == [
+        {"op": "remove", "path": "/f"},
+        {"op": "replace", "path": "/a", "value": 1.0},
+        {"op": "add", "path": "/b/c/0", "value": 0},
+        {"op": "add", "path": "/g", "value": "x"},
+    ]
+    assert make_patch(source, source) == []
+    assert make_patch([1], {"x": 1}) == [
+        {"op": "replace", "path": "", "value": {"x": 1}}
+    ]
+    assert parse_pointer("/d~1e~0/0") == ("d/e~", "0")
+
+
+def test_make_patch_types():
+    """
+    Test that numbers of different types are told apart at every level.
+    """
+    assert make_patch([True], [1]) == [
+        {"op": "replace", "path": "/0", "value": 1}
+    ]
+    assert make_patch({"a": 1.0}, {"a": 1}) == [
+        {"op": "replace", "path": "/a", "value": 1}
+    ]
+    assert make_patch({"a": [{"b": 0}]}, {"a": [{"b": False}]}) == [
+        {"op": "replace", "path": "/a/0/b", "value": False}
+    ]
+    assert make_patch({"a": [1, "x"]}, {"a": [1, "x"]}) == []
+
+
+def test_round_trip():
+    """
+    Test arrays with insertions, removals and nested changes.
+    """
+    source = {
+        "items": [{"id": i, "tags": ["a"]} for i in range(10)],
+        "meta": {"n": 10},
+    }
+    target = {
+        "items": [{"id": i, "tags": ["a"]} for i in range(10) if i != 3],
+        "meta": {"n": 9},
+    }
+    target["items"].insert(6, {"id": 99})
+    target["items"][0]["tags"].append("b")
+    patch = make_patch(source, target)
+    assert len(patch) == 4
+    patched = JSONHandler.apply_json_patch(source, patch)
+    assert patched == target
+    assert source["meta"] == {"n": 10}
+    assert source["items"][0]["tags"] == ["a"]
+    assert patched["items"][1] is source["items"][1]
+    assert apply_patch(source, patch, in_place=True) is source
+    assert source == target
+
+
+def test_operations():
+    """
+    Test the move, copy and test operations, as in RFC 6902.
+    """
+    document = {"foo": {"bar": "baz", "waldo": "fred"}, "qux": [1, 2]}
+    patched = apply_patch(
+        document,
+        [
+            {"op": "test", "path": "/foo/bar", "value": "baz"},
+            {"op": "move", "from": "/foo/waldo", "path": "/qux/-"},
+            {"op": "copy", "from": "/foo", "path": "/copy"},
+            {"op": "remove", "path": "/qux/0"},
+        ],
+    )
+    assert patched == {
+        "foo": {"bar": "baz"},
+        "qux": [2, "fred"],
+        "copy": {"bar": "baz"},
+    }
+    assert document["foo"] == {"bar": "baz", "waldo": "fred"}
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        {"op": "test", "path": "/a", "value": "1"},
+        {"op": "remove", "path": "/missing"},
+        {"op": "replace", "path": "/b/5", "value": 0},
+        {"op": "add", "path": "/b/01", "value": 0},
+        {"op": "move", "from": "/b", "path": "/b/0"},
+        {"op": "add", "path": "a", "value": 0},
+        {"op": "invalid", "path": "/a"},
+        {"op": "add", "path": "/a"},
+    ],
+)
+def test_errors(operation):
+    """
+    Test that failing operations raise and leave the document unchanged.
+    """
+    document = {"a": 1, "b": [1, 2]}
+    with pytest.raises(JSONPatchError, match="Operation 1"):
+        apply_patch(document, [{"op": "remove", "path": "/a"}, operation])
+    assert document == {"a": 1, "b": [1, 2]}
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for JSON Path Module
+==========================
+
+This test suite verifies the compiled paths behind
+`JSONHandler.extract_from_path`, `path_exists` and `nested_update`, and
+batch extraction with `PathSet`.
+
+Tested Features:
+----------------
+- Object keys, list indexes and negative indexes.
+- Wildcards, matched in document order.
+- Existence of keys holding None.
+- Setting values, creating missing objects.
+- Extracting many paths in one traversal.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import pytest
+
+from rite.format.json.json import JSONHandler
+from rite.format.json.json_path import JSONPath, PathSet, compile_path
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DATA = {
+    "users": [
+        {"name": "Ann", "tags": ["a", "b"]},
+        {"name": "Bob", "tags": []},
+        {"name": None},
+    ],
+    "meta": {"count": 3},
+}
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+
+def test_get():
+    """
+    Test keys, indexes and missing paths.
+    """
+    assert JSONHandler.extract_from_path(DATA, "meta/count") == 3
+    assert JSONHandler.extract_from_path(DATA, "users/1/name") == "Bob"
+    assert JSONHandler.extract_from_path(DATA, "users/-1/name") is None
+    assert JSONHandler.extract_from_path(DATA, "users/0/tags/1") == "b"
+    assert JSONHandler.extract_from_path(DATA, "users/5/name") is None
+    assert JSONHandler.extract_from_path(DATA, "meta/count/x") is None
+    assert compile_path("users.0.name", sep=".").get(DATA) == "Ann"
+    assert JSONPath("missing").get(DATA, default=0) == 0
+
+
+def test_wildcard():
+    """
+    Test that wildcards return every match in document order.
+    """
+    assert JSONHandler.extract_from_path(DATA, "users/*/name") == [
+        "Ann",
+        "Bob",
+        None,
+    ]
+    assert JSONHandler.extract_from_path(DATA, "users/*/tags/*") == ["a", "b"]
+    assert JSONHandler.extract_from_path(DATA, "*/count") == [3]
+    assert JSONHandler.extract_from_path(DATA, "meta/*/x") == []
+    assert JSONPath("users/*/tags/0").get(DATA) == "a"
+
+
+def test_exists():
+    """
+    Test that keys holding None exist.
+    """
+    assert JSONHandler.path_exists(DATA, "users/2/name")
+    assert JSONHandler.path_exists(DATA, "users/*/tags/1")
+    assert not JSONHandler.path_exists(DATA, "users/2/tags")
+    assert not JSONHandler.path_exists(DATA, "users/*/missing")
+
+
+def test_set():
+    """
+    Test setting values in objects and lists.
+    """
+    data = {"a": [{"b": 1}]}
+    JSONHandler.nested_update(data, "a/0/b", 2)
+    JSONHandler.nested_update(data, "x/y/z", 3)
+    assert data == {"a": [{"b": 2}], "x": {"y": {"z": 3}}}
+    with pytest.raises(ValueError):
+        JSONHandler.nested_update(data, "a/*/b", 0)
+    with pytest.raises(TypeError):
+        JSONHandler.nested_update(data, "a/0/b/c", 0)
+    with pytest.raises(IndexError):
+        JSONHandler.nested_update(data, "a/3/b", 0)
+
+
+def test_path_set():
+    """
+    Test extracting many paths, sharing prefixes, in one traversal.
+    """
+    paths = ["users/0/name", "users/*/name", "meta/count", "meta/missing"]
+    expected = {
+        "users/0/name": "Ann",
+        "users/*/name": ["Ann", "Bob", None],
+        "meta/count": 3,
+        "meta/missing": None,
+    }
+    assert JSONHandler.extract_paths(DATA, paths) == expected
+    path_set = PathSet(paths)
+    assert path_set.extract(DATA) == expected
+    assert path_set.extract({}, default="-")["meta/count"] == "-"
+    for path in path_set.paths:
+        assert path.extract(DATA) == expected[path.path]
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for JSON Schema Module
+============================
+
+This test suite verifies `check_syntax` and the compiled
+`SchemaValidator`, behind `JSONHandler.validate_json` and
+`compile_json_schema`.
+
+Tested Features:
+----------------
+- Strict syntax checks, rejecting NaN and trailing data.
+- Types, including integers written as floats and booleans.
+- Number, string, array and object keywords.
+- Combinators and recursive references.
+- Error paths, and validating many records.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import pytest
+
+from rite.format.json.json import JSONHandler
+from rite.format.json.json_schema import (
+    SchemaValidator,
+    ValidationError,
+    check_syntax,
+)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+USER = {
+    "type": "object",
+    "required": ["id", "name"],
+    "properties": {
+        "id": {"type": "integer", "minimum": 1},
+        "name": {"type": "string", "minLength": 1, "pattern": "^[a-z]+$"},
+        "email": {"type": ["string", "null"]},
+        "tags": {
+            "type": "array",
+            "items": {"enum": ["admin", "user"]},
+            "uniqueItems": True,
+            "maxItems": 2,
+        },
+        "score": {"type": "number", "multipleOf": 0.1, "exclusiveMaximum": 1},
+    },
+    "patternProperties": {"^x-": {"type": "string"}},
+    "additionalProperties": False,
+}
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    "text, valid",
+    [
+        ('{"a": [1, 2.5, true, null, "x"]}', True),
+        (b'  [1, {"b": {}}]  ', True),
+        ('"caf\\u00e9"', True),
+        ("{", False),
+        ('{"a": 1} {}', False),
+        ("[NaN]", False),
+        ("[Infinity]", False),
+        (b"\xff", False),
+    ],
+)
+def test_syntax(text, valid):
+    """
+    Test that only single, strict JSON values are accepted, with or without
+    a schema.
+    """
+    assert check_syntax(text) is valid
+    assert JSONHandler.validate_json(text) is valid
+    assert JSONHandler.validate_json(text, {}) is valid
+
+
+def test_valid():
+    """
+    Test records matching the schema.
+    """
+    validator = JSONHandler.compile_json_schema(USER)
+    assert validator.is_valid({"id": 1, "name": "ann"})
+    assert validator.is_valid(
+        {
+            "id": 2.0,
+            "name": "bob",
+            "email": None,
+            "tags": ["admin", "user"],
+            "score": 0.3,
+            "x-team": "core",
+        }
+    )
+    assert JSONHandler.validate_json('{"id": 3, "name": "cy"}', USER)
+    assert not JSONHandler.validate_json('{"id": 3}', validator)
+    assert not JSONHandler.validate_json("{", validator)
+
+
+@pytest.mark.parametrize(
+    "record, path, message",
+    [
+        ([], "", "expected object"),
+        ({"id": 1}, "", "missing required property 'name'"),
+        ({"id": True, "name": "a"}, "/id", "expected integer"),
+        ({"id": 0, "name": "a"}, "/id", "expected a number >= 1"),
+        ({"id": 1, "name": "A"}, "/name", "expected a match of '^[a-z]+$'"),
+        ({"id": 1, "name": "a", "tags": ["x"]}, "/tags/0", "expected one of"),
+        ({"id": 1, "name": "a", "tags": ["user"] * 2}, "/tags", "unique"),
+        ({"id": 1, "name": "a", "score": 0.35}, "/score", "multiple of 0.1"),
+        ({"id": 1, "name": "a", "score": 1}, "/score", "< 1"),
+        ({"id": 1, "name": "a", "x-a": 1}, "/x-a", "expected string"),
+        ({"id": 1, "name": "a", "other/x": 1}, "/other~1x", "additional"),
+    ],
+)
+def test_errors(record, path, message):
+    """
+    Test that errors name the failing value and the reason.
+    """
+    validator = SchemaValidator(USER)
+    assert not validator.is_valid(record)
+    with pytest.raises(ValidationError) as info:
+        validator.validate(record)
+    assert info.value.path == path
+    assert message in info.value.message
+
+
+def test_combinators_and_refs():
+    """
+    Test anyOf, oneOf, not, prefixItems and recursive references.
+    """
+    schema = {
+        "$defs": {
+            "node": {
+                "type": "object",
+                "properties": {
+                    "value": {"anyOf": [{"type": "integer"}, {"const": "x"}]},
+                    "children": {
+                        "type": "array",
+                        "items": {"$ref": "#/$defs/node"},
+                    },
+                },
+            }
+        },
+        "type": "array",
+        "prefixItems": [{"$ref": "#/$defs/node"}, {"not": {"type": "null"}}],
+        "items": {"oneOf": [{"minimum": 0}, {"maximum": 10}]},
+    }
+    validator = SchemaValidator(schema)
+    tree = {"value": 1, "children": [{"value": "x", "children": []}]}
+    assert validator.is_valid([tree, 1, 20])
+    assert validator.error([tree, 1, 5]).path == "/2"
+    assert validator.error([tree, None]).path == "/1"
+    tree["children"][0]["value"] = "y"
+    assert validator.error([tree]).path == "/0/children/0/value"
+    assert SchemaValidator(True).is_valid(object())
+    assert not SchemaValidator(False).is_valid(None)
+    with pytest.raises(ValueError):
+        SchemaValidator({"$ref": "#/missing"})
+    with pytest.raises(ValueError):
+        SchemaValidator({"type": "date"})
+
+
+def test_iter_errors():
+    """
+    Test validating many records, reporting the invalid ones.
+    """
+    validator = SchemaValidator(USER)
+    records = [{"id": i, "name": "a" * (i % 3)} for i in range(1, 7)]
+    errors = list(validator.iter_errors(iter(records)))
+    assert [index for index, _ in errors] == [2, 5]
+    assert errors[0][1].path == "/name"
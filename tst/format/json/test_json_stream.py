@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for JSON Stream Module
+============================
+
+This test suite verifies the functionality of `iter_json`, the incremental
+JSON reader.
+
+Tested Features:
+----------------
+- Yielding the elements of a top-level array and of nested paths.
+- Skipping values outside the path, including strings with escapes.
+- Values split across chunk boundaries.
+- Files holding several top-level values, such as JSON Lines, in lines
+  mode.
+- Reporting malformed input.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import json
+
+import pytest
+
+from rite.format.json.json import JSONHandler
+from rite.format.json.json_stream import iter_json
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+DOCUMENT = {
+    "meta": {"note": 'skip "this" ] } [ {', "count": 12345678901234567890},
+    "items": [
+        {"id": 1, "tags": ["a", "b"], "price": 1.5e3},
+        {"id": 2, "tags": [], "text": "café \\ ☃"},
+        {"id": 3, "nested": {"deep": [None, True, False]}},
+    ],
+    "tail": -0.25,
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("items.*", DOCUMENT["items"]),
+        ("items.*.id", [1, 2, 3]),
+        ("items.1.tags", [[]]),
+        ("*.count", [DOCUMENT["meta"]["count"]]),
+        ("tail", [-0.25]),
+        ("", [DOCUMENT]),
+        ("missing.*", []),
+    ],
+)
+def test_paths(tmp_path, chunk_size, path, expected):
+    """
+    Test selecting values with paths and any chunk size.
+    """
+    file_path = tmp_path / "data.json"
+    file_path.write_text(json.dumps(DOCUMENT, indent=2), encoding="utf-8")
+    assert list(iter_json(str(file_path), path, chunk_size)) == expected
+
+
+def test_top_level_array(tmp_path):
+    """
+    Test the default path on a top-level array, through JSONHandler.
+    """
+    file_path = tmp_path / "data.json"
+    file_path.write_text('[1, 2.5, "x", null, [3], {}]')
+    assert list(JSONHandler.iter_json(str(file_path), chunk_size=2)) == [
+        1,
+        2.5,
+        "x",
+        None,
+        [3],
+        {},
+    ]
+    file_path.write_text(" [ ] ")
+    assert list(JSONHandler.iter_json(str(file_path))) == []
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"id": 1}\n{"id": 2}\n\n{"id": 3}\n', '{"id":1}{"id":2} {"id":3}'],
+)
+def test_json_lines(tmp_path, text):
+    """
+    Test reading several top-level values in lines mode.
+    """
+    file_path = tmp_path / "data.jsonl"
+    file_path.write_text(text)
+    records = [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert list(iter_json(str(file_path), chunk_size=4, lines=True)) == (
+        records
+    )
+    assert list(JSONHandler.iter_json(str(file_path), "", lines=True)) == (
+        records
+    )
+    assert list(iter_json(str(file_path), "*.id", 4, True)) == [1, 2, 3]
+    assert list(iter_json(str(file_path), "1", 4, True)) == [{"id": 2}]
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json(str(file_path)))
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["[1, 2", '{"a": 1 "b": 2}', "[1, ]", '{"a": "x', "[{]", "", "[] 1"],
+)
+def test_malformed(tmp_path, text):
+    """
+    Test that malformed documents raise JSONDecodeError.
+    """
+    file_path = tmp_path / "data.json"
+    file_path.write_text(text)
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json(str(file_path), "*.*", 2))
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for JSON Tree Module
+==========================
+
+This test suite verifies the iterative traversals behind
+`JSONHandler.flatten_json`, `deep_merge_json`, `find_in_json` and
+`diff_json`.
+
+Tested Features:
+----------------
+- Flattening objects, optionally with lists, in document order.
+- Deep merging nested objects in place.
+- Depth-first key search through objects and lists.
+- Shallow and deep comparison.
+- Documents nested deeper than the recursion limit.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import sys
+
+from rite.format.json.json import JSONHandler
+from rite.format.json.json_tree import iter_flatten
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _deep(depth: int, leaf):
+    """
+    Build an object nested `depth` levels deep.
+    """
+    data = leaf
+    for _ in range(depth):
+        data = {"k": data}
+    return data
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+
+def test_flatten():
+    """
+    Test flattening with and without lists.
+    """
+    data = {"a": {"b": 1, "c": [1, {"d": 2}]}, "e": {}, "f": None}
+    assert JSONHandler.flatten_json(data) == {
+        "a.b": 1,
+        "a.c": [1, {"d": 2}],
+        "f": None,
+    }
+    assert JSONHandler.flatten_json(data, sep="/", lists=True) == {
+        "a/b": 1,
+        "a/c/0": 1,
+        "a/c/1/d": 2,
+        "f": None,
+    }
+    assert list(iter_flatten({"x": {"y": 1}}, parent_key="root")) == [
+        ("root.x.y", 1)
+    ]
+
+
+def test_deep_merge():
+    """
+    Test that nested objects are merged and other values replaced.
+    """
+    first = {"person": {"name": "John", "age": 30}, "tags": [1]}
+    merged = JSONHandler.deep_merge_json(
+        first, {"person": {"age": 31, "city": "Oslo"}, "tags": [2]}
+    )
+    assert merged is first
+    assert merged == {
+        "person": {"name": "John", "age": 31, "city": "Oslo"},
+        "tags": [2],
+    }
+
+
+def test_find():
+    """
+    Test depth-first search order, lists and None values.
+    """
+    data = {"a": {"b": {"age": 1}}, "c": [{"age": 2}], "age": None}
+    assert JSONHandler.find_in_json(data, "age") is None
+    data = {"a": {"b": {"age": 1}}, "c": [{"age": 2}]}
+    assert JSONHandler.find_in_json(data, "age") == 1
+    assert JSONHandler.find_in_json({"c": [[{"age": 2}]]}, "age") == 2
+    assert JSONHandler.find_in_json({"a": 1}, "missing") is None
+
+
+def test_diff():
+    """
+    Test shallow and deep differences.
+    """
+    first = {"a": 1, "b": {"c": 1, "d": 2}, "same": {"x": 1}}
+    second = {"b": {"c": 2, "d": 2}, "e": 3, "same": {"x": 1}}
+    assert JSONHandler.diff_json(first, second) == {
+        "a": "Only in first: 1",
+        "b": "First: {'c': 1, 'd': 2}, Second: {'c': 2, 'd': 2}",
+        "e": "Only in second: 3",
+    }
+    assert JSONHandler.diff_json(first, second, deep=True) == {
+        "a": "Only in first: 1",
+        "b.c": "First: 1, Second: 2",
+        "e": "Only in second: 3",
+    }
+
+
+def test_beyond_recursion_limit():
+    """
+    Test documents nested deeper than the recursion limit.
+    """
+    depth = sys.getrecursionlimit() + 100
+    flat = JSONHandler.flatten_json(_deep(depth, 1))
+    assert flat == {".".join(["k"] * depth): 1}
+    assert JSONHandler.find_in_json(_deep(depth, {"x": 5}), "x") == 5
+    merged = JSONHandler.deep_merge_json(
+        _deep(depth, {}), _deep(depth, {"y": 1})
+    )
+    assert JSONHandler.find_in_json(merged, "y") == 1
+    diff = JSONHandler.diff_json(
+        _deep(depth, 1), _deep(depth, 2), deep=True, sep="/"
+    )
+    assert list(diff.values()) == ["First: 1, Second: 2"]
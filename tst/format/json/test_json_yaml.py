@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for JSON YAML Module
+==========================
+
+This test suite verifies the YAML conversions behind
+`JSONHandler.json_to_yaml`, `yaml_to_json`, `iter_yaml`, `read_yaml` and
+`write_yaml`.
+
+Tested Features:
+----------------
+- Output matching `yaml.dump`, and safe loading.
+- Streaming multi-document YAML from strings and files.
+- Writing generators of documents to files.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+- `yaml` for the reference conversions.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import pytest
+import yaml
+
+from rite.format.json.json import JSONHandler
+from rite.format.json.json_yaml import LIBYAML, Dumper, Loader
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DATA = {
+    "name": "John",
+    "tags": ["a", "b"],
+    "nested": {"empty": None, "flag": True, "ratio": 0.5},
+    "text": "multi\nline",
+}
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+
+def test_loader_and_dumper():
+    """
+    Test that the libyaml classes are used when PyYAML provides them.
+    """
+    assert LIBYAML == yaml.__with_libyaml__
+    assert issubclass(Loader, yaml.SafeLoader) != LIBYAML
+    assert Dumper.__name__.endswith("SafeDumper")
+
+
+def test_round_trip():
+    """
+    Test converting to YAML like `yaml.dump` and back.
+    """
+    text = JSONHandler.json_to_yaml(DATA)
+    assert text == yaml.dump(DATA)
+    assert JSONHandler.yaml_to_json(text) == DATA
+
+
+def test_safe_load():
+    """
+    Test that Python object tags are rejected.
+    """
+    with pytest.raises(yaml.YAMLError):
+        JSONHandler.yaml_to_json("!!python/object/apply:os.getcwd []")
+    with pytest.raises(yaml.representer.RepresenterError):
+        JSONHandler.json_to_yaml({"a": object()})
+
+
+def test_multiple_documents(tmp_path):
+    """
+    Test reading and writing multi-document streams.
+    """
+    documents = [{"id": i} for i in range(3)]
+    assert list(JSONHandler.iter_yaml("---\nid: 0\n---\nid: 1\n")) == [
+        {"id": 0},
+        {"id": 1},
+    ]
+    file_path = str(tmp_path / "data.yaml")
+    assert JSONHandler.write_yaml(file_path, iter(documents), True) == 3
+    stream = JSONHandler.read_yaml(file_path, multiple=True)
+    assert next(stream) == {"id": 0}
+    assert list(stream) == documents[1:]
+    with pytest.raises(yaml.YAMLError):
+        JSONHandler.read_yaml(file_path)
+    assert JSONHandler.write_yaml(file_path, DATA) == 1
+    assert JSONHandler.read_yaml(file_path) == DATA
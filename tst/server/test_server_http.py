@@ -0,0 +1,596 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for BaseHTTPServer Module
+===============================
+
+This test suite verifies the functionality of the `BaseHTTPServer` request
+handler and the servers created for it.
+
+Tested Features:
+----------------
+- GET and POST handling in every server mode.
+- Persistent HTTP/1.1 connections in the concurrent modes.
+- Rejecting unknown server modes.
+- Static and parameterized routes, and per-subclass route registries.
+- Streaming request and response bodies.
+- Static files with validators, byte ranges and path traversal checks.
+- Compression negotiation, response ETags and the response cache.
+- Sampled access log records and per-route latency metrics.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+- `http.client` and `threading` for running requests against a live server.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import gzip
+import http.client
+import logging
+import threading
+import time
+import zlib
+
+import pytest
+
+from rite.server.server_http import SERVER_MODES, BaseHTTPServer
+from rite.server.server_http_metrics import RouteMetrics, start_access_log
+from rite.server.server_http_middleware import (
+    ResponseCache,
+    negotiate_encoding,
+)
+from rite.server.server_http_router import Router
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture(params=SERVER_MODES)
+def server(request):
+    """
+    Provide a running server on a free port for each server mode.
+    """
+    httpd = BaseHTTPServer.create_server(port=0, mode=request.param)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def streaming(tmp_path):
+    """
+    Provide a running server with streaming and static file routes.
+    """
+
+    class Handler(BaseHTTPServer):
+        pass
+
+    @Handler.route("/echo", methods=("POST",))
+    def echo(self):
+        size = sum(len(chunk) for chunk in self.iter_body(chunk_size=7))
+        self._send_response(200, str(size), "text/plain")
+
+    @Handler.route("/ping", methods=("POST",))
+    def ping(self):
+        self._send_response(200, "pong", "text/plain")
+
+    @Handler.route("/count/{n}")
+    def count(self, n):
+        self._send_response(
+            200, (f"{i}," for i in range(int(n))), "text/plain"
+        )
+
+    (tmp_path / "files").mkdir()
+    (tmp_path / "files" / "data.txt").write_bytes(bytes(range(100)))
+    (tmp_path / "secret.txt").write_text("secret")
+    Handler.static("/static", str(tmp_path / "files"))
+
+    httpd = BaseHTTPServer.create_server(Handler, port=0, mode="threading")
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _connect(httpd) -> http.client.HTTPConnection:
+    """
+    Open a client connection to the given server.
+    """
+    return http.client.HTTPConnection(*httpd.server_address[:2], timeout=5)
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+
+def test_get_and_post(server):
+    """
+    Test the built-in GET and POST responses.
+    """
+    conn = _connect(server)
+    conn.request("GET", "/info?a=1")
+    response = conn.getresponse()
+    assert response.status == 200
+    assert response.read() == b"{'a': ['1']}"
+    conn.close()
+
+    conn = _connect(server)
+    conn.request("GET", "/missing")
+    response = conn.getresponse()
+    assert response.status == 404
+    response.read()
+    conn.close()
+
+    conn = _connect(server)
+    conn.request("POST", "/", body="a=1")
+    response = conn.getresponse()
+    assert response.status == 200
+    assert b"POST request received" in response.read()
+    conn.close()
+
+
+def test_keep_alive():
+    """
+    Test that the pool mode serves several requests on one connection.
+    """
+    httpd = BaseHTTPServer.create_server(port=0, mode="pool", workers=2)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    conn = _connect(httpd)
+    for _ in range(3):
+        conn.request("GET", "/")
+        response = conn.getresponse()
+        assert response.version == 11
+        assert not response.will_close
+        response.read()
+    conn.close()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_idle_keep_alive_releases_workers():
+    """
+    Test that idle keep-alive clients, as many as there are workers, do
+    not stall a new client in pool mode.
+    """
+    httpd = BaseHTTPServer.create_server(port=0, mode="pool", workers=2)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    idle = [_connect(httpd) for _ in range(httpd.workers)]
+    for conn in idle:
+        conn.request("GET", "/")
+        conn.getresponse().read()
+    started = time.monotonic()
+    conn = _connect(httpd)
+    conn.request("GET", "/")
+    assert conn.getresponse().status == 200
+    assert time.monotonic() - started < 1.0
+    for conn in idle + [conn]:
+        conn.close()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_unknown_mode():
+    """
+    Test that an unknown server mode is rejected.
+    """
+    with pytest.raises(ValueError, match="Unknown server mode"):
+        BaseHTTPServer.create_server(port=0, mode="forking")
+
+
+def test_router_matching():
+    """
+    Test static lookups, parameters and static-over-parameter precedence.
+    """
+    router = Router()
+    router.add("GET", "/users", "list")
+    router.add("GET", "/users/{user_id}", "show")
+    router.add("GET", "/users/me", "me")
+    router.add("GET", "/users/{user_id}/posts/{post_id}", "post")
+
+    assert router.match("GET", "/users") == ("list", {})
+    assert router.match("GET", "/users/me") == ("me", {})
+    assert router.match("GET", "/users/a%20b") == ("show", {"user_id": "a b"})
+    assert router.match("GET", "/users/1/posts/2") == (
+        "post",
+        {"user_id": "1", "post_id": "2"},
+    )
+    assert router.match("POST", "/users") is None
+    assert router.match("GET", "/users/1/posts") is None
+
+    with pytest.raises(ValueError, match="conflicts"):
+        router.add("GET", "/users/{name}", "other")
+
+
+def test_subclass_routes():
+    """
+    Test that routes registered on a subclass are served by it only.
+    """
+
+    class Handler(BaseHTTPServer):
+        pass
+
+    @Handler.route("/items/{item_id}")
+    def show_item(self, item_id):
+        self._send_response(200, f"{item_id}:{self.query}", "text/plain")
+
+    assert BaseHTTPServer.router.match("GET", "/items/1") is None
+
+    httpd = BaseHTTPServer.create_server(Handler, port=0, mode="threading")
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    conn = _connect(httpd)
+    conn.request("GET", "/items/7?x=1")
+    assert conn.getresponse().read() == b"7:{'x': ['1']}"
+    conn.request("GET", "/")
+    assert conn.getresponse().status == 200
+    conn.close()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_router_remainder():
+    """
+    Test that `{name:path}` matches the rest of the path at lowest
+    precedence.
+    """
+    router = Router()
+    router.add("GET", "/files/{name:path}", "file")
+    router.add("GET", "/files/{name}/meta", "meta")
+
+    assert router.match("GET", "/files/a/b%20c") == (
+        "file",
+        {"name": "a/b c"},
+    )
+    assert router.match("GET", "/files/a/meta") == ("meta", {"name": "a"})
+    assert router.match("GET", "/files") is None
+
+    with pytest.raises(ValueError, match="must be last"):
+        router.add("GET", "/{rest:path}/x", "bad")
+
+
+def test_streaming_bodies(streaming):
+    """
+    Test chunked request bodies and generator responses.
+    """
+    conn = _connect(streaming)
+    conn.request(
+        "POST",
+        "/echo",
+        body=(b"x" * 10 for _ in range(5)),
+        encode_chunked=True,
+    )
+    assert conn.getresponse().read() == b"50"
+
+    conn.request("GET", "/count/3")
+    response = conn.getresponse()
+    assert response.getheader("Transfer-Encoding") == "chunked"
+    assert response.read() == b"0,1,2,"
+
+    conn.request("GET", "/")
+    assert conn.getresponse().status == 200
+    conn.close()
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+def test_unread_body_is_drained(streaming, chunked):
+    """
+    Test that a request body the handler ignores is not parsed as the next
+    request on a keep-alive connection.
+    """
+    smuggled = b"GET /info?smuggled=1 HTTP/1.1\r\nHost: x\r\n\r\n"
+    conn = _connect(streaming)
+    if chunked:
+        conn.request("POST", "/ping", body=iter([smuggled]))
+    else:
+        conn.request("POST", "/ping", body=smuggled)
+    assert conn.getresponse().read() == b"pong"
+    conn.request("GET", "/info?a=1")
+    assert conn.getresponse().read() == b"{'a': ['1']}"
+    conn.close()
+
+
+@pytest.mark.parametrize("length", ["abc", "-1", "1e3", "\u0663"])
+def test_invalid_content_length(streaming, length):
+    """
+    Test that a request with an invalid Content-Length gets a 400 reply.
+    """
+    conn = _connect(streaming)
+    conn.putrequest("POST", "/ping")
+    conn.putheader("Content-Length", length.encode("utf-8"))
+    conn.endheaders()
+    response = conn.getresponse()
+    assert response.status == 400
+    response.read()
+    conn.close()
+
+
+def test_static_files(streaming):
+    """
+    Test static file responses, conditional and range requests.
+    """
+    conn = _connect(streaming)
+    conn.request("GET", "/static/data.txt")
+    response = conn.getresponse()
+    assert response.status == 200
+    assert response.read() == bytes(range(100))
+    assert response.getheader("Content-Type") == "text/plain"
+    etag = response.getheader("ETag")
+
+    conn.request("GET", "/static/data.txt", headers={"If-None-Match": etag})
+    response = conn.getresponse()
+    assert response.status == 304
+    response.read()
+
+    conn.request("GET", "/static/data.txt", headers={"Range": "bytes=-10"})
+    response = conn.getresponse()
+    assert response.status == 206
+    assert response.getheader("Content-Range") == "bytes 90-99/100"
+    assert response.read() == bytes(range(90, 100))
+
+    conn.request("GET", "/static/data.txt", headers={"Range": "bytes=100-"})
+    response = conn.getresponse()
+    assert response.status == 416
+    response.read()
+
+    conn.request("GET", "/static/data.txt", headers={"Range": "bytes=5-3"})
+    response = conn.getresponse()
+    assert response.status == 200
+    assert response.read() == bytes(range(100))
+
+    for path in ("/static/../secret.txt", "/static/%2E%2E/secret.txt"):
+        conn.request("GET", path)
+        response = conn.getresponse()
+        assert response.status == 404
+        response.read()
+    conn.close()
+
+
+def test_negotiate_encoding():
+    """
+    Test content encoding negotiation with quality values.
+    """
+    supported = ("gzip", "deflate")
+    assert negotiate_encoding("gzip, deflate", supported) == "gzip"
+    assert negotiate_encoding("deflate", supported) == "deflate"
+    assert negotiate_encoding("gzip;q=0.5, deflate", supported) == "deflate"
+    assert negotiate_encoding("gzip;q=0, *;q=0.1", supported) == "deflate"
+    assert negotiate_encoding("br", supported) is None
+    assert negotiate_encoding(None, supported) is None
+
+
+def test_response_cache_bounds():
+    """
+    Test that the response cache respects its entry and byte bounds.
+    """
+    cache = ResponseCache(max_entries=2, max_bytes=10)
+    cache.put("a", {}, b"12345")
+    cache.put("b", {}, b"12345")
+    cache.put("c", {}, b"1")
+    assert cache.get("a") is None
+    assert cache.get("c") == ({}, b"1")
+    cache.put("d", {}, b"x" * 11)
+    assert cache.get("d") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_compression_and_caching(tmp_path):
+    """
+    Test compressed responses, conditional requests and cached responses.
+    """
+    calls = []
+
+    class Handler(BaseHTTPServer):
+        response_cache = ResponseCache(ttl=60)
+
+    @Handler.route("/report")
+    def report(self):
+        calls.append(self.path)
+        self._send_response(200, "row\n" * 1000, "text/plain")
+
+    (tmp_path / "app.css").write_text("a {}")
+    (tmp_path / "app.css.gz").write_bytes(gzip.compress(b"a {}"))
+    Handler.static("/static", str(tmp_path))
+
+    httpd = BaseHTTPServer.create_server(Handler, port=0, mode="threading")
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    conn = _connect(httpd)
+
+    conn.request("GET", "/report", headers={"Accept-Encoding": "gzip"})
+    response = conn.getresponse()
+    assert response.getheader("Content-Encoding") == "gzip"
+    assert response.getheader("Vary") == "Accept-Encoding"
+    assert gzip.decompress(response.read()) == b"row\n" * 1000
+    etag = response.getheader("ETag")
+
+    conn.request(
+        "GET",
+        "/report",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+    )
+    response = conn.getresponse()
+    assert response.status == 304
+    assert response.read() == b""
+
+    conn.request("GET", "/report", headers={"Accept-Encoding": "deflate"})
+    response = conn.getresponse()
+    assert zlib.decompress(response.read()) == b"row\n" * 1000
+
+    conn.request("GET", "/report")
+    response = conn.getresponse()
+    assert response.getheader("Content-Encoding") is None
+    assert len(response.read()) == 4000
+    assert len(calls) == 3
+    assert Handler.response_cache.stats()["hits"] == 1
+
+    conn.request("GET", "/static/app.css", headers={"Accept-Encoding": "gzip"})
+    response = conn.getresponse()
+    assert response.getheader("Content-Encoding") == "gzip"
+    assert response.getheader("Content-Type") == "text/css"
+    assert gzip.decompress(response.read()) == b"a {}"
+
+    conn.request("GET", "/static/app.css")
+    assert conn.getresponse().read() == b"a {}"
+    conn.close()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_cache_key_not_reused_on_keep_alive():
+    """
+    Test that an authenticated response is not cached under the key of an
+    earlier anonymous request on the same connection.
+    """
+
+    class Handler(BaseHTTPServer):
+        response_cache = ResponseCache(ttl=60)
+
+    @Handler.route("/public")
+    def public(self):
+        user = self.headers.get("Authorization")
+        body = f"SECRET for {user}" if user else "public"
+        self._send_response(200, body, "text/plain")
+
+    httpd = BaseHTTPServer.create_server(Handler, port=0, mode="threading")
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    conn = _connect(httpd)
+    conn.request("GET", "/public")
+    assert conn.getresponse().read() == b"public"
+    conn.request("GET", "/public", headers={"Authorization": "Bearer alice"})
+    assert conn.getresponse().read() == b"SECRET for Bearer alice"
+    conn.close()
+
+    conn = _connect(httpd)
+    conn.request("GET", "/public")
+    assert conn.getresponse().read() == b"public"
+    conn.close()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_private_responses_not_cached():
+    """
+    Test that requests with cookies, private or varying responses and the
+    metrics are not served from the shared cache.
+    """
+
+    class Handler(BaseHTTPServer):
+        response_cache = ResponseCache(ttl=60)
+
+    @Handler.route("/user")
+    def user(self):
+        cookie = self.headers.get("Cookie")
+        self._send_response(200, f"user {cookie}", "text/plain")
+
+    @Handler.route("/private")
+    def private(self):
+        headers = {"Cache-Control": "private"}
+        self._send_response(200, self.path, "text/plain", headers=headers)
+
+    @Handler.route("/vary")
+    def vary(self):
+        headers = {"Vary": "Accept-Language"}
+        language = self.headers.get("Accept-Language")
+        self._send_response(200, f"{language}", "text/plain", headers=headers)
+
+    httpd = BaseHTTPServer.create_server(Handler, port=0, mode="threading")
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    conn = _connect(httpd)
+    requests = [
+        ("/user", {"Cookie": "id=alice"}, b"user id=alice"),
+        ("/user", {}, b"user None"),
+        ("/private", {}, b"/private"),
+        ("/vary", {"Accept-Language": "fr"}, b"fr"),
+        ("/vary", {"Accept-Language": "de"}, b"de"),
+    ]
+    for path, headers, body in requests:
+        conn.request("GET", path, headers=headers)
+        assert conn.getresponse().read() == body
+    for _ in range(2):
+        conn.request("GET", "/metrics")
+        response = conn.getresponse()
+        assert response.getheader("Cache-Control") == "no-store"
+        response.read()
+    assert Handler.response_cache.stats()["size"] == 1
+    assert Handler.response_cache.stats()["hits"] == 0
+    conn.close()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class _ListHandler(logging.Handler):
+    """
+    Collects the records it receives.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.mark.parametrize("sample_rate,logged", [(1.0, 4), (0.0, 0)])
+def test_access_log_and_metrics(sample_rate, logged):
+    """
+    Test sampled access log records and the metrics endpoint.
+    """
+
+    class Handler(BaseHTTPServer):
+        access_log_sample_rate = sample_rate
+        metrics = RouteMetrics()
+
+    @Handler.route("/items/{item_id}")
+    def show_item(self, item_id):
+        self._send_response(200, item_id, "text/plain")
+
+    collector = _ListHandler()
+    listener = start_access_log(collector)
+    httpd = BaseHTTPServer.create_server(Handler, port=0, mode="threading")
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    conn = _connect(httpd)
+    for path in ("/items/1", "/items/2", "/missing"):
+        conn.request("GET", path)
+        conn.getresponse().read()
+    conn.request("GET", "/metrics")
+    metrics = conn.getresponse().read().decode()
+    conn.close()
+    httpd.shutdown()
+    httpd.server_close()
+    listener.stop()
+
+    assert len(collector.records) == logged
+    if logged:
+        fields = collector.records[0].args
+        assert fields["route"] == "/items/{item_id}"
+        assert fields["status"] == 200
+        assert collector.records[0].getMessage().endswith("ms")
+    assert Handler.metrics.histogram("GET", "/items/{item_id}", 200).count == 2
+    assert (
+        'rite_http_request_duration_seconds_count{method="GET",'
+        'route="/items/{item_id}",status="2xx"} 2'
+    ) in metrics
+    assert 'route="<unmatched>",status="4xx"' in metrics
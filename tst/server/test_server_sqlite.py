@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for SQLiteServer Module
+=============================
+
+This test suite verifies the functionality of the `SQLiteServer` class and
+its connection pool.
+
+Tested Features:
+----------------
+- Basic CRUD operations with per-call connections.
+- Pooled connections are reused and bounded.
+- Pool timeouts when all connections are checked out.
+- Bulk inserts from generators of dictionaries and tuples.
+- Streaming iteration over query results and single-row fetches.
+- Pragma profiles applied to every connection.
+- Result caching with invalidation on writes, TTL and LRU eviction.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+- `threading` for concurrent access.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import sqlite3
+import threading
+
+import pytest
+
+from rite.server.server_sqlite import SQLiteServer
+from rite.server.server_sqlite_cache import (
+    MISS,
+    QueryCache,
+    read_tables,
+    tables_in,
+)
+from rite.server.server_sqlite_pool import SQLiteConnectionPool
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture(params=[0, 2], ids=["per-call", "pooled"])
+def server(request, tmp_path):
+    """
+    Provide a SQLiteServer with a `users` table, with and without a pool.
+    """
+    db = SQLiteServer(str(tmp_path / "test.db"), pool_size=request.param)
+    db.execute_query(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, age INTEGER)"
+    )
+    yield db
+    db.close()
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+
+def test_crud(server):
+    """
+    Test insert, update, fetch and delete.
+    """
+    server.insert("users", {"name": "Bob", "age": 25})
+    server.update("users", {"age": 26}, "name = 'Bob'")
+    assert server.fetch_all("SELECT name, age FROM users") == [("Bob", 26)]
+    server.delete("users", "name = 'Bob'")
+    assert server.fetch_all("SELECT * FROM users") == []
+
+
+def test_transaction_rollback(server):
+    """
+    Test that a failing transaction leaves no partial writes behind.
+    """
+    with pytest.raises(Exception):
+        server.transaction(
+            [
+                ("INSERT INTO users (name) VALUES (?)", ("Ann",)),
+                ("INSERT INTO missing (name) VALUES (?)", ("Ann",)),
+            ]
+        )
+    assert server.fetch_all("SELECT * FROM users") == []
+
+
+def test_insert_many_dicts(server):
+    """
+    Test bulk inserting dictionaries streamed from a generator.
+    """
+    rows = ({"name": f"user-{i}", "age": i} for i in range(25))
+    stats = server.insert_many("users", rows, chunk_size=10)
+    assert stats["rows"] == 25
+    assert server.fetch_one("SELECT COUNT(*), SUM(age) FROM users") == (
+        25,
+        300,
+    )
+
+
+def test_insert_many_tuples(server):
+    """
+    Test bulk inserting tuples with explicit and implicit columns.
+    """
+    server.insert_many("users", [("Ann", 30), ("Bob", 31)], ("name", "age"))
+    server.insert_many("users", iter([(10, "Cid", 32)]))
+    assert server.fetch_all("SELECT id, name FROM users ORDER BY age") == [
+        (1, "Ann"),
+        (2, "Bob"),
+        (10, "Cid"),
+    ]
+    assert server.insert_many("users", [])["rows"] == 0
+
+
+def test_iter_rows(server):
+    """
+    Test streaming rows in batches smaller than the result set.
+    """
+    server.insert_many(
+        "users", ((f"user-{i}", i) for i in range(7)), ("name", "age")
+    )
+    rows = server.iter_rows("SELECT age FROM users ORDER BY age", batch_size=3)
+    assert [age for (age,) in rows] == list(range(7))
+
+
+def test_iter_rows_releases_connection(tmp_path):
+    """
+    Test that closing a partially consumed iterator returns its connection.
+    """
+    db = SQLiteServer(str(tmp_path / "test.db"), pool_size=1)
+    db.execute_query("CREATE TABLE t (v INTEGER)")
+    db.insert_many("t", [(1,), (2,)])
+    rows = db.iter_rows("SELECT v FROM t", batch_size=1)
+    assert next(rows) == (1,)
+    rows.close()
+    assert db.fetch_one("SELECT COUNT(*) FROM t") == (2,)
+    db.close()
+
+
+def test_fetch_one(server):
+    """
+    Test fetching a single row, and None when there are no rows.
+    """
+    assert server.fetch_one("SELECT * FROM users") is None
+    server.insert("users", {"name": "Ann", "age": 30})
+    server.insert("users", {"name": "Bob", "age": 31})
+    assert server.fetch_one("SELECT name FROM users ORDER BY age") == ("Ann",)
+
+
+def test_pragma_profile(tmp_path):
+    """
+    Test that profile pragmas, and overrides, are applied to connections.
+    """
+    db = SQLiteServer(
+        str(tmp_path / "test.db"),
+        pool_size=1,
+        profile="read-mostly",
+        pragmas={"synchronous": "OFF"},
+    )
+    with db._connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert conn.execute("PRAGMA synchronous").fetchone() == (0,)
+        assert conn.execute("PRAGMA busy_timeout").fetchone() == (5000,)
+    db.close()
+
+
+def test_pragma_validation(tmp_path):
+    """
+    Test that unknown profiles and malformed pragmas are rejected.
+    """
+    with pytest.raises(ValueError, match="Unknown pragma profile"):
+        SQLiteServer(str(tmp_path / "test.db"), profile="turbo")
+    with pytest.raises(ValueError, match="Invalid pragma"):
+        SQLiteServer(
+            str(tmp_path / "test.db"), pragmas={"cache_size": "1; DROP"}
+        )
+
+
+def test_cache_invalidated_by_writes(tmp_path):
+    """
+    Test that cached results are served until a write touches their table.
+    """
+    db = SQLiteServer(str(tmp_path / "test.db"), cache_size=8)
+    db.execute_query("CREATE TABLE users (name TEXT)")
+    db.execute_query("CREATE TABLE other (v INTEGER)")
+    query = "SELECT name FROM users"
+
+    assert db.fetch_all(query) == []
+    assert db.fetch_all(query) == []
+    assert db.cache.stats()["hits"] == 1
+
+    db.insert("other", {"v": 1})
+    assert db.fetch_all(query) == []
+    assert db.cache.stats()["hits"] == 2
+
+    db.insert("users", {"name": "Ann"})
+    assert db.fetch_all(query) == [("Ann",)]
+    db.transaction([("UPDATE users SET name = ?", ("Bob",))])
+    assert db.fetch_all(query) == [("Bob",)]
+    db.execute_query("DELETE FROM users")
+    assert db.fetch_all(query) == []
+
+
+def test_cache_multiple_tables_and_views(tmp_path):
+    """
+    Test that writes to any table of a query drop its cached result, and
+    that queries over views or subqueries are not cached.
+    """
+    db = SQLiteServer(str(tmp_path / "test.db"), cache_size=8)
+    db.execute_query("CREATE TABLE a (id INTEGER)")
+    db.execute_query("CREATE TABLE b (id INTEGER, v TEXT)")
+    db.insert("a", {"id": 1})
+    db.insert("b", {"id": 1, "v": "old"})
+    query = "SELECT b.v FROM a, b WHERE a.id = b.id"
+    assert db.fetch_all(query) == [("old",)]
+    db.update("b", {"v": "new"}, "id = 1")
+    assert db.fetch_all(query) == [("new",)]
+
+    db.execute_query("CREATE VIEW bv AS SELECT v FROM b")
+    for query in ("SELECT v FROM bv", "SELECT v FROM (SELECT v FROM b)"):
+        db.update("b", {"v": "old"}, "id = 1")
+        assert db.fetch_all(query) == [("old",)]
+        db.update("b", {"v": "new"}, "id = 1")
+        assert db.fetch_all(query) == [("new",)]
+    assert db.cache.stats()["size"] == 0
+
+
+def test_read_tables():
+    """
+    Test table name extraction from every item of FROM clauses.
+    """
+    assert read_tables("SELECT * FROM a AS x, b y, c ORDER BY 1") == {
+        "a",
+        "b",
+        "c",
+    }
+    assert read_tables(
+        "SELECT 'FROM d' FROM a LEFT JOIN b ON (a.id = b.id) "
+        "JOIN c USING (id) WHERE a.id IN (SELECT id FROM e, f)"
+    ) == {"a", "b", "c", "e", "f"}
+    assert read_tables("SELECT 1") == set()
+    assert read_tables("SELECT * FROM (SELECT * FROM a)") is None
+    assert read_tables("SELECT * FROM json_each(?)") is None
+    assert read_tables("SELECT * FROM main.a") is None
+
+
+def test_cache_eviction_and_ttl():
+    """
+    Test LRU eviction, expiry and stale puts being discarded.
+    """
+    cache = QueryCache(max_size=2)
+    for n in range(3):
+        cache.put(f"SELECT {n} FROM t", (), (n,), cache.version())
+    assert cache.get("SELECT 0 FROM t") is MISS
+    assert cache.get("SELECT 2 FROM t") == (2,)
+    assert cache.stats()["evictions"] == 1
+
+    version = cache.version()
+    cache.invalidate(["t"])
+    cache.put("SELECT 3 FROM t", (), (3,), version)
+    assert cache.get("SELECT 3 FROM t") is MISS
+
+    expired = QueryCache(ttl=-1)
+    expired.put("SELECT 1", {"a": 1}, (1,), expired.version())
+    assert expired.get("SELECT 1", {"a": 1}) is MISS
+
+
+def test_tables_in():
+    """
+    Test table name extraction from SQL statements.
+    """
+    assert tables_in('SELECT * FROM a JOIN "B" ON a.id = B.id') == {
+        "a",
+        "b",
+    }
+    assert tables_in("INSERT INTO users (name) VALUES (?)") == {"users"}
+    assert tables_in("PRAGMA optimize") == set()
+
+
+def test_pool_reuses_connections(tmp_path):
+    """
+    Test that the pool hands out the same connection again once released.
+    """
+    db = SQLiteServer(str(tmp_path / "test.db"), pool_size=1)
+    with db._connection() as first:
+        pass
+    with db._connection() as second:
+        pass
+    assert first is second
+    db.close()
+
+
+def test_pool_threaded_access(tmp_path):
+    """
+    Test concurrent use of a pooled server from several threads.
+    """
+    db = SQLiteServer(str(tmp_path / "test.db"), pool_size=4)
+    db.execute_query("CREATE TABLE t (v INTEGER)")
+    db.insert("t", {"v": 1})
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(50):
+                assert db.fetch_one("SELECT v FROM t") == (1,)
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert db._pool._created <= 4
+    db.close()
+
+
+def test_pool_timeout(tmp_path):
+    """
+    Test that acquiring from an exhausted pool times out.
+    """
+    pool = SQLiteConnectionPool(
+        lambda: sqlite3.connect(str(tmp_path / "test.db")),
+        size=1,
+        timeout=0.01,
+    )
+    conn = pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+    pool.release(conn)
+    pool.close()
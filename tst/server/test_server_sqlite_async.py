@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Tests for AsyncSQLiteServer Module
+==================================
+
+This test suite verifies the functionality of the `AsyncSQLiteServer` class,
+an asyncio front-end dispatching queries to a worker thread.
+
+Tested Features:
+----------------
+- CRUD operations awaited from the event loop.
+- Concurrent writes batched without losing or mixing up failures.
+- Atomic transactions.
+- Cached reads invalidated by batched writes.
+- Rejecting requests after closing.
+
+Dependencies:
+-------------
+- `pytest` for writing and executing tests.
+- `asyncio` for running the coroutines.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from rite.server.server_sqlite_async import AsyncSQLiteServer
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+async def _open(path) -> AsyncSQLiteServer:
+    """
+    Open a server with a `users` table.
+    """
+    db = AsyncSQLiteServer(str(path / "test.db"))
+    await db.execute_query(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, age INTEGER)"
+    )
+    return db
+
+
+# =============================================================================
+# Test Cases
+# =============================================================================
+
+
+def test_crud(tmp_path):
+    """
+    Test insert, update, fetch and delete.
+    """
+
+    async def scenario():
+        async with await _open(tmp_path) as db:
+            await db.insert("users", {"name": "Bob", "age": 25})
+            await db.update("users", {"age": 26}, "name = 'Bob'")
+            assert await db.fetch_all("SELECT name, age FROM users") == [
+                ("Bob", 26)
+            ]
+            assert await db.fetch_one("SELECT age FROM users") == (26,)
+            await db.delete("users", "name = 'Bob'")
+            assert await db.fetch_one("SELECT * FROM users") is None
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_writes(tmp_path):
+    """
+    Test that concurrent writes all land and a failing write only fails
+    itself.
+    """
+
+    async def scenario():
+        async with await _open(tmp_path) as db:
+            writes = [
+                db.insert("users", {"name": f"user-{i}", "age": i})
+                for i in range(50)
+            ]
+            writes.append(db.insert("users", {"missing": 1}))
+            results = await asyncio.gather(*writes, return_exceptions=True)
+            assert all(result is None for result in results[:-1])
+            assert isinstance(results[-1], sqlite3.Error)
+            assert await db.fetch_one("SELECT COUNT(*) FROM users") == (50,)
+
+    asyncio.run(scenario())
+
+
+def test_transaction_rollback(tmp_path):
+    """
+    Test that a failing transaction leaves no partial writes behind.
+    """
+
+    async def scenario():
+        async with await _open(tmp_path) as db:
+            with pytest.raises(sqlite3.Error):
+                await db.transaction(
+                    [
+                        ("INSERT INTO users (name) VALUES (?)", ("Ann",)),
+                        ("INSERT INTO missing (name) VALUES (?)", ("Ann",)),
+                    ]
+                )
+            assert await db.fetch_all("SELECT * FROM users") == []
+
+    asyncio.run(scenario())
+
+
+def test_cache(tmp_path):
+    """
+    Test that cached reads are invalidated by writes from the worker.
+    """
+
+    async def scenario():
+        db = AsyncSQLiteServer(str(tmp_path / "test.db"), cache_size=4)
+        async with db:
+            await db.execute_query("CREATE TABLE users (name TEXT)")
+            assert await db.fetch_all("SELECT name FROM users") == []
+            assert await db.fetch_all("SELECT name FROM users") == []
+            await db.insert("users", {"name": "Ann"})
+            assert await db.fetch_all("SELECT name FROM users") == [("Ann",)]
+            assert db._server.cache.stats()["hits"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_closed(tmp_path):
+    """
+    Test that requests are rejected once the server is closed.
+    """
+
+    async def scenario():
+        db = await _open(tmp_path)
+        await db.close()
+        with pytest.raises(RuntimeError):
+            await db.fetch_all("SELECT * FROM users")
+
+    asyncio.run(scenario())
+
+
+def test_non_sqlite_errors(tmp_path):
+    """
+    Test that errors other than sqlite3.Error fail only their request and
+    leave the worker running.
+    """
+
+    async def scenario():
+        async with await _open(tmp_path) as db:
+            with pytest.raises(OverflowError):
+                await db.fetch_all("SELECT ?", (2**70,))
+            with pytest.raises(OverflowError):
+                await db.transaction(
+                    [
+                        ("INSERT INTO users (name) VALUES (?)", ("Ann",)),
+                        ("INSERT INTO users (age) VALUES (?)", (2**70,)),
+                    ]
+                )
+            await db.insert("users", {"name": "Bob"})
+            rows = await asyncio.wait_for(
+                db.fetch_all("SELECT name FROM users"), 5
+            )
+            assert rows == [("Bob",)]
+
+    asyncio.run(scenario())